@@ -0,0 +1,177 @@
+"""Benchmarks of the hot paths of computations in dependent rings.
+
+Every benchmark runs in an asymptotic ring with the dependent variable
+``k`` (bounded by ``n^(1/2)``) as well as in a plain ``AsymptoticRing``
+over the symbolic ring. In the plain ring, ``k`` is replaced by the
+constant ``2``, so that the difference of the timings shows the
+overhead of tracking the dependent variable.
+"""
+
+import itertools
+from typing import ClassVar
+
+# asv runs the benchmarks outside of a Sage session; the symbolic
+# functions have to be set up before the symbolic ring is used
+import sage.functions.all  # noqa: F401
+from sage.misc.misc_c import prod
+from sage.rings.asymptotic.asymptotic_ring import AsymptoticRing
+from sage.rings.big_oh import O
+from sage.rings.integer_ring import ZZ
+from sage.rings.rational_field import QQ
+from sage.symbolic.ring import SR
+
+import dependent_bterms as dbt
+
+RINGS = ["dependent", "plain"]
+
+
+def _ring(ring, default_prec=20, variable="n", dependent_variable="k"):
+    """Return the asymptotic ring of the given kind, together with its
+    generator and the (possibly replaced) dependent variable.
+    """
+    if ring == "dependent":
+        return dbt.AsymptoticRingWithDependentVariable(
+            f"{variable}^QQ",
+            dependent_variable,
+            0,
+            QQ((1, 2)),
+            default_prec=default_prec,
+        )
+    A = AsymptoticRing(f"{variable}^QQ", SR, default_prec=default_prec)
+    return A, A.gen(), SR(2)
+
+
+class RingConstruction:
+    params: ClassVar[list] = [RINGS]
+    param_names: ClassVar[list[str]] = ["ring"]
+
+    def setup(self, ring):
+        # rings are unique, fresh variable names avoid measuring cache lookups
+        self.names = itertools.count()
+
+    def time_construction(self, ring):
+        index = next(self.names)
+        _ring(ring, variable=f"n{index}", dependent_variable=f"k{index}")
+
+
+class Product:
+    params: ClassVar[list] = [RINGS, [5, 10, 20]]
+    param_names: ClassVar[list[str]] = ["ring", "default_prec"]
+
+    def setup(self, ring, default_prec):
+        self.A, self.n, self.k = _ring(ring, default_prec=default_prec)
+
+    def time_product(self, ring, default_prec):
+        n, k = self.n, self.k
+        prod(
+            1 + k**j / n**j + O(n ** (-default_prec))
+            for j in range(1, default_prec + 1)
+        )
+
+
+class ExpansionProduct:
+    params: ClassVar[list] = [RINGS, [10, 20, 30]]
+    param_names: ClassVar[list[str]] = ["ring", "factors"]
+
+    def setup(self, ring, factors):
+        _, n, k = _ring(ring)
+        self.factors = [1 + k**j / n**j for j in range(1, factors + 1)]
+        self.factors.append(1 + O(n ** (-factors)))
+
+    def time_prod(self, ring, factors):
+        prod(self.factors)
+
+    def time_expansion_product(self, ring, factors):
+        dbt.expansion_product(self.factors)
+
+
+class ExpansionFromTerms:
+    params: ClassVar[list] = [RINGS, [50, 100, 200, 400]]
+    param_names: ClassVar[list[str]] = ["ring", "terms"]
+
+    def setup(self, ring, terms):
+        A, n, k = _ring(ring)
+        self.A = A
+        # three summands per growth, which are merged into one
+        self.terms = [
+            summand
+            for j in range(terms // 3)
+            for summand in (k**2 / n**j, k / n**j, 1 / n**j)
+        ]
+
+    def time_expansion_from_terms(self, ring, terms):
+        dbt.expansion_from_terms(self.A, self.terms)
+
+
+class TaylorWithExplicitError:
+    params: ClassVar[list] = [RINGS, [3, 5, 10, 20]]
+    param_names: ClassVar[list[str]] = ["ring", "order"]
+
+    def setup(self, ring, order):
+        self.A, n, k = _ring(ring)
+        self.term = k / n
+
+    def time_taylor_with_explicit_error(self, ring, order):
+        dbt.taylor_with_explicit_error(
+            lambda t: 1 / (1 - t), self.term, order=order, valid_from=ZZ(10)
+        )
+
+
+def _bterm_expansion(A, n, k):
+    return (
+        (k + 1) ** 5 * n
+        + sum(k**j / n**j for j in range(1, 6))
+        + A.B((k + 1) ** 3 / n**6, valid_from=ZZ(10))
+        + A.B(k / n**7, valid_from=ZZ(20))
+    )
+
+
+class SimplifyExpansion:
+    params: ClassVar[list] = [RINGS, [False, True]]
+    param_names: ClassVar[list[str]] = ["ring", "simplify_bterm_growth"]
+
+    def setup(self, ring, simplify_bterm_growth):
+        if ring == "plain" and simplify_bterm_growth:
+            raise NotImplementedError("B-terms in plain rings have no dependent growth")
+        self.A, n, k = _ring(ring)
+        self.expansion = _bterm_expansion(self.A, n, k)
+
+    def time_simplify_expansion(self, ring, simplify_bterm_growth):
+        if ring == "plain":
+            # plain rings have no dependent coefficients to distribute,
+            # simplifying amounts to rebuilding the expansion
+            dbt.expansion_from_terms(self.A, list(self.expansion.summands))
+        else:
+            dbt.simplify_expansion(
+                self.expansion, simplify_bterm_growth=simplify_bterm_growth
+            )
+
+
+class RoundBTermCoefficients:
+    params: ClassVar[list] = [RINGS]
+    param_names: ClassVar[list[str]] = ["ring"]
+
+    def setup(self, ring):
+        _, n, k = _ring(ring)
+        self.expansion = dbt.taylor_with_explicit_error(
+            lambda t: 1 / (1 - t),
+            k / n,
+            order=5,
+            round_constant=False,
+            valid_from=ZZ(10),
+        )
+
+    def time_round_bterm_coefficients(self, ring):
+        dbt.round_bterm_coefficients(self.expansion, floating_point_digits=2)
+
+
+class ExpansionUpperBound:
+    params: ClassVar[list] = [RINGS]
+    param_names: ClassVar[list[str]] = ["ring"]
+
+    def setup(self, ring):
+        A, n, k = _ring(ring)
+        self.expansion = _bterm_expansion(A, n, k) / n**4
+
+    def time_expansion_upper_bound_numeric(self, ring):
+        dbt.expansion_upper_bound(self.expansion, numeric=True)
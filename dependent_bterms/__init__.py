@@ -1,9 +1,15 @@
 """Extension of SageMath's asymptotic ring that allows handling
 monomially bounded auxiliary variables.
 
-Everything in the ``utils`` module, as well as the
-``AsymptoticRingWithDependentVariable`` convenience function are
-being made available as top-level imports.
+Everything in the ``utils``, ``fast_evaluation``, ``parallel``,
+``disk_cache``, ``serialization``, ``evaluation``, ``validation``,
+``codegen``, ``server`` and ``instrumentation`` modules, as well as the ``AsymptoticRingWithDependentVariable``
+convenience function are being made available as top-level imports.
+
+These members are imported lazily: ``import dependent_bterms`` does not
+import any part of Sage, the module providing a member (together with
+the parts of Sage it requires) is only imported when the member is
+accessed for the first time.
 
 TESTS::
 
@@ -16,7 +22,109 @@ TESTS::
     ...
     B(abs(k)*n, n >= 0)
 
+All members listed by the modules are available::
+
+    sage: import importlib
+    sage: all(
+    ....:     getattr(importlib.import_module(f'dependent_bterms.{module}'), name)
+    ....:     is getattr(dbt, name)
+    ....:     for module in set(dbt._LAZY_MEMBERS.values())
+    ....:     for name in importlib.import_module(f'dependent_bterms.{module}').__all__)
+    True
+    sage: sorted(dbt.__all__) == sorted(dbt._LAZY_MEMBERS)
+    True
+    sage: dbt.structures
+    <module 'dependent_bterms.structures' from '...'>
+    sage: dbt.does_not_exist
+    Traceback (most recent call last):
+    ...
+    AttributeError: module 'dependent_bterms' has no attribute 'does_not_exist'
+
+Importing the package (and using :func:`.evaluate`) stays within the
+import-time budget and does not load the asymptotic ring::
+
+    sage: import subprocess, sys
+    sage: code = '''
+    ....: import sys, time
+    ....: start = time.perf_counter()
+    ....: import dependent_bterms
+    ....: elapsed = time.perf_counter() - start
+    ....: print(elapsed < 0.1, any(m.startswith('sage.') for m in sys.modules))
+    ....: dependent_bterms.evaluate
+    ....: print(any(m.startswith('sage.rings.asymptotic') for m in sys.modules))
+    ....: '''
+    sage: print(subprocess.run([sys.executable, '-c', code],
+    ....:                      capture_output=True, text=True).stdout)
+    True False
+    False
+    <BLANKLINE>
+
 """
 
-from .dependent_variable_ring import AsymptoticRingWithDependentVariable
-from .utils import *
+import importlib
+
+# maps the top-level members to the modules providing them
+_LAZY_MEMBERS = {
+    "AsymptoticRingWithDependentVariable": "dependent_variable_ring",
+    "evaluate": "fast_evaluation",
+    "expansion_from_terms": "utils",
+    "expansion_product": "utils",
+    "simplify_expansion": "utils",
+    "round_bterm_coefficients": "utils",
+    "set_bterm_valid_from": "utils",
+    "expansion_upper_bound": "utils",
+    "taylor_with_explicit_error": "utils",
+    "taylor_expansions_with_explicit_error": "utils",
+    "taylor_with_explicit_error_for_functions": "utils",
+    "taylor_with_explicit_error_batch": "parallel",
+    "iter_taylor_with_explicit_error": "parallel",
+    "enable_disk_cache": "disk_cache",
+    "disable_disk_cache": "disk_cache",
+    "serialize_expansion": "serialization",
+    "deserialize_expansion": "serialization",
+    "upper_bound_evaluator": "evaluation",
+    "certified_bound_evaluator": "evaluation",
+    "validate_taylor_bound": "validation",
+    "expansion_to_python": "codegen",
+    "expansion_to_callable": "codegen",
+    "ExpansionServer": "server",
+    "enable_instrumentation": "instrumentation",
+    "disable_instrumentation": "instrumentation",
+    "instrument": "instrumentation",
+}
+
+_SUBMODULES = {
+    "caching",
+    "codegen",
+    "dependent_variable_ring",
+    "disk_cache",
+    "evaluation",
+    "fast_evaluation",
+    "instrumentation",
+    "parallel",
+    "serialization",
+    "server",
+    "structures",
+    "taylor_functions",
+    "utils",
+    "validation",
+}
+
+__all__ = list(_LAZY_MEMBERS)
+
+
+def __getattr__(name):
+    if name in _LAZY_MEMBERS:
+        module = importlib.import_module(f".{_LAZY_MEMBERS[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
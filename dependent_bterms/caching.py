@@ -0,0 +1,92 @@
+"""Bounded caches used throughout the package.
+
+TESTS::
+
+    sage: from dependent_bterms.caching import LRUCache
+    sage: LRUCache(maxsize=10).info()
+    {'currsize': 0, 'hits': 0, 'maxsize': 10, 'misses': 0}
+
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from . import instrumentation
+
+
+class LRUCache:
+    """Bounded least-recently-used cache with hit and miss statistics.
+
+    INPUT:
+
+    - ``maxsize`` -- a positive integer, the maximal number of
+      stored entries. The least recently used entry is evicted first.
+
+    - ``name`` -- a string or ``None`` (the default). If given, the
+      lookups are recorded under this name while instrumentation
+      is enabled, see :func:`.enable_instrumentation`.
+
+    TESTS::
+
+        sage: from dependent_bterms.caching import LRUCache
+        sage: cache = LRUCache(maxsize=2)
+        sage: cache.lookup('a', lambda: 1), cache.lookup('a', lambda: 2)
+        (1, 1)
+        sage: cache.lookup('b', lambda: 3), cache.lookup('c', lambda: 4)
+        (3, 4)
+        sage: cache.info()
+        {'currsize': 2, 'hits': 1, 'maxsize': 2, 'misses': 3}
+        sage: cache.lookup('a', lambda: 5)
+        5
+        sage: cache.clear()
+        sage: cache.info()
+        {'currsize': 0, 'hits': 0, 'maxsize': 2, 'misses': 0}
+    """
+
+    def __init__(self, maxsize=4096, name=None):
+        self.maxsize = maxsize
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, key, compute):
+        """Return the entry stored for ``key``; on a miss, the
+        value is determined by calling ``compute()`` and stored.
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            if self.name is not None and instrumentation._INSTRUMENTATION is not None:
+                instrumentation._INSTRUMENTATION.record_cache(self.name, hit=False)
+            value = compute()
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+
+        self.hits += 1
+        if self.name is not None and instrumentation._INSTRUMENTATION is not None:
+            instrumentation._INSTRUMENTATION.record_cache(self.name, hit=True)
+        self._entries.move_to_end(key)
+        return value
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """Return the cache statistics as a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self.maxsize,
+            "currsize": len(self._entries),
+        }
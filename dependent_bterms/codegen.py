@@ -0,0 +1,243 @@
+"""Export of expansions as standalone Python code.
+
+The functions in this module translate an expansion into the source
+code of a Python module defining a single function, which evaluates the
+exact part of the expansion together with the bound given by its
+B-terms. The generated code only depends on the Python standard library
+(or on NumPy), so that bounds can be evaluated without importing Sage.
+
+TESTS::
+
+    sage: import dependent_bterms as dbt
+    sage: AR, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+    sage: AR.B(k*n)
+    doctest:warning
+    ...
+    FutureWarning: ...
+    ...
+    B(abs(k)*n, n >= 0)
+
+"""
+
+from __future__ import annotations
+
+from sage.rings.asymptotic.asymptotic_ring import AsymptoticExpansion
+from sage.rings.rational_field import QQ
+from sage.symbolic.ring import SR
+
+from .evaluation import (
+    _NUMPY_FUNCTIONS,
+    _exact_and_error_parts,
+    _lowest_valid_point,
+    _python_source,
+    _symbolic_expression,
+)
+
+__all__ = [
+    "expansion_to_callable",
+    "expansion_to_python",
+]
+
+
+_MATH_FUNCTIONS = {
+    "exp": "math.exp",
+    "log": "math.log",
+    "sqrt": "math.sqrt",
+    "sin": "math.sin",
+    "cos": "math.cos",
+    "tan": "math.tan",
+    "arcsin": "math.asin",
+    "arccos": "math.acos",
+    "arctan": "math.atan",
+    "sinh": "math.sinh",
+    "cosh": "math.cosh",
+    "tanh": "math.tanh",
+    "abs": "abs",
+}
+
+
+def _float_constant(constant):
+    return repr(float(constant))
+
+
+def _fraction_constant(constant):
+    if constant in QQ:
+        constant = QQ(constant)
+        return f"Fraction({constant.numerator()}, {constant.denominator()})"
+    return _float_constant(constant)
+
+
+# import statement, conversion of the arguments, constants, functions
+_BACKENDS = {
+    "float": ("import math", "float({})", _float_constant, _MATH_FUNCTIONS),
+    # Fraction cannot handle Sage numbers directly (their numerator
+    # is a method), but it parses their string representation
+    "fraction": (
+        "import math\nfrom fractions import Fraction",
+        "Fraction(str({}))",
+        _fraction_constant,
+        _MATH_FUNCTIONS,
+    ),
+    "numpy": (
+        "import numpy as np",
+        "np.asarray({}, dtype=float)",
+        _float_constant,
+        _NUMPY_FUNCTIONS,
+    ),
+}
+
+
+def expansion_to_python(
+    expansion: AsymptoticExpansion, backend: str = "float", name: str = "expansion"
+) -> str:
+    r"""Return the source code of a Python module evaluating the
+    given expansion.
+
+    The module defines a function with the variable of the asymptotic
+    ring and the dependent variable (if there is one) as arguments.
+    It returns a pair consisting of the value of the exact part of the
+    expansion and the value of the bound given by its B-terms, and
+    raises a ``ValueError`` for values of the variable for which the
+    B-terms are not valid.
+
+    INPUT:
+
+    - ``expansion`` -- an asymptotic expansion without O-terms in a ring
+      with monomial growth in one variable.
+
+    - ``backend`` -- ``'float'`` (the default) to compute with floats,
+      ``'fraction'`` to compute with :class:`fractions.Fraction` (results
+      are exact as long as all exponents are integers), or ``'numpy'``
+      to compute with NumPy arrays.
+
+    - ``name`` -- the name of the generated function.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: asy = 1 + k/n + A.B(k^2/n^2, valid_from=10)
+        sage: print(dbt.expansion_to_python(asy))
+        # Evaluation of 1 + k*n^(-1) + B(...).
+        # Generated by dependent_bterms.
+        <BLANKLINE>
+        import math
+        <BLANKLINE>
+        VALID_FROM = 10
+        <BLANKLINE>
+        <BLANKLINE>
+        def expansion(n, k):
+            n = float(n)
+            k = float(k)
+            if n < VALID_FROM:
+                raise ValueError("The expansion is only valid for n >= 10.")
+            exact = ...
+            error = ...
+            return exact, error
+        <BLANKLINE>
+
+    TESTS::
+
+        sage: dbt.expansion_to_python(asy, backend='decimal')
+        Traceback (most recent call last):
+        ...
+        ValueError: Unknown backend 'decimal'.
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}.")
+    imports, convert, constant, functions = _BACKENDS[backend]
+
+    A = expansion.parent()
+    (variable,) = A.variable_names()
+    n = SR.var(variable)
+    ETM = A.term_monoid("exact")
+    if hasattr(ETM, "variable_bounds"):
+        dependent_variable = ETM.variable_bounds[0]
+        k = SR.var(str(dependent_variable))
+        arguments = [variable, str(dependent_variable)]
+    else:
+        dependent_variable, k = None, None
+        arguments = [variable]
+    names = {argument: argument for argument in arguments}
+
+    exact, error = (
+        _python_source(
+            _symbolic_expression(part, n, dependent_variable, k),
+            names,
+            constant=constant,
+            functions=functions,
+        )
+        for part in _exact_and_error_parts(expansion)
+    )
+
+    lines = [
+        f"# Evaluation of {expansion}.",
+        "# Generated by dependent_bterms.",
+        "",
+        imports,
+        "",
+    ]
+    body = [f"    {argument} = {convert.format(argument)}" for argument in arguments]
+    if expansion.error_part().summands:
+        lowest = _lowest_valid_point(expansion, variable, None)
+        lines.append(f"VALID_FROM = {lowest}")
+        lines.append("")
+        condition = f"{variable} < VALID_FROM"
+        if backend == "numpy":
+            condition = f"np.any({condition})"
+        body.extend(
+            [
+                f"    if {condition}:",
+                f'        raise ValueError("The expansion is only valid for {variable} >= {lowest}.")',
+            ]
+        )
+    body.extend(
+        [
+            f"    exact = {exact}",
+            f"    error = {error}",
+            "    return exact, error",
+        ]
+    )
+    lines.extend(["", f"def {name}({', '.join(arguments)}):", *body, ""])
+    return "\n".join(lines)
+
+
+def expansion_to_callable(expansion: AsymptoticExpansion, backend: str = "float"):
+    r"""Return a function evaluating the given expansion which does
+    not depend on Sage.
+
+    The function is compiled from the output of :func:`expansion_to_python`,
+    see there for a description of the input and of the function.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: asy = dbt.taylor_with_explicit_error(exp, k/n, order=3, valid_from=10)
+        sage: dbt.expansion_to_callable(asy, backend='fraction')(100, 5)
+        (Fraction(841, 800), Fraction(1, 8000))
+        sage: exact, error = dbt.expansion_to_callable(asy)(100, 5)
+        sage: type(exact), abs(exact - 841/800) < 1e-12, abs(error - 1/8000) < 1e-12
+        (<class 'float'>, True, True)
+
+        sage: import numpy as np
+        sage: exact, error = dbt.expansion_to_callable(asy, backend='numpy')(
+        ....:     np.array([10, 100]), np.array([1, 10]))
+        sage: np.allclose(error, np.array([1/1000, 1/1000], dtype=float))
+        True
+
+    TESTS::
+
+        sage: dbt.expansion_to_callable(asy)(5, 1)
+        Traceback (most recent call last):
+        ...
+        ValueError: The expansion is only valid for n >= 10.
+        sage: dbt.expansion_to_callable(n^(1/2) + O(n^0))
+        Traceback (most recent call last):
+        ...
+        ValueError: Cannot bound n^(1/2) + O(1) explicitly, it contains O-terms.
+    """
+    namespace = {}
+    # the source is generated from the expansion, not taken from user input
+    exec(expansion_to_python(expansion, backend=backend), namespace)  # noqa: S102
+    return namespace["expansion"]
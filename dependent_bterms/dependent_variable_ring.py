@@ -18,26 +18,36 @@ TESTS::
 
 from __future__ import annotations
 
-from sage.symbolic.ring import SR
-
-from sage.rings.asymptotic.asymptotic_ring import AsymptoticRing, AsymptoticExpansion
-from sage.rings.asymptotic.term_monoid import TermMonoidFactory
+from sage.rings.asymptotic.asymptotic_ring import AsymptoticRing
+from sage.rings.polynomial.laurent_polynomial_ring import LaurentPolynomialRing
+from sage.rings.rational_field import QQ
 from sage.symbolic.expression import Expression
+from sage.symbolic.ring import SR
 
+from .caching import LRUCache
 from .structures import (
-    MonBoundExactTermMonoidFactory,
-    MonBoundOTermMonoidFactory,
-    MonBoundBTermMonoidFactory,
     AsymptoticRingWithCustomPosetKey,
+    DependentTermMonoidFactory,
 )
 
+__all__ = [
+    "AsymptoticRingWithDependentVariable",
+]
+
+
+# recently constructed rings, to return identical rings for identical calls
+_DEPENDENT_RINGS = LRUCache(maxsize=128)
+
 
 def _add_monomial_growth_restriction_to_ring(
     AR: AsymptoticRing,
     dependent_variable: Expression,
-    lower_bound: AsymptoticExpansion,
-    upper_bound: AsymptoticExpansion,
+    lower_bound_power,
+    upper_bound_power,
+    lower_bound_factor=1,
+    upper_bound_factor=1,
     bterm_round_to: None | int = None,
+    growth_cache_size: int = 4096,
 ) -> AsymptoticRing:
     """Helper function to modify a given asymptotic ring such
     that an additional symbolic variable bounded in a specified
@@ -52,26 +62,16 @@ def _add_monomial_growth_restriction_to_ring(
         sage: (k*n).O()
         O(n^(3/2))
     """
-    lower_bound = AR(lower_bound)
-    upper_bound = AR(upper_bound)
-    term_monoid_factory = TermMonoidFactory(
-        name=f"{__name__}.TermMonoidFactory",
-        exact_term_monoid_class=MonBoundExactTermMonoidFactory(
-            dependent_variable=dependent_variable,
-            lower_bound=lower_bound,
-            upper_bound=upper_bound,
-        ),
-        O_term_monoid_class=MonBoundOTermMonoidFactory(
-            dependent_variable=dependent_variable,
-            lower_bound=lower_bound,
-            upper_bound=upper_bound,
-        ),
-        B_term_monoid_class=MonBoundBTermMonoidFactory(
-            dependent_variable=dependent_variable,
-            lower_bound=lower_bound,
-            upper_bound=upper_bound,
-            bterm_round_to=bterm_round_to,
-        ),
+    term_monoid_factory = DependentTermMonoidFactory(
+        f"{__name__}.TermMonoidFactory",
+        dependent_variable,
+        lower_bound_power,
+        upper_bound_power,
+        lower_bound_factor=lower_bound_factor,
+        upper_bound_factor=upper_bound_factor,
+        bterm_round_to=bterm_round_to,
+        growth_cache_size=growth_cache_size,
+        default_prec=AR.default_prec,
     )
     return AR.change_parameter(term_monoid_factory=term_monoid_factory)
 
@@ -84,6 +84,8 @@ def AsymptoticRingWithDependentVariable(
     lower_bound_factor=1,
     upper_bound_factor=1,
     bterm_round_to=None,
+    growth_cache_size=4096,
+    polynomial_coefficients=False,
     **ring_kwargs,
 ):
     """Instantiate a special (univariate) :class:`.AsymptoticRing` that
@@ -115,10 +117,22 @@ def AsymptoticRingWithDependentVariable(
       the number of floating point digits to which the coefficients
       of B-terms are rounded.
 
+    - ``growth_cache_size`` -- a positive integer (default: ``4096``),
+      the maximal number of coefficient growth ranges kept in the
+      cache shared by the term monoids of the ring.
+
+    - ``polynomial_coefficients`` -- a boolean (default: ``False``). If
+      ``True``, the coefficient ring is the Laurent polynomial ring over
+      the rationals in the dependent variable instead of the symbolic ring.
+      This makes coefficient arithmetic considerably faster, but only
+      rational constants are supported in coefficients.
+
     - ``ring_kwargs`` -- further keyword arguments being passed to
       the :class:`.AsymptoticRing` constructor.
 
 
+    Identical calls return identical rings, which can be pickled.
+
     SEEALSO:
 
     - :class:`.AsymptoticRing`
@@ -129,9 +143,15 @@ def AsymptoticRingWithDependentVariable(
         sage: import dependent_bterms as dbt
         sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
         sage: A.term_monoid_factory.BTermMonoid
-        <class 'dependent_bterms.structures.MonBoundBTermMonoidFactory.<locals>.MonBoundBTermMonoid'>
+        <class 'dependent_bterms.structures.MonBoundBTermMonoid'>
         sage: O(k*n)
         O(n^(3/2))
+        sage: dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)[0] is A
+        True
+        sage: loads(dumps(A)) is A
+        True
+        sage: loads(dumps(k^2*n + 1/n))
+        k^2*n + n^(-1)
 
     Make sure that scaled monomial bounds also work as intended::
 
@@ -140,20 +160,73 @@ def AsymptoticRingWithDependentVariable(
         sage: dbt.simplify_expansion((n*k).B(valid_from=10), simplify_bterm_growth=True)
         B(2*n^(3/2), n >= 10)
 
+    With polynomial coefficients, the same results as with symbolic
+    coefficients are obtained::
+
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2,
+        ....:     polynomial_coefficients=True)
+        sage: A.coefficient_ring
+        Univariate Laurent Polynomial Ring in k over Rational Field
+        sage: O(k*n)
+        O(n^(3/2))
+        sage: O(n/k^2)
+        O(n)
+        sage: A.B((k - 1)/n, valid_from=10)
+        B((1 + k)*n^(-1), n >= 10)
+
+    Rings with different growth groups but the same dependent variable
+    and bounds share their term monoid factory, but not the cached
+    coefficient growths::
+
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: B, m, _ = dbt.AsymptoticRingWithDependentVariable('m^QQ', 'k', 0, 1/2)
+        sage: A.term_monoid_factory is B.term_monoid_factory
+        True
+        sage: O(k*n), O(k*m)
+        (O(n^(3/2)), O(m^(3/2)))
+
     """
-    AR = AsymptoticRingWithCustomPosetKey(
-        growth_group=growth_group,
-        coefficient_ring=SR,
-        **ring_kwargs,
-    )
-    k = SR.var(dependent_variable)
-    n = AR.gen()
-    AR_with_bound = _add_monomial_growth_restriction_to_ring(
-        AR,
-        k,
-        lower_bound=AR(lower_bound_factor) * n**lower_bound_power,
-        upper_bound=AR(upper_bound_factor) * n**upper_bound_power,
-        bterm_round_to=bterm_round_to,
+    cache_key = (
+        growth_group,
+        str(dependent_variable),
+        lower_bound_power,
+        upper_bound_power,
+        lower_bound_factor,
+        upper_bound_factor,
+        bterm_round_to,
+        growth_cache_size,
+        polynomial_coefficients,
+        tuple(sorted(ring_kwargs.items())),
     )
-    n = AR_with_bound.gen()
-    return AR_with_bound, n, k
+
+    def construct():
+        if polynomial_coefficients:
+            coefficient_ring = LaurentPolynomialRing(QQ, dependent_variable)
+            k = coefficient_ring.gen()
+        else:
+            coefficient_ring = SR
+            k = SR.var(dependent_variable)
+
+        AR = AsymptoticRingWithCustomPosetKey(
+            growth_group=growth_group,
+            coefficient_ring=coefficient_ring,
+            **ring_kwargs,
+        )
+        AR_with_bound = _add_monomial_growth_restriction_to_ring(
+            AR,
+            k,
+            lower_bound_power,
+            upper_bound_power,
+            lower_bound_factor=lower_bound_factor,
+            upper_bound_factor=upper_bound_factor,
+            bterm_round_to=bterm_round_to,
+            growth_cache_size=growth_cache_size,
+        )
+        n = AR_with_bound.gen()
+        return (AR_with_bound, n, k)
+
+    try:
+        hash(cache_key)
+    except TypeError:  # unhashable parameters, no caching
+        return construct()
+    return _DEPENDENT_RINGS.lookup(cache_key, construct)
@@ -0,0 +1,348 @@
+"""Persistent on-disk cache for expensive results.
+
+When enabled via :func:`enable_disk_cache`, the results of
+:func:`.taylor_with_explicit_error` and :func:`.simplify_expansion`
+are stored in a SQLite database and reused across sessions. Entries
+are keyed on the parameters of the asymptotic ring, the serialization
+(see :func:`.serialize_expansion`) of the input expansion, the symbolic
+form of the expanded function and all options. Expansions with a
+dependent variable are stored serialized, all other results pickled;
+as asymptotic rings with a dependent variable are unique, cached
+results are elements of the same ring as recomputed ones.
+
+TESTS::
+
+    sage: import dependent_bterms as dbt
+    sage: AR, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+    sage: AR.B(k*n)
+    doctest:warning
+    ...
+    FutureWarning: ...
+    ...
+    B(abs(k)*n, n >= 0)
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+
+from sage.symbolic.ring import SR
+
+from . import instrumentation
+
+__all__ = [
+    "disable_disk_cache",
+    "enable_disk_cache",
+]
+
+# part of every key; to be increased whenever the stored results of
+# otherwise equal computations change
+_CACHE_VERSION = 1
+
+
+class DiskCache:
+    """Least-recently-used cache stored in a SQLite database.
+
+    INPUT:
+
+    - ``directory`` -- the directory containing the database; it is
+      created if it does not exist.
+
+    - ``max_size`` -- a positive integer (default: 256 MiB), the maximal
+      total size in bytes of the stored values. The least recently used
+      entries are evicted first.
+
+    TESTS::
+
+        sage: from dependent_bterms.disk_cache import DiskCache
+        sage: cache = DiskCache(tmp_dir(), max_size=250)
+        sage: cache.lookup('a', lambda: 1), cache.lookup('a', lambda: 2)
+        (1, 1)
+        sage: len(cache.lookup('b', lambda: 'x'*100))
+        100
+        sage: len(cache.lookup('c', lambda: 'y'*100))
+        100
+        sage: cache.lookup('a', lambda: 3), cache.lookup('c', lambda: '')[0]
+        (3, 'y')
+        sage: info = cache.info()
+        sage: info['hits'], info['misses'], info['currsize']
+        (2, 4, 2)
+        sage: cache.clear()
+        sage: cache.info()['currsize']
+        0
+    """
+
+    def __init__(self, directory, max_size=2**28):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "dependent_bterms_cache.sqlite")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._pid = None
+
+    def _connect(self):
+        # connections must not be shared with forked worker processes
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=60)
+            self._pid = os.getpid()
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "key TEXT PRIMARY KEY, value BLOB, "
+                    "size INTEGER, last_access INTEGER)"
+                )
+        return self._connection
+
+    def lookup(self, key, compute):
+        """Return the entry stored for ``key``; on a miss, the
+        value is determined by calling ``compute()`` and stored.
+        """
+        connection = self._connect()
+        row = connection.execute(
+            "SELECT value FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            self.hits += 1
+            if instrumentation._INSTRUMENTATION is not None:
+                instrumentation._INSTRUMENTATION.record_cache("disk_cache", hit=True)
+            with connection:
+                connection.execute(
+                    "UPDATE entries SET last_access = ? WHERE key = ?",
+                    (time.time_ns(), key),
+                )
+            return pickle.loads(row[0])
+
+        self.misses += 1
+        if instrumentation._INSTRUMENTATION is not None:
+            instrumentation._INSTRUMENTATION.record_cache("disk_cache", hit=False)
+        value = compute()
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) <= self.max_size:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                    (key, data, len(data), time.time_ns()),
+                )
+                self._evict(connection)
+        return value
+
+    def _evict(self, connection):
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        if total <= self.max_size:
+            return
+        rows = connection.execute(
+            "SELECT key, size FROM entries ORDER BY last_access, rowid"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        connection = self._connect()
+        with connection:
+            connection.execute("DELETE FROM entries")
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """Return the cache statistics as a dictionary."""
+        size, count = (
+            self._connect()
+            .execute("SELECT COALESCE(SUM(size), 0), COUNT(*) FROM entries")
+            .fetchone()
+        )
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "max_size": self.max_size,
+            "size": size,
+            "currsize": count,
+        }
+
+
+_DISK_CACHE = None
+
+
+def enable_disk_cache(directory, max_size=2**28) -> DiskCache:
+    """Store results of expensive computations persistently in the
+    given directory.
+
+    INPUT:
+
+    - ``directory`` -- the directory containing the cache database.
+
+    - ``max_size`` -- a positive integer (default: 256 MiB), the maximal
+      total size in bytes of the stored results.
+
+    OUTPUT:
+
+    The enabled :class:`DiskCache`.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: cache = dbt.enable_disk_cache(tmp_dir())
+        sage: dbt.taylor_with_explicit_error(exp, k/(10*n), order=3, valid_from=1000)
+        1 + 1/10*k*n^(-1) + 1/200*k^2*n^(-2) + B(1/1000*abs(k)^3*n^(-3), n >= 1000)
+        sage: dbt.taylor_with_explicit_error(exp, k/(10*n), order=3, valid_from=1000)
+        1 + 1/10*k*n^(-1) + 1/200*k^2*n^(-2) + B(1/1000*abs(k)^3*n^(-3), n >= 1000)
+        sage: cache.info()['hits'], cache.info()['misses']
+        (1, 1)
+        sage: dbt.disable_disk_cache()
+
+    Cached results coincide with recomputed ones::
+
+        sage: cache = dbt.enable_disk_cache(tmp_dir())
+        sage: first = dbt.taylor_with_explicit_error(exp, k/(7*n), order=3, valid_from=10)
+        sage: cached = dbt.taylor_with_explicit_error(exp, k/(7*n), order=3, valid_from=10)
+        sage: dbt.disable_disk_cache()
+        sage: recomputed = dbt.taylor_with_explicit_error(exp, k/(7*n), order=3, valid_from=10)
+        sage: cache.info()['hits'], str(cached) == str(recomputed)
+        (1, True)
+
+    TESTS::
+
+        sage: cache = dbt.enable_disk_cache(tmp_dir())
+        sage: asy = A.B((k + 1)/n, valid_from=10)
+        sage: first = dbt.simplify_expansion(asy, simplify_bterm_growth=True)
+        sage: second = dbt.simplify_expansion(asy, simplify_bterm_growth=True)
+        sage: str(first) == str(second), second.parent() is A, cache.info()['hits']
+        (True, True, 1)
+        sage: dbt.simplify_expansion(asy)
+        B((abs(k + 1))*n^(-1), n >= 10)
+        sage: dbt.disable_disk_cache()
+    """
+    global _DISK_CACHE
+    _DISK_CACHE = DiskCache(directory, max_size=max_size)
+    return _DISK_CACHE
+
+
+def disable_disk_cache():
+    """Stop using the persistent cache enabled by :func:`enable_disk_cache`.
+
+    The stored entries remain on disk.
+    """
+    global _DISK_CACHE
+    _DISK_CACHE = None
+
+
+def _ring_parameters(ring):
+    """Return a tuple of strings describing the given asymptotic ring.
+
+    Internal helper function.
+    """
+    factory = ring.term_monoid_factory
+    parameters = (repr(ring.growth_group), repr(ring.coefficient_ring))
+    if not hasattr(factory, "dependent_variable"):
+        return parameters + (repr(ring), str(ring.default_prec))
+    return parameters + tuple(
+        str(value)
+        for value in (
+            factory.dependent_variable,
+            factory.lower_bound_power,
+            factory.upper_bound_power,
+            factory.lower_bound_factor,
+            factory.upper_bound_factor,
+            factory.bterm_round_to,
+            ring.default_prec,
+        )
+    )
+
+
+def _canonical_form(expansion):
+    """Return the serialization of the given expansion, or ``None``
+    if its parent does not have a dependent variable.
+
+    Internal helper function.
+    """
+    from .serialization import serialize_expansion
+
+    if not hasattr(expansion.parent().term_monoid_factory, "dependent_variable"):
+        return None
+    return serialize_expansion(expansion)
+
+
+def _cache_key(kind, ring, canonical, function, options):
+    """Return the canonical key of a computation.
+
+    Expansions with a dependent variable are described by their
+    serialization, other expansions by their string representation;
+    ``canonical`` is this description of the input expansion. The key
+    also contains the version of the cache and of the serialization
+    format, so that entries written by older versions are not reused.
+
+    Internal helper function.
+
+    TESTS::
+
+        sage: from dependent_bterms.disk_cache import _cache_key, _canonical_form
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: asy = A.B(k^3/n, valid_from=10)
+        sage: loaded = loads(dumps(asy))
+        sage: (_cache_key('simplify', A, _canonical_form(asy), None, {})
+        ....:  == _cache_key('simplify', A, _canonical_form(loaded), None, {}))
+        True
+    """
+    from .serialization import SERIALIZATION_VERSION
+
+    parts = [
+        f"cache={_CACHE_VERSION}",
+        f"serialization={SERIALIZATION_VERSION}",
+        kind,
+        *_ring_parameters(ring),
+        canonical,
+    ]
+    if function is not None:
+        parts.append(str(SR(function(SR.var("z")))))
+    parts.extend(f"{name}={value!r}" for name, value in sorted(options.items()))
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+def _cached(kind, expansion, compute, function=None, **options):
+    """Return ``compute()``, looked up in the persistent cache if
+    it is enabled.
+
+    Computations whose key cannot be determined (for example because
+    the function cannot be evaluated symbolically) are not cached.
+    Results with a dependent variable are stored serialized and
+    returned deserialized (also on a miss), so that cached and
+    recomputed results coincide.
+
+    Internal helper function.
+    """
+    if _DISK_CACHE is None:
+        return compute()
+    try:
+        canonical = _canonical_form(expansion)
+        key = _cache_key(
+            kind,
+            expansion.parent(),
+            str(expansion) if canonical is None else canonical,
+            function,
+            options,
+        )
+    except (TypeError, ValueError, AttributeError):
+        return compute()
+    if canonical is None:
+        return _DISK_CACHE.lookup(key, compute)
+
+    from .serialization import deserialize_expansion
+
+    return deserialize_expansion(
+        _DISK_CACHE.lookup(key, lambda: _canonical_form(compute()))
+    )
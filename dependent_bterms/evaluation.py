@@ -0,0 +1,467 @@
+"""Evaluation of expansion bounds at many points.
+
+The functions in this module turn the upper bound constructed by
+:func:`.expansion_upper_bound` into a callable once, which can then
+be evaluated at many values of the asymptotic variable without any
+symbolic substitutions: either with floating point numbers on NumPy
+arrays, or with interval arithmetic to obtain certified bounds.
+
+TESTS::
+
+    sage: import dependent_bterms as dbt
+    sage: AR, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+    sage: AR.B(k*n)
+    doctest:warning
+    ...
+    FutureWarning: ...
+    ...
+    B(abs(k)*n, n >= 0)
+
+"""
+
+from __future__ import annotations
+
+import operator
+
+import numpy as np
+from sage.ext.fast_callable import fast_callable
+from sage.rings.asymptotic.asymptotic_ring import AsymptoticExpansion
+from sage.rings.asymptotic.term_monoid import BTerm, OTerm
+from sage.rings.real_mpfi import RIF
+from sage.symbolic.operators import add_vararg, mul_vararg
+from sage.symbolic.ring import SR
+
+from .structures import _coefficient_monomials
+from .utils import expansion_from_terms, expansion_upper_bound
+
+__all__ = [
+    "certified_bound_evaluator",
+    "upper_bound_evaluator",
+]
+
+
+def _growth_exponent(growth):
+    """Return the exponent of a monomial growth element.
+
+    Internal helper function.
+    """
+    try:
+        return growth.exponent
+    except AttributeError:
+        raise ValueError(
+            f"Cannot evaluate the growth {growth} numerically, "
+            "only monomial growth groups in one variable are supported."
+        )
+
+
+def _lowest_valid_point(asy, variable, valid_from):
+    """Return the smallest value of the variable for which all B-terms
+    of the expansion (and the given ``valid_from``) are valid.
+
+    Internal helper function.
+    """
+    lowest = valid_from or 1
+    for summand in asy.summands:
+        if isinstance(summand, BTerm):
+            lowest = max(lowest, summand.valid_from.get(variable, 1))
+    return lowest
+
+
+def _expansion_monomials(expansion, dependent_variable):
+    """Return a list of triples ``(c, p, e)`` such that the given exact
+    expansion is the sum of all ``c*k^p*n^e``, where ``k`` is the
+    dependent variable and ``n`` the variable of the ring.
+
+    Internal helper function.
+    """
+    monomials = []
+    for summand in expansion.summands:
+        exponent = _growth_exponent(summand.growth)
+        if dependent_variable is None:
+            coefficient_monomials = [(summand.coefficient, 0)]
+        else:
+            coefficient_monomials = _coefficient_monomials(
+                summand.coefficient, dependent_variable
+            )
+        for coefficient, power in coefficient_monomials:
+            try:
+                monomials.append((float(coefficient), float(power), float(exponent)))
+            except TypeError:
+                raise ValueError(
+                    f"Cannot evaluate the coefficient {coefficient} numerically."
+                )
+    return monomials
+
+
+def _monomial_arrays(monomials):
+    """Turn the output of :func:`_expansion_monomials` into row vectors of
+    coefficients, powers of the dependent variable and exponents.
+
+    Internal helper function.
+    """
+    if not monomials:
+        return (np.zeros((1, 0)),) * 3
+    return tuple(
+        np.array(column, dtype=float).reshape(1, -1) for column in zip(*monomials)
+    )
+
+
+def _evaluate_monomials(arrays, n_values, k_values):
+    coefficients, powers, exponents = arrays
+    n_column = n_values.reshape(-1, 1)
+    terms = coefficients * n_column**exponents
+    if k_values is not None:
+        terms = terms * k_values.reshape(-1, 1) ** powers
+    return terms.sum(axis=1)
+
+
+def upper_bound_evaluator(asy: AsymptoticExpansion, valid_from: int | None = None):
+    r"""Compile the upper bound of the given expansion (as constructed by
+    :func:`.expansion_upper_bound`) to a function that is evaluated
+    on NumPy arrays.
+
+    INPUT:
+
+    - ``asy`` -- an asymptotic expansion in a ring with monomial growth
+      in one variable.
+
+    - ``valid_from`` -- passed to :func:`.expansion_upper_bound`.
+
+    OUTPUT:
+
+    A function with arguments
+
+    - ``n_values`` -- an array (or a list) of values of the variable of the
+      asymptotic ring. Values below the point from which all B-terms
+      are valid are rejected.
+
+    - ``dependent_values`` -- ``'upper'`` (the default) or ``'lower'`` to
+      replace the dependent variable by its upper or lower bound at
+      every value of ``n``, or an array of values for the dependent
+      variable of the same length as ``n_values``.
+
+    which returns the values of the bound as a NumPy array.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: import numpy as np
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: bound = dbt.upper_bound_evaluator(1/n - A.B(1/n^2, valid_from=10))
+        sage: np.allclose(bound([10, 100]), np.array([0.11, 0.0101], dtype=float))
+        True
+        sage: bound = dbt.upper_bound_evaluator(-k/n + A.B(k^2/n^2, valid_from=10))
+        sage: def expected(*values):
+        ....:     return np.array(values, dtype=float)
+        sage: np.allclose(bound([10, 100]), expected(10^(-1/2) + 1/10, 1/10 + 1/100))
+        True
+        sage: np.allclose(bound([10, 100], 'lower'), expected(11/100, 101/10^4))
+        True
+        sage: np.allclose(bound([10, 100], [2, 3]), expected(24/100, 309/10^4))
+        True
+
+    TESTS::
+
+        sage: bound([1, 10])
+        Traceback (most recent call last):
+        ...
+        ValueError: The bound is only valid for n >= 10.
+        sage: dbt.upper_bound_evaluator(1 + O(1/n))
+        Traceback (most recent call last):
+        ...
+        ValueError: No same-order bound can be constructed for O(n^(-1))
+    """
+    A = asy.parent()
+    bound = expansion_upper_bound(asy, valid_from=valid_from)
+
+    (variable,) = A.variable_names()
+    lowest_n = _lowest_valid_point(asy, variable, valid_from)
+
+    ETM = A.term_monoid("exact")
+    if hasattr(ETM, "variable_bounds"):
+        dependent_variable, lower, upper = ETM.variable_bounds
+        variable_bounds = {
+            "lower": _monomial_arrays(_expansion_monomials(lower, None)),
+            "upper": _monomial_arrays(_expansion_monomials(upper, None)),
+        }
+    else:
+        dependent_variable, variable_bounds = None, {}
+    arrays = _monomial_arrays(_expansion_monomials(bound, dependent_variable))
+
+    def evaluate_bound(n_values, dependent_values="upper"):
+        n_values = np.asarray(n_values, dtype=float)
+        if np.any(n_values < float(lowest_n)):
+            raise ValueError(f"The bound is only valid for {variable} >= {lowest_n}.")
+
+        if dependent_variable is None:
+            k_values = None
+        elif isinstance(dependent_values, str):
+            if dependent_values not in variable_bounds:
+                raise ValueError(
+                    "The values of the dependent variable must be 'lower', "
+                    f"'upper' or an array, not {dependent_values!r}."
+                )
+            k_values = _evaluate_monomials(
+                variable_bounds[dependent_values], n_values, None
+            )
+        else:
+            k_values = np.broadcast_to(
+                np.asarray(dependent_values, dtype=float), n_values.shape
+            )
+        return _evaluate_monomials(arrays, n_values, k_values)
+
+    return evaluate_bound
+
+
+_NUMPY_FUNCTIONS = {
+    "exp": "np.exp",
+    "log": "np.log",
+    "sqrt": "np.sqrt",
+    "sin": "np.sin",
+    "cos": "np.cos",
+    "tan": "np.tan",
+    "arcsin": "np.arcsin",
+    "arccos": "np.arccos",
+    "arctan": "np.arctan",
+    "sinh": "np.sinh",
+    "cosh": "np.cosh",
+    "tanh": "np.tanh",
+    "abs": "np.abs",
+}
+
+
+def _python_source(expression, variables, constant=repr, functions=None):
+    """Return Python source code evaluating the given symbolic expression
+    in the given variables with NumPy.
+
+    INPUT:
+
+    - ``expression`` -- a symbolic expression.
+
+    - ``variables`` -- a dictionary mapping the names of the symbolic
+      variables to the names used in the source code.
+
+    - ``constant`` -- a function mapping a constant to its source code.
+
+    - ``functions`` -- a dictionary mapping names of symbolic functions
+      to the names of the Python functions; by default, NumPy functions.
+
+    Internal helper function.
+
+    TESTS::
+
+        sage: import numpy as np
+        sage: from dependent_bterms.evaluation import _numpy_function, _python_source
+        sage: z = SR.var('z')
+        sage: F = _numpy_function(exp(z)/(1 - z) + abs(z)^(1/2), [z])
+        sage: values = F(np.array([0, 1/2, -1], dtype=float))
+        sage: np.allclose(values, np.array([1, 2*e^(1/2) + sqrt(1/2), e^(-1)/2 + 1], dtype=float))
+        True
+        sage: _python_source(gamma(z), {'z': 'x'})
+        Traceback (most recent call last):
+        ...
+        ValueError: Cannot translate gamma(z) to Python code.
+    """
+    if functions is None:
+        functions = _NUMPY_FUNCTIONS
+    expression = SR(expression)
+    if not expression.variables():
+        return str(constant(expression))
+    if expression.is_symbol():
+        return variables[str(expression)]
+
+    op = expression.operator()
+    operands = [
+        _python_source(operand, variables, constant, functions)
+        for operand in expression.operands()
+    ]
+    if op is add_vararg or op is operator.add:
+        return "(" + " + ".join(operands) + ")"
+    if op is mul_vararg or op is operator.mul:
+        return "(" + " * ".join(operands) + ")"
+    if op is operator.pow:
+        return f"({operands[0]} ** {operands[1]})"
+
+    name = op.name() if hasattr(op, "name") else None
+    if name not in functions:
+        raise ValueError(f"Cannot translate {expression} to Python code.")
+    return f"{functions[name]}({', '.join(operands)})"
+
+
+def _numpy_function(expression, variables):
+    """Return a function evaluating the given symbolic expression on
+    NumPy arrays, the arguments are the values of the given variables.
+
+    Internal helper function.
+    """
+    names = {str(variable): f"x{index}" for index, variable in enumerate(variables)}
+    source = _python_source(expression, names, constant=float)
+    return eval(f"lambda {', '.join(names.values())}: {source}", {"np": np})
+
+
+def _exact_and_error_parts(expansion):
+    """Return the exact part of the expansion and the upper bound of
+    its B-terms.
+
+    Internal helper function.
+    """
+    if any(isinstance(summand, OTerm) for summand in expansion.summands):
+        raise ValueError(f"Cannot bound {expansion} explicitly, it contains O-terms.")
+    bterms = expansion_from_terms(
+        expansion.parent(),
+        [summand for summand in expansion.summands if isinstance(summand, BTerm)],
+        convert=False,
+    )
+    return expansion.exact_part(), expansion_upper_bound(bterms)
+
+
+def _symbolic_expression(expansion, n, dependent_variable, k):
+    """Return the given exact expansion as a symbolic expression in the
+    symbolic variables ``n`` and ``k`` (replacing the dependent variable).
+
+    Internal helper function.
+    """
+    expression = SR.zero()
+    for summand in expansion.summands:
+        growth = n ** SR(_growth_exponent(summand.growth))
+        if dependent_variable is None:
+            expression += SR(summand.coefficient) * growth
+            continue
+        for coefficient, power in _coefficient_monomials(
+            summand.coefficient, dependent_variable
+        ):
+            expression += SR(coefficient) * k ** SR(power) * growth
+    return expression
+
+
+def _interval_point(point):
+    """Return the given point, or the interval given by a pair of
+    endpoints, as a real interval.
+
+    Internal helper function.
+    """
+    if isinstance(point, (tuple, list)):
+        return RIF(*point)
+    return RIF(point)
+
+
+def certified_bound_evaluator(
+    asy: AsymptoticExpansion,
+    valid_from: int | None = None,
+    domain=RIF,
+    envelope: bool = False,
+):
+    r"""Compile the upper bound of the given expansion (as constructed by
+    :func:`.expansion_upper_bound`) to a function that computes
+    certified bounds with interval arithmetic.
+
+    The expressions involved are compiled via :func:`.fast_callable`
+    once. The dependent variable is replaced by the interval between
+    its lower and upper bound, so that the results are valid for all
+    admissible values of the dependent variable.
+
+    INPUT:
+
+    - ``asy`` -- an asymptotic expansion in a ring with monomial growth
+      in one variable.
+
+    - ``valid_from`` -- passed to :func:`.expansion_upper_bound`.
+
+    - ``domain`` -- the interval field used for the evaluation, like
+      ``RIF`` (the default) or ``RBF``.
+
+    - ``envelope`` -- if ``False`` (the default), certified upper bounds
+      for the upper bound of the expansion are computed. If ``True``,
+      enclosures of all values the expansion can take are computed,
+      consisting of the exact part together with the bound of the B-terms.
+
+    OUTPUT:
+
+    A function mapping a list of points to the list of results. Points
+    are numbers or pairs ``(a, b)`` standing for all values between
+    ``a`` and ``b``; they have to lie in the range in which all B-terms
+    are valid.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: bounds = dbt.certified_bound_evaluator(1/n - A.B(1/n^2, valid_from=10))
+        sage: [bound >= value for bound, value in zip(bounds([10, 100]), [11/100, 101/10^4])]
+        [True, True]
+        sage: bounds([10, (100, 200)])[1] >= 101/10^4
+        True
+
+        sage: asy = k/n + A.B(k^2/n^2, valid_from=10)
+        sage: [enclosure] = dbt.certified_bound_evaluator(asy, envelope=True)([100])
+        sage: [value in enclosure for value in [1/100 - 1/10^4, 1/20, -1/10, 1/5]]
+        [True, True, False, False]
+        sage: [enclosure] = dbt.certified_bound_evaluator(asy, domain=RBF, envelope=True)([100])
+        sage: enclosure.parent()
+        Real ball field with 53 bits of precision
+
+    TESTS::
+
+        sage: bounds([1])
+        Traceback (most recent call last):
+        ...
+        ValueError: The bound is only valid for n >= 10.
+        sage: dbt.certified_bound_evaluator(1 + O(1/n), envelope=True)
+        Traceback (most recent call last):
+        ...
+        ValueError: Cannot bound 1 + O(n^(-1)) explicitly, it contains O-terms.
+    """
+    A = asy.parent()
+    (variable,) = A.variable_names()
+    lowest_n = _lowest_valid_point(asy, variable, valid_from)
+    n = SR.var(variable)
+
+    ETM = A.term_monoid("exact")
+    if hasattr(ETM, "variable_bounds"):
+        dependent_variable, lower, upper = ETM.variable_bounds
+        k = SR.var(str(dependent_variable))
+        arguments = [n, k]
+        dependent_bounds = [
+            fast_callable(
+                _symbolic_expression(bound, n, None, None), vars=[n], domain=RIF
+            )
+            for bound in (lower, upper)
+        ]
+    else:
+        dependent_variable, k = None, None
+        arguments = [n]
+
+    def compile_expansion(expansion):
+        return fast_callable(
+            _symbolic_expression(expansion, n, dependent_variable, k),
+            vars=arguments,
+            domain=domain,
+        )
+
+    if envelope:
+        main_part, error_bound = map(compile_expansion, _exact_and_error_parts(asy))
+    else:
+        bound = compile_expansion(expansion_upper_bound(asy, valid_from=valid_from))
+
+    def evaluate_point(point):
+        n_interval = _interval_point(point)
+        if not n_interval.lower() >= lowest_n:
+            raise ValueError(f"The bound is only valid for {variable} >= {lowest_n}.")
+
+        values = [domain(n_interval)]
+        if dependent_variable is not None:
+            lower_value, upper_value = (
+                RIF(dependent_bound(n_interval)) for dependent_bound in dependent_bounds
+            )
+            values.append(domain(lower_value.union(upper_value)))
+
+        if not envelope:
+            return domain(bound(*values)).upper()
+
+        error = RIF(error_bound(*values)).upper()
+        return domain(RIF(main_part(*values)) + RIF(-error, error))
+
+    def evaluate_bounds(points):
+        return [evaluate_point(point) for point in points]
+
+    return evaluate_bounds
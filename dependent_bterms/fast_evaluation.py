@@ -0,0 +1,133 @@
+"""Cached evaluation of symbolic expressions.
+
+This module only depends on Sage's symbolic expressions and
+:func:`.fast_callable` (which are imported when needed), so that
+:func:`evaluate` can be used without loading the asymptotic ring.
+
+TESTS::
+
+    sage: import dependent_bterms as dbt
+    sage: AR, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+    sage: AR.B(k*n)
+    doctest:warning
+    ...
+    FutureWarning: ...
+    ...
+    B(abs(k)*n, n >= 0)
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .caching import LRUCache
+from .instrumentation import _instrumented
+
+if TYPE_CHECKING:
+    from sage.symbolic.expression import Expression
+
+__all__ = [
+    "evaluate",
+]
+
+
+_EVALUATE_CACHE = LRUCache(maxsize=1024, name="evaluate")
+
+
+@_instrumented("compile")
+def _compile_expression(expression, expand, domain):
+    """Compile an expression via :func:`.fast_callable`, returning
+    the compiled callable together with the variables it expects.
+
+    Internal helper function.
+    """
+    from sage.ext.fast_callable import fast_callable
+
+    expanded = expression.expand() if expand else expression
+    expression_vars = expanded.variables()
+    return (
+        fast_callable(expanded, vars=expression_vars, domain=domain),
+        expression_vars,
+    )
+
+
+@_instrumented("evaluate")
+def evaluate(expression: Expression, expand=True, domain=None, **eval_args):
+    """Evaluate a symbolic expression without necessarily
+    returning a result in the symbolic ring.
+
+    The compiled callable of an expression is cached, repeated
+    evaluations of equal expressions reuse it. The cache
+    statistics can be inspected via ``evaluate.cache_info()``, the
+    cache is emptied by ``evaluate.cache_clear()``.
+
+    INPUT:
+
+    - ``expression`` -- a symbolic expression.
+
+    - ``expand`` -- if ``True`` (the default), the expression is
+      expanded before evaluation. Useful to improve performance
+      when the expression is a sum of terms.
+
+    - ``domain`` -- the domain passed to :func:`.fast_callable`,
+      or ``None`` (the default) to operate on generic Python objects.
+
+    - ``eval_args`` -- the values to be input for the variables
+      in keyword argument form.
+
+    EXAMPLES::
+
+        sage: from dependent_bterms import evaluate
+        sage: var('a b c')
+        (a, b, c)
+        sage: res = evaluate(a*b*c, a=1, b=2, c=3)
+        sage: res, res.parent()
+        (6, Integer Ring)
+        sage: evaluate(a + b, b=42)
+        a + 42
+
+        sage: A.<n> = AsymptoticRing('n^QQ', SR, default_prec=3)
+        sage: evaluate(a/(b + c), a=n, b=1)
+        (1/(c + 1))*n
+        sage: evaluate(a/(b + c), a=pi, b=-1/n, c=1)
+        pi + pi*n^(-1) + pi*n^(-2) + O(n^(-3))
+
+    TESTS::
+
+        sage: evaluate.cache_clear()
+        sage: evaluate(a*b + c, a=1, b=2, c=3), evaluate(a*b + c, a=2, b=2, c=3)
+        (5, 7)
+        sage: evaluate.cache_info()
+        {'currsize': 1, 'hits': 1, 'maxsize': 1024, 'misses': 1}
+        sage: evaluate(a*b + c, domain=RDF, a=1, b=2, c=3)
+        5.0
+        sage: evaluate.cache_info()['currsize']
+        2
+
+    Different expressions with the same representation are compiled
+    separately::
+
+        sage: x = SR.var('x')
+        sage: x + pi, x + SR.var('pi')
+        (pi + x, pi + x)
+        sage: evaluate(x + pi, domain=RDF, x=1)
+        4.141592653589793
+        sage: evaluate(x + SR.var('pi'), domain=RDF, x=1, pi=2)
+        3.0
+    """
+
+    # expressions are hashed (and compared) structurally, in contrast
+    # to their representations this distinguishes, e.g., constants
+    # from variables with the same name
+    compiled, expression_vars = _EVALUATE_CACHE.lookup(
+        (expression, expand, domain),
+        lambda: _compile_expression(expression, expand, domain),
+    )
+    function_args = [eval_args.get(str(var), var) for var in expression_vars]
+
+    return compiled(*function_args)
+
+
+evaluate.cache_info = _EVALUATE_CACHE.info
+evaluate.cache_clear = _EVALUATE_CACHE.clear
@@ -0,0 +1,250 @@
+"""Opt-in instrumentation of the internal hot paths.
+
+While instrumentation is enabled (via :func:`enable_instrumentation` or
+the :func:`instrument` context manager), the number of calls and the
+cumulative wall time of the following internal stages are recorded:
+
+- ``element_key`` -- determining the poset key of a summand,
+- ``bterm_init`` -- constructing (and simplifying) a B-term,
+- ``absorb`` -- absorbing a term by a B-term,
+- ``evaluate`` -- evaluating a symbolic expression via :func:`.evaluate`,
+- ``compile`` -- compiling an expression via :func:`.fast_callable`
+  (for evaluations whose compiled callable is not cached),
+- ``assuming`` -- simplifying an expression by Maxima under the
+  assumption that the dependent variable is positive.
+
+The time of a stage includes the time of all stages called from it.
+Additionally, the hits and misses of the caches of the package (the
+``coefficient_growth`` caches of the rings, the ``evaluate`` cache and
+the ``disk_cache``) are counted.
+
+When instrumentation is disabled, instrumented functions only check a
+module attribute before doing their actual work.
+
+TESTS::
+
+    sage: import dependent_bterms as dbt
+    sage: AR, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+    sage: AR.B(k*n)
+    doctest:warning
+    ...
+    FutureWarning: ...
+    ...
+    B(abs(k)*n, n >= 0)
+
+::
+
+    sage: from dependent_bterms.instrumentation import Instrumentation
+    sage: stats = Instrumentation()
+    sage: stats.record_call('absorb', 0.5r)
+    sage: stats.record_call('absorb', 0.25r)
+    sage: stats.record_cache('evaluate', hit=False)
+    sage: stats.record_cache('evaluate', hit=True)
+    sage: stats.record_cache('evaluate', hit=True)
+    sage: stats.record_cache('evaluate', hit=True)
+    sage: stats.report()
+    {'caches': {'evaluate': {'hit_rate': 0.75, 'hits': 3, 'misses': 1}},
+     'stages': {'absorb': {'calls': 2, 'time': 0.75}}}
+    sage: print(stats.table())
+    stage                calls    time [s]
+    absorb                   2    0.750000
+    <BLANKLINE>
+    cache                 hits      misses    hit rate
+    evaluate                 3           1       0.750
+
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+__all__ = [
+    "disable_instrumentation",
+    "enable_instrumentation",
+    "instrument",
+]
+
+
+_INSTRUMENTATION = None
+
+
+class Instrumentation:
+    """Statistics of the instrumented stages and caches, recorded
+    while instrumentation is enabled.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.caches = {}
+
+    def record_call(self, stage, elapsed):
+        """Record a call of ``stage`` which took ``elapsed`` seconds."""
+        statistics = self.stages.get(stage)
+        if statistics is None:
+            statistics = self.stages[stage] = [0, 0.0]
+        statistics[0] += 1
+        statistics[1] += elapsed
+
+    def record_cache(self, cache, hit):
+        """Record a lookup in ``cache``, which is a hit if ``hit`` is ``True``."""
+        statistics = self.caches.get(cache)
+        if statistics is None:
+            statistics = self.caches[cache] = [0, 0]
+        statistics[0 if hit else 1] += 1
+
+    def report(self):
+        """Return the recorded statistics as a dictionary.
+
+        The dictionary contains the number of ``calls`` and the cumulative
+        ``time`` (in seconds) of every stage under the key ``'stages'``,
+        and the ``hits``, ``misses`` and the ``hit_rate`` of every cache
+        under the key ``'caches'``.
+        """
+        return {
+            "stages": {
+                stage: {"calls": calls, "time": elapsed}
+                for stage, (calls, elapsed) in sorted(self.stages.items())
+            },
+            "caches": {
+                cache: {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": hits / (hits + misses),
+                }
+                for cache, (hits, misses) in sorted(self.caches.items())
+            },
+        }
+
+    def table(self):
+        """Return the recorded statistics formatted as a table."""
+        report = self.report()
+        lines = [f"{'stage':<16}{'calls':>10}{'time [s]':>12}"]
+        lines.extend(
+            f"{stage:<16}{statistics['calls']:>10}{statistics['time']:>12.6f}"
+            for stage, statistics in report["stages"].items()
+        )
+        lines.append("")
+        lines.append(f"{'cache':<16}{'hits':>10}{'misses':>12}{'hit rate':>12}")
+        lines.extend(
+            f"{cache:<16}{statistics['hits']:>10}{statistics['misses']:>12}"
+            f"{statistics['hit_rate']:>12.3f}"
+            for cache, statistics in report["caches"].items()
+        )
+        return "\n".join(lines)
+
+
+def enable_instrumentation() -> Instrumentation:
+    """Start recording the statistics of the internal hot paths.
+
+    OUTPUT:
+
+    The :class:`Instrumentation` in which the statistics are recorded
+    (until :func:`disable_instrumentation` is called).
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: stats = dbt.enable_instrumentation()
+        sage: asy = dbt.taylor_with_explicit_error(exp, k/n, order=3, valid_from=10)
+        sage: asy + A.B(k^4/n^4, valid_from=10)
+        1 + k*n^(-1) + 1/2*k^2*n^(-2) + B((1/10*(sqrt(10) + 10)*abs(k)^3)*n^(-3), n >= 10)
+        sage: dbt.disable_instrumentation()
+        sage: report = stats.report()
+        sage: sorted(report['stages'])
+        ['absorb', 'bterm_init', 'compile', 'element_key', 'evaluate']
+        sage: report['stages']['element_key']['calls'] > 0
+        True
+        sage: 'coefficient_growth' in report['caches']
+        True
+
+    Nothing is recorded after instrumentation has been disabled::
+
+        sage: calls = report['stages']['element_key']['calls']
+        sage: asy = dbt.taylor_with_explicit_error(exp, k/n, order=3, valid_from=10)
+        sage: stats.report()['stages']['element_key']['calls'] == calls
+        True
+    """
+    global _INSTRUMENTATION
+    _INSTRUMENTATION = Instrumentation()
+    return _INSTRUMENTATION
+
+
+def disable_instrumentation():
+    """Stop recording the statistics of the internal hot paths.
+
+    See :func:`enable_instrumentation`.
+    """
+    global _INSTRUMENTATION
+    _INSTRUMENTATION = None
+
+
+@contextmanager
+def instrument():
+    """Context manager recording the statistics of the internal hot
+    paths of the computations in its body.
+
+    The previous state of the instrumentation is restored on exit.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: with dbt.instrument() as stats:
+        ....:     bound = dbt.expansion_upper_bound(
+        ....:         k/n + A.B(k^2/n^2, valid_from=10), numeric=True)
+        sage: report = stats.report()
+        sage: report['stages']['evaluate']['calls'] > 0
+        True
+        sage: report['caches']['evaluate']['hits'] + report['caches']['evaluate']['misses'] > 0
+        True
+        sage: print(stats.table())
+        stage                calls    time [s]
+        ...
+        cache                 hits      misses    hit rate
+        ...
+
+    TESTS::
+
+        sage: from dependent_bterms import instrumentation
+        sage: with dbt.instrument() as outer:
+        ....:     with dbt.instrument() as inner:
+        ....:         pass
+        ....:     instrumentation._INSTRUMENTATION is outer
+        True
+        sage: instrumentation._INSTRUMENTATION is None
+        True
+    """
+    global _INSTRUMENTATION
+    previous = _INSTRUMENTATION
+    _INSTRUMENTATION = Instrumentation()
+    try:
+        yield _INSTRUMENTATION
+    finally:
+        _INSTRUMENTATION = previous
+
+
+def _instrumented(stage):
+    """Decorator recording the calls of the decorated function as
+    calls of ``stage`` while instrumentation is enabled.
+
+    Internal helper function.
+    """
+
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            instrumentation = _INSTRUMENTATION
+            if instrumentation is None:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                instrumentation.record_call(stage, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,204 @@
+"""Parallel evaluation of explicit-error Taylor expansions.
+
+The functions in this module distribute many calls of
+:func:`.taylor_with_explicit_error` over a pool of worker processes.
+Asymptotic rings with a dependent variable are unique and picklable,
+so every worker reconstructs the ring of the submitted terms once.
+Results with a dependent variable are sent back serialized (see
+:func:`.serialize_expansion`), and all results are returned as
+expansions in the ring of the caller.
+
+TESTS::
+
+    sage: import dependent_bterms as dbt
+    sage: AR, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+    sage: AR.B(k*n)
+    doctest:warning
+    ...
+    FutureWarning: ...
+    ...
+    B(abs(k)*n, n >= 0)
+
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .serialization import deserialize_expansion, serialize_expansion
+from .utils import taylor_with_explicit_error
+
+__all__ = [
+    "iter_taylor_with_explicit_error",
+    "taylor_with_explicit_error_batch",
+]
+
+
+_JOB_ARGUMENTS = ("f", "term", "order", "valid_from")
+
+# strong references to the rings reconstructed in a worker process,
+# keeps them (and their caches) alive between jobs
+_WORKER_RINGS = ()
+
+
+def _normalize_job(job) -> dict:
+    """Turn a job given as a tuple ``(f, term[, order[, valid_from]])``
+    or as a dictionary of keyword arguments into a dictionary.
+
+    Internal helper function.
+    """
+    if isinstance(job, dict):
+        return dict(job)
+    if not 2 <= len(job) <= len(_JOB_ARGUMENTS):
+        raise ValueError(
+            f"A job must consist of a function, a term, and optionally "
+            f"an order and a valid_from value; got {job}."
+        )
+    return dict(zip(_JOB_ARGUMENTS, job))
+
+
+def _initialize_worker(rings):
+    global _WORKER_RINGS
+    _WORKER_RINGS = tuple(rings)
+
+
+def _run_job(job):
+    result = taylor_with_explicit_error(**job)
+    if hasattr(result.parent().term_monoid_factory, "dependent_variable"):
+        return serialize_expansion(result)
+    return result
+
+
+def _submit_jobs(executor, jobs, round_constant):
+    futures = {}
+    for index, job in enumerate(jobs):
+        job.setdefault("round_constant", round_constant)
+        futures[executor.submit(_run_job, job)] = index
+    return futures
+
+
+def _executor_for(jobs, max_workers, mp_context):
+    rings = tuple({job["term"].parent(): None for job in jobs})
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_initialize_worker,
+        initargs=(rings,),
+    )
+
+
+def iter_taylor_with_explicit_error(
+    jobs,
+    max_workers: int | None = None,
+    round_constant: bool = True,
+    executor=None,
+    mp_context=None,
+):
+    r"""Compute :func:`.taylor_with_explicit_error` for several jobs in
+    parallel and yield the results as soon as they are available.
+
+    INPUT:
+
+    - ``jobs`` -- an iterable of jobs, each given as a tuple
+      ``(f, term, order, valid_from)`` (where ``order`` and ``valid_from``
+      are optional) or as a dictionary of keyword arguments for
+      :func:`.taylor_with_explicit_error`. The functions ``f`` need to be
+      picklable, like Sage's symbolic functions or module-level functions.
+
+    - ``max_workers`` -- the number of worker processes, or ``None``
+      (the default) for the number of processors of the machine.
+
+    - ``round_constant`` -- passed to :func:`.taylor_with_explicit_error`
+      for all jobs that do not specify it.
+
+    - ``executor`` -- an existing :class:`concurrent.futures.Executor`
+      to be used instead of a new process pool; it is not shut down.
+
+    - ``mp_context`` -- the multiprocessing context for a new
+      process pool.
+
+    OUTPUT:
+
+    A generator of pairs ``(index, expansion)`` in order of completion,
+    where ``index`` is the position of the job in ``jobs``.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: jobs = [(exp, k/n, 3, 10), (sin, k/n, 4, 10)]
+        sage: results = dbt.iter_taylor_with_explicit_error(jobs, max_workers=2)
+        sage: for index, expansion in sorted(results, key=lambda pair: pair[0]):
+        ....:     print(index, expansion)
+        0 1 + k*n^(-1) + 1/2*k^2*n^(-2) + B(abs(k)^3*n^(-3), n >= 10)
+        1 k*n^(-1) - 1/6*k^3*n^(-3) + B(abs(k)^4*n^(-4), n >= 10)
+
+    TESTS:
+
+    Results coincide with the ones computed sequentially::
+
+        sage: results = dict(dbt.iter_taylor_with_explicit_error(jobs, max_workers=2))
+        sage: [str(results[index]) == str(dbt.taylor_with_explicit_error(*job))
+        ....:  for index, job in enumerate(jobs)]
+        [True, True]
+    """
+    jobs = [_normalize_job(job) for job in jobs]
+    own_executor = executor is None
+    if own_executor:
+        executor = _executor_for(jobs, max_workers, mp_context)
+
+    try:
+        futures = _submit_jobs(executor, jobs, round_constant)
+        for future in as_completed(futures):
+            index = futures[future]
+            result = future.result()
+            if isinstance(result, str):
+                result = deserialize_expansion(result)
+            yield index, jobs[index]["term"].parent()(result)
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def taylor_with_explicit_error_batch(
+    jobs,
+    max_workers: int | None = None,
+    round_constant: bool = True,
+    executor=None,
+    mp_context=None,
+):
+    r"""Compute :func:`.taylor_with_explicit_error` for several jobs in
+    parallel.
+
+    The input is the same as for :func:`iter_taylor_with_explicit_error`.
+
+    OUTPUT:
+
+    A list of expansions, in the order in which the jobs were given.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: jobs = [(exp, k/(10*n), 3, 1000), {'f': exp, 'term': 1/n, 'order': 2}]
+        sage: results = dbt.taylor_with_explicit_error_batch(jobs, max_workers=2)
+        sage: for expansion in results:
+        ....:     print(expansion)
+        1 + 1/10*k*n^(-1) + 1/200*k^2*n^(-2) + B(1/1000*abs(k)^3*n^(-3), n >= 1000)
+        1 + n^(-1) + B(2*n^(-2), n >= 1)
+        sage: results[0].parent() is A
+        True
+        sage: str(results[0]) == str(dbt.taylor_with_explicit_error(exp, k/(10*n), 3, 1000))
+        True
+    """
+    jobs = list(jobs)
+    results = [None] * len(jobs)
+    for index, expansion in iter_taylor_with_explicit_error(
+        jobs,
+        max_workers=max_workers,
+        round_constant=round_constant,
+        executor=executor,
+        mp_context=mp_context,
+    ):
+        results[index] = expansion
+    return results
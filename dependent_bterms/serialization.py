@@ -0,0 +1,378 @@
+"""Compact serialization of expansions with a dependent variable.
+
+Expansions are serialized to a versioned JSON document which stores
+the parameters of the asymptotic ring once, followed by one entry
+``[type, growth, coefficient, valid_from]`` per summand. Coefficients
+which are (Laurent) polynomials in the dependent variable are stored as
+lists of pairs of exponents and coefficients; symbolic coefficients
+which are absolute values of such polynomials (like the ones of
+B-terms) as an object ``{"abs": pairs}``. Only symbolic coefficients
+which cannot be reproduced exactly from such pairs (like ``(k + 1)^2``
+or ``sin(k)``) are stored as strings.
+
+Deserialized expansions are elements of the (unique) ring constructed
+by :func:`.AsymptoticRingWithDependentVariable` for the stored
+parameters; their summands are inserted without attempting any
+absorptions, and the coefficients of B-terms are taken as they are
+(without bounding or rounding them again).
+
+TESTS::
+
+    sage: import dependent_bterms as dbt
+    sage: AR, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+    sage: AR.B(k*n)
+    doctest:warning
+    ...
+    FutureWarning: ...
+    ...
+    B(abs(k)*n, n >= 0)
+
+"""
+
+from __future__ import annotations
+
+import json
+
+from sage.rings.asymptotic.asymptotic_ring import AsymptoticExpansion
+from sage.rings.asymptotic.term_monoid import BTerm, ExactTerm, OTerm
+from sage.rings.integer_ring import ZZ
+from sage.rings.rational_field import QQ
+from sage.symbolic.ring import SR
+
+from .dependent_variable_ring import AsymptoticRingWithDependentVariable
+from .structures import _canonical_expression, _simplify_positive_natively
+from .utils import expansion_from_terms
+
+__all__ = [
+    "deserialize_expansion",
+    "serialize_expansion",
+]
+
+
+SERIALIZATION_VERSION = 2
+
+# versions which can still be deserialized
+_SUPPORTED_VERSIONS = (1, 2)
+
+
+def _serialize_number(value):
+    return str(value)
+
+
+def _deserialize_number(value):
+    """Parse a number stored by :func:`_serialize_number`.
+
+    Internal helper function.
+    """
+    try:
+        return ZZ(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return QQ(value)
+    except (TypeError, ValueError):
+        return SR(value)
+
+
+def _ring_parameters(ring) -> dict:
+    """Return the parameters of :func:`.AsymptoticRingWithDependentVariable`
+    with which the given ring is constructed.
+
+    Internal helper function.
+    """
+    factory = ring.term_monoid_factory
+    if not hasattr(factory, "dependent_variable"):
+        raise ValueError(f"{ring} does not have a dependent variable.")
+
+    return {
+        "growth_group": ring.growth_group._repr_short_(),
+        "dependent_variable": str(factory.dependent_variable),
+        "lower_bound_power": _serialize_number(factory.lower_bound_power),
+        "upper_bound_power": _serialize_number(factory.upper_bound_power),
+        "lower_bound_factor": _serialize_number(factory.lower_bound_factor),
+        "upper_bound_factor": _serialize_number(factory.upper_bound_factor),
+        "bterm_round_to": (
+            None if factory.bterm_round_to is None else int(factory.bterm_round_to)
+        ),
+        "growth_cache_size": factory.growth_cache.maxsize,
+        "polynomial_coefficients": ring.coefficient_ring is not SR,
+        "default_prec": int(ring.default_prec),
+    }
+
+
+def _ring_from_parameters(parameters):
+    """Return the asymptotic ring described by the output of
+    :func:`_ring_parameters`, together with its generator and
+    the dependent variable.
+
+    Parameters that are not given take the default values
+    of :func:`.AsymptoticRingWithDependentVariable`.
+
+    Internal helper function.
+    """
+    ring_kwargs = {}
+    if "default_prec" in parameters:
+        ring_kwargs["default_prec"] = parameters["default_prec"]
+    return AsymptoticRingWithDependentVariable(
+        parameters["growth_group"],
+        parameters["dependent_variable"],
+        _deserialize_number(parameters["lower_bound_power"]),
+        _deserialize_number(parameters["upper_bound_power"]),
+        lower_bound_factor=_deserialize_number(parameters.get("lower_bound_factor", 1)),
+        upper_bound_factor=_deserialize_number(parameters.get("upper_bound_factor", 1)),
+        bterm_round_to=parameters.get("bterm_round_to"),
+        growth_cache_size=parameters.get("growth_cache_size", 4096),
+        polynomial_coefficients=parameters.get("polynomial_coefficients", False),
+        **ring_kwargs,
+    )
+
+
+def _symbolic_from_monomials(monomials, dependent_variable, absolute):
+    """Return the symbolic expression which is the sum of ``c*k^p`` for
+    all pairs ``(p, c)`` in ``monomials``, or its absolute value.
+
+    Internal helper function.
+    """
+    polynomial = sum(
+        (
+            coefficient * dependent_variable**exponent
+            for exponent, coefficient in monomials
+        ),
+        SR.zero(),
+    )
+    if absolute:
+        return _canonical_expression(abs(polynomial))
+    return polynomial
+
+
+def _symbolic_monomials(coefficient, dependent_variable):
+    """Return a pair ``(monomials, absolute)`` such that the symbolic
+    coefficient is reconstructed by :func:`_symbolic_from_monomials`,
+    or ``None`` if the coefficient is not a (Laurent) polynomial in the
+    dependent variable or its absolute value.
+
+    Internal helper function.
+
+    TESTS::
+
+        sage: from dependent_bterms.serialization import _symbolic_monomials
+        sage: k = SR.var('k')
+        sage: _symbolic_monomials(abs(k^3 + 3*k), k)
+        ([(1, 3), (3, 1)], True)
+        sage: _symbolic_monomials(k^2 - 1/k, k)
+        ([(-1, -1), (2, 1)], False)
+        sage: _symbolic_monomials((k + 1)^2, k) is None
+        True
+        sage: _symbolic_monomials(sin(k), k) is None
+        True
+    """
+    polynomial = _simplify_positive_natively(coefficient, dependent_variable)
+    if polynomial is None:
+        return None
+    try:
+        monomials = [
+            (ZZ(exponent), value)
+            for value, exponent in polynomial.expand().coefficients(dependent_variable)
+        ]
+    except (TypeError, ValueError):
+        return None
+    if any(dependent_variable in value.variables() for _, value in monomials):
+        return None
+
+    representation = str(coefficient)
+    for absolute in (False, True):
+        if (
+            str(_symbolic_from_monomials(monomials, dependent_variable, absolute))
+            == representation
+        ):
+            return monomials, absolute
+    return None
+
+
+def _serialize_coefficient(coefficient, dependent_variable):
+    """Serialize a coefficient as a list of pairs of exponents and
+    coefficients if possible, and as a string otherwise.
+
+    Internal helper function.
+    """
+    if coefficient.parent() is not SR:
+        return [
+            [int(exponent), str(value)]
+            for exponent, value in coefficient.dict().items()
+        ]
+    monomials = _symbolic_monomials(coefficient, dependent_variable)
+    if monomials is None:
+        return str(coefficient)
+    monomials, absolute = monomials
+    pairs = [[int(exponent), str(value)] for exponent, value in monomials]
+    if absolute:
+        return {"abs": pairs}
+    return pairs
+
+
+def _deserialize_coefficient(ring, coefficient):
+    coefficient_ring = ring.coefficient_ring
+    if isinstance(coefficient, str):
+        return coefficient_ring(SR(coefficient))
+
+    if coefficient_ring is SR:
+        k = ring.term_monoid("exact").dependent_variable
+        absolute = isinstance(coefficient, dict)
+        monomials = coefficient["abs"] if absolute else coefficient
+        return _symbolic_from_monomials(
+            [(exponent, _deserialize_number(value)) for exponent, value in monomials],
+            k,
+            absolute,
+        )
+
+    k = coefficient_ring.gen()
+    return sum(
+        (QQ(value) * k**exponent for exponent, value in coefficient),
+        coefficient_ring.zero(),
+    )
+
+
+def _serialize_summand(summand):
+    dependent_variable = summand.parent().dependent_variable
+    if isinstance(summand, BTerm):
+        valid_from = {
+            str(variable): _serialize_number(value)
+            for variable, value in summand.valid_from.items()
+        }
+        return [
+            "B",
+            str(summand.growth),
+            _serialize_coefficient(summand.coefficient, dependent_variable),
+            valid_from,
+        ]
+    if isinstance(summand, OTerm):
+        return ["O", str(summand.growth), None, None]
+    if isinstance(summand, ExactTerm):
+        return [
+            "exact",
+            str(summand.growth),
+            _serialize_coefficient(summand.coefficient, dependent_variable),
+            None,
+        ]
+    raise ValueError(f"Cannot serialize the summand {summand}.")
+
+
+def _deserialize_summand(ring, summand):
+    term_type, growth, coefficient, valid_from = summand
+    growth = ring.growth_group(growth)
+    term_monoid = ring.term_monoid(term_type)
+    if term_type == "O":
+        return term_monoid(growth)
+    coefficient = _deserialize_coefficient(ring, coefficient)
+    if term_type == "B":
+        valid_from = {
+            variable: _deserialize_number(value)
+            for variable, value in valid_from.items()
+        }
+        return term_monoid._element_without_simplification_(
+            growth, coefficient, valid_from
+        )
+    return term_monoid(growth, coefficient=coefficient)
+
+
+def serialize_expansion(expansion: AsymptoticExpansion) -> str:
+    """Serialize an expansion in an asymptotic ring with a dependent
+    variable to a JSON string.
+
+    INPUT:
+
+    - ``expansion`` -- an asymptotic expansion whose parent has been
+      constructed by :func:`.AsymptoticRingWithDependentVariable`.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: asy = k*n + O(n^(-1)) + A.B(k^2/n^2, valid_from=10)
+        sage: data = dbt.serialize_expansion(asy)
+        sage: data
+        '{"version": 2, "ring": {"growth_group": "n^QQ", ..., "summands": [...]}'
+        sage: dbt.deserialize_expansion(data)
+        k*n + O(n^(-1))
+        sage: dbt.deserialize_expansion(dbt.serialize_expansion(k*n + A.B(k/n, valid_from=10)))
+        k*n + B(abs(k)*n^(-1), n >= 10)
+
+    ::
+
+        sage: P, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2,
+        ....:     polynomial_coefficients=True)
+        sage: asy = (k^2 + 1/k)*n + P.B(k/n, valid_from=5)
+        sage: result = dbt.deserialize_expansion(dbt.serialize_expansion(asy))
+        sage: str(result) == str(asy), result.parent() is P
+        (True, True)
+
+    TESTS::
+
+        sage: dbt.serialize_expansion(AsymptoticRing('n^QQ', QQ).gen())
+        Traceback (most recent call last):
+        ...
+        ValueError: Asymptotic Ring <n^QQ> over Rational Field does not have a dependent variable.
+    """
+    return json.dumps(
+        {
+            "version": SERIALIZATION_VERSION,
+            "ring": _ring_parameters(expansion.parent()),
+            "summands": [
+                _serialize_summand(summand)
+                for summand in expansion.summands.elements_topological()
+            ],
+        }
+    )
+
+
+def deserialize_expansion(data: str) -> AsymptoticExpansion:
+    """Reconstruct an expansion serialized by :func:`serialize_expansion`.
+
+    INPUT:
+
+    - ``data`` -- a JSON string.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2,
+        ....:     bterm_round_to=2)
+        sage: asy = dbt.taylor_with_explicit_error(exp, k/n, order=3, valid_from=10)
+        sage: result = dbt.deserialize_expansion(dbt.serialize_expansion(asy))
+        sage: result
+        1 + k*n^(-1) + 1/2*k^2*n^(-2) + B(abs(k)^3*n^(-3), n >= 10)
+        sage: str(result) == str(asy), result.parent() is A
+        (True, True)
+
+    TESTS:
+
+    Coefficients of B-terms are restored as they are, even if
+    constructing the B-term would bound or round them::
+
+        sage: g = A.growth_group.gen()
+        sage: term = A.term_monoid('B')._element_without_simplification_(g^-1, k/3 + 1, 10)
+        sage: asy = dbt.expansion_from_terms(A, [term], convert=False)
+        sage: data = dbt.serialize_expansion(asy)
+        sage: '[[0, "1"], [1, "1/3"]]' in data
+        True
+        sage: result = dbt.deserialize_expansion(data)
+        sage: result, A.B(k/(3*n) + 1/n, valid_from=10)
+        (B((1/3*k + 1)*n^(-1), n >= 10), B((abs(17/50*k + 1))*n^(-1), n >= 10))
+        sage: str(result) == str(asy)
+        True
+
+    ::
+
+        sage: dbt.deserialize_expansion('{"version": 0}')
+        Traceback (most recent call last):
+        ...
+        ValueError: Unsupported serialization version 0.
+    """
+    document = json.loads(data)
+    version = document.get("version")
+    if version not in _SUPPORTED_VERSIONS:
+        raise ValueError(f"Unsupported serialization version {version}.")
+
+    ring, _, _ = _ring_from_parameters(document["ring"])
+    terms = [_deserialize_summand(ring, summand) for summand in document["summands"]]
+    return expansion_from_terms(ring, terms, simplify=False, convert=False)
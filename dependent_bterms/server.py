@@ -0,0 +1,604 @@
+"""A long-running server for computations with explicit error bounds.
+
+Starting Sage and constructing asymptotic rings takes considerably
+longer than most individual computations. The :class:`ExpansionServer`
+keeps a pool of worker processes in which Sage has been imported, and
+in which the constructed rings (together with their caches) stay alive
+between requests.
+
+The server speaks JSON-RPC 2.0, with one request or response per line,
+either via standard input and output or via a Unix socket (which can be
+used by several clients at the same time). Run it as::
+
+    python -m dependent_bterms.server [--socket PATH] [--workers N]
+
+The following methods are supported:
+
+- ``build_ring`` -- constructs the ring with the given parameters, which
+  are the arguments of :func:`.AsymptoticRingWithDependentVariable`
+  (``growth_group``, ``dependent_variable``, ``lower_bound_power``,
+  ``upper_bound_power``, and optionally ``lower_bound_factor``,
+  ``upper_bound_factor``, ``bterm_round_to``, ``growth_cache_size``,
+  ``polynomial_coefficients`` and ``default_prec``). Returns all
+  parameters of the ring. The ring is only constructed in the worker
+  process handling the request; every other worker constructs it when
+  it first handles a request involving the ring, so ``build_ring`` is
+  mainly useful to validate parameters and to normalize them.
+
+- ``taylor_with_explicit_error`` -- with parameters ``function``, ``term``
+  and optionally ``order``, ``valid_from`` and ``round_constant``.
+
+- ``simplify_expansion`` -- with parameters ``expansion`` and optionally
+  ``simplify_bterm_growth``.
+
+- ``expansion_upper_bound`` -- with parameters ``expansion`` and
+  optionally ``numeric`` and ``valid_from``.
+
+Functions are given as strings like ``"exp"`` or ``"1/(1 - z)"``, in
+terms of the variable ``z``. Expansions are given either in the format
+of :func:`.serialize_expansion`, or as an object with the keys ``ring``
+(the parameters of the ring) and ``expression`` (a string like
+``"k/n + B(k^2/n^2, valid_from=10)"``, which is evaluated by Sage, so
+the server must only be exposed to trusted clients). Resulting
+expansions are returned in the format of :func:`.serialize_expansion`,
+numeric bounds as strings.
+
+Invalid input (like a malformed expression, or an expansion for which
+the requested bound cannot be constructed) results in an error response
+with the code ``-32000``. Any other exception is considered a bug: its
+traceback is logged and an error response with the code ``-32603`` is
+returned. The same code is returned for requests whose worker process
+terminated abruptly; the server then continues with new workers.
+
+TESTS::
+
+    sage: import dependent_bterms as dbt
+    sage: AR, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+    sage: AR.B(k*n)
+    doctest:warning
+    ...
+    FutureWarning: ...
+    ...
+    B(abs(k)*n, n >= 0)
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import io
+import json
+import logging
+import os
+import socketserver
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# the server usually runs outside of a Sage session; the symbolic
+# functions have to be set up before the symbolic ring is used
+import sage.functions.all  # noqa: F401
+from sage.misc.sage_eval import sage_eval
+from sage.rings.big_oh import O
+from sage.rings.integer_ring import ZZ
+from sage.symbolic.expression import Expression
+from sage.symbolic.ring import SR
+
+from .disk_cache import enable_disk_cache
+from .serialization import (
+    _deserialize_number,
+    _ring_from_parameters,
+    _ring_parameters,
+    deserialize_expansion,
+    serialize_expansion,
+)
+from .utils import expansion_upper_bound, simplify_expansion, taylor_with_explicit_error
+
+__all__ = [
+    "ExpansionServer",
+]
+
+
+# JSON-RPC 2.0 error codes
+_PARSE_ERROR = -32700
+_INVALID_REQUEST = -32600
+_METHOD_NOT_FOUND = -32601
+_INVALID_PARAMS = -32602
+_INTERNAL_ERROR = -32603
+_SERVER_ERROR = -32000
+
+# exceptions caused by invalid parameters of a request; the parser of
+# sage_eval raises SyntaxError, unknown names raise NameError
+_INPUT_ERRORS = (ValueError, TypeError, ArithmeticError, SyntaxError, NameError)
+
+_logger = logging.getLogger(__name__)
+
+
+def _initialize_worker(cache_directory):
+    if cache_directory is not None:
+        enable_disk_cache(cache_directory)
+
+
+def _parse_function(function: str):
+    """Return the callable described by a string like ``'exp'`` or
+    ``'1/(1 - z)'``.
+
+    Internal helper function.
+    """
+    z = SR.var("z")
+    f = sage_eval(function, locals={"z": z})
+    if callable(f) and not isinstance(f, Expression):
+        return f
+    return SR(f).function(z)
+
+
+def _parse_expansion(expansion):
+    """Return the expansion described by the parameters of a request.
+
+    Internal helper function.
+    """
+    if isinstance(expansion, str):
+        return deserialize_expansion(expansion)
+    if isinstance(expansion, dict) and "version" in expansion:
+        return deserialize_expansion(json.dumps(expansion))
+    if isinstance(expansion, dict) and set(expansion) == {"ring", "expression"}:
+        ring, n, k = _ring_from_parameters(expansion["ring"])
+        variables = {str(n): n, str(k): k, "B": ring.B, "O": O}
+        return ring(sage_eval(expansion["expression"], locals=variables))
+    raise ValueError(f"Cannot interpret {expansion!r} as an expansion.")
+
+
+def _parse_valid_from(valid_from):
+    """Convert the (JSON) numbers in ``valid_from`` to Sage numbers.
+
+    Internal helper function.
+    """
+    if valid_from is None:
+        return None
+    if isinstance(valid_from, dict):
+        return {
+            variable: _deserialize_number(value)
+            for variable, value in valid_from.items()
+        }
+    return _deserialize_number(valid_from)
+
+
+def _serialized(expansion) -> dict:
+    return json.loads(serialize_expansion(expansion))
+
+
+def _build_ring(
+    growth_group,
+    dependent_variable,
+    lower_bound_power,
+    upper_bound_power,
+    lower_bound_factor=1,
+    upper_bound_factor=1,
+    bterm_round_to=None,
+    growth_cache_size=4096,
+    polynomial_coefficients=False,
+    default_prec=None,
+):
+    parameters = {name: value for name, value in locals().items() if value is not None}
+    ring, _, _ = _ring_from_parameters(parameters)
+    return _ring_parameters(ring)
+
+
+def _taylor_with_explicit_error(
+    function, term, order=None, valid_from=None, round_constant=True
+):
+    return _serialized(
+        taylor_with_explicit_error(
+            _parse_function(function),
+            _parse_expansion(term),
+            order=None if order is None else ZZ(order),
+            valid_from=_parse_valid_from(valid_from),
+            round_constant=round_constant,
+        )
+    )
+
+
+def _simplify_expansion(expansion, simplify_bterm_growth=False):
+    return _serialized(
+        simplify_expansion(
+            _parse_expansion(expansion), simplify_bterm_growth=simplify_bterm_growth
+        )
+    )
+
+
+def _expansion_upper_bound(expansion, numeric=False, valid_from=None):
+    bound = expansion_upper_bound(
+        _parse_expansion(expansion),
+        numeric=numeric,
+        valid_from=_parse_valid_from(valid_from),
+    )
+    if numeric:
+        return str(bound)
+    return _serialized(bound)
+
+
+_METHODS = {
+    "build_ring": _build_ring,
+    "taylor_with_explicit_error": _taylor_with_explicit_error,
+    "simplify_expansion": _simplify_expansion,
+    "expansion_upper_bound": _expansion_upper_bound,
+}
+
+
+def _error(request_id, code, message):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message},
+    }
+
+
+def _handle_request(line: str) -> str | None:
+    """Process a single JSON-RPC request and return the response,
+    or ``None`` for notifications.
+
+    Internal helper function.
+    """
+    try:
+        request = json.loads(line)
+    except ValueError as error:
+        return json.dumps(_error(None, _PARSE_ERROR, f"Parse error: {error}"))
+
+    if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+        return json.dumps(_error(None, _INVALID_REQUEST, "Invalid request."))
+    request_id = request.get("id")
+    method = _METHODS.get(request["method"])
+    params = request.get("params", {})
+
+    if method is None:
+        response = _error(
+            request_id, _METHOD_NOT_FOUND, f"Unknown method {request['method']!r}."
+        )
+    elif not isinstance(params, dict):
+        response = _error(request_id, _INVALID_PARAMS, "Parameters must be named.")
+    else:
+        try:
+            inspect.signature(method).bind(**params)
+        except TypeError as error:
+            response = _error(request_id, _INVALID_PARAMS, str(error))
+        else:
+            try:
+                result = method(**params)
+            except _INPUT_ERRORS as error:
+                response = _error(request_id, _SERVER_ERROR, str(error))
+            except Exception as error:
+                _logger.exception("Internal error while handling %s", request["method"])
+                response = _error(
+                    request_id,
+                    _INTERNAL_ERROR,
+                    f"Internal error: {type(error).__name__}: {error}",
+                )
+            else:
+                response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    if "id" not in request:
+        return None
+    return json.dumps(response)
+
+
+def _broken_pool_response(line: str, error) -> str | None:
+    """Return the response to a request whose worker process terminated
+    abruptly, or ``None`` for notifications.
+
+    Internal helper function.
+    """
+    try:
+        request = json.loads(line)
+    except ValueError:
+        request = None
+    if not isinstance(request, dict) or "id" not in request:
+        return None
+    return json.dumps(
+        _error(
+            request["id"],
+            _INTERNAL_ERROR,
+            f"Internal error: {type(error).__name__}: {error}",
+        )
+    )
+
+
+class _StreamRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        reader = io.TextIOWrapper(self.rfile, encoding="utf-8")
+        writer = io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+        try:
+            self.server.expansion_server.serve_stream(reader, writer)
+        finally:
+            reader.detach()
+            writer.detach()
+
+
+class ExpansionServer:
+    r"""A server answering JSON-RPC requests for computations with
+    asymptotic expansions on a pool of warm worker processes.
+
+    See the documentation of the module :mod:`dependent_bterms.server`
+    for the supported methods.
+
+    INPUT:
+
+    - ``max_workers`` -- the number of worker processes, or ``None``
+      (the default) for the number of processors of the machine.
+
+    - ``cache_directory`` -- a directory or ``None`` (the default). If
+      given, the workers store their results persistently in this
+      directory, see :func:`.enable_disk_cache`.
+
+    - ``mp_context`` -- the multiprocessing context of the worker pool.
+
+    EXAMPLES::
+
+        sage: import io, json
+        sage: import dependent_bterms as dbt
+        sage: from dependent_bterms.server import ExpansionServer
+        sage: ring = {'growth_group': 'n^QQ', 'dependent_variable': 'k',
+        ....:         'lower_bound_power': 0r, 'upper_bound_power': '1/2'}
+        sage: requests = [
+        ....:     {'jsonrpc': '2.0', 'id': 1r, 'method': 'build_ring', 'params': ring},
+        ....:     {'jsonrpc': '2.0', 'id': 2r, 'method': 'taylor_with_explicit_error',
+        ....:      'params': {'function': 'exp', 'order': 3r, 'valid_from': 10r,
+        ....:                 'term': {'ring': ring, 'expression': 'k/n'}}},
+        ....:     {'jsonrpc': '2.0', 'id': 3r, 'method': 'expansion_upper_bound',
+        ....:      'params': {'numeric': True, 'expansion': {
+        ....:          'ring': ring, 'expression': 'k/n + B(1/n^2, valid_from=10)'}}},
+        ....:     {'jsonrpc': '2.0', 'id': 4r, 'method': 'simplify', 'params': {}},
+        ....: ]
+        sage: reader = io.StringIO(''.join(json.dumps(r) + '\n' for r in requests))
+        sage: writer = io.StringIO()
+        sage: with ExpansionServer(max_workers=2) as server:
+        ....:     server.serve_stream(reader, writer)
+        sage: responses = sorted(map(json.loads, writer.getvalue().splitlines()),
+        ....:                    key=lambda response: response['id'])
+        sage: responses[0]['result']['upper_bound_power']
+        '1/2'
+        sage: result = dbt.deserialize_expansion(json.dumps(responses[1]['result']))
+        sage: result
+        1 + k*n^(-1) + 1/2*k^2*n^(-2) + B(abs(k)^3*n^(-3), n >= 10)
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: str(result) == str(dbt.taylor_with_explicit_error(exp, k/n, 3, 10))
+        True
+        sage: responses[2]['result']
+        '1/10*sqrt(10) + 1/100'
+        sage: responses[3]['error']
+        {'code': -32601, 'message': "Unknown method 'simplify'."}
+
+    The server can also be used via the command line, reading requests
+    from the standard input::
+
+        sage: import subprocess, sys
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: asy = A.B((k + 1)/n, valid_from=10)
+        sage: request = {'jsonrpc': '2.0', 'id': 1r, 'method': 'simplify_expansion',
+        ....:            'params': {'expansion': dbt.serialize_expansion(asy),
+        ....:                       'simplify_bterm_growth': True}}
+        sage: output = subprocess.run(
+        ....:     [sys.executable, '-m', 'dependent_bterms.server', '--workers', '1'],
+        ....:     input=json.dumps(request) + '\n', capture_output=True, text=True).stdout
+        sage: result = dbt.deserialize_expansion(json.dumps(json.loads(output)['result']))
+        sage: str(result) == str(dbt.simplify_expansion(asy, simplify_bterm_growth=True))
+        True
+
+    TESTS::
+
+        sage: from dependent_bterms.server import _handle_request
+        sage: _handle_request('{"id": 1')
+        '{"jsonrpc": "2.0", "id": null, "error": {"code": -32700, "message": "Parse error: ..."}}'
+        sage: _handle_request('{"id": 1, "method": "build_ring", "params": {"k": 1}}')
+        '{"jsonrpc": "2.0", "id": 1, "error": {"code": -32602, "message": "missing a required argument: \'growth_group\'"}}'
+        sage: _handle_request(json.dumps({'id': 1r, 'method': 'expansion_upper_bound',
+        ....:     'params': {'expansion': {'ring': ring, 'expression': '1 + O(1/n)'}}}))
+        '{"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "No same-order bound can be constructed for O(n^(-1))"}}'
+        sage: _handle_request(json.dumps({'id': 1r, 'method': 'simplify_expansion',
+        ....:     'params': {'expansion': {'ring': ring, 'expression': 'k/n +'}}}))
+        '{"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "invalid syntax..."}}'
+        sage: _handle_request('{"method": "build_ring", "params": {}}') is None
+        True
+
+    Unexpected exceptions are logged::
+
+        sage: import logging
+        sage: from dependent_bterms import server
+        sage: def broken():
+        ....:     raise RuntimeError('oops')
+        sage: server._METHODS['broken'] = broken
+        sage: class Handler(logging.Handler):
+        ....:     def emit(self, record):
+        ....:         print(record.getMessage(), record.exc_info[0].__name__)
+        sage: handler = Handler()
+        sage: server._logger.addHandler(handler)
+        sage: _handle_request('{"id": 1, "method": "broken"}')
+        Internal error while handling broken RuntimeError
+        '{"jsonrpc": "2.0", "id": 1, "error": {"code": -32603, "message": "Internal error: RuntimeError: oops"}}'
+        sage: server._logger.removeHandler(handler)
+        sage: del server._METHODS['broken']
+
+    If a worker process terminates abruptly, the request fails and
+    the server continues with new workers::
+
+        sage: class Handler(logging.Handler):
+        ....:     def emit(self, record):
+        ....:         print(record.getMessage())
+        sage: handler = Handler()
+        sage: server._logger.addHandler(handler)
+        sage: server._METHODS['exit'] = lambda: os._exit(1r)
+        sage: with ExpansionServer(max_workers=1) as expansion_server:
+        ....:     writer = io.StringIO()
+        ....:     expansion_server.serve_stream(
+        ....:         io.StringIO('{"id": 1, "method": "exit"}\n'), writer)
+        ....:     expansion_server.serve_stream(io.StringIO(json.dumps(
+        ....:         {'id': 2r, 'method': 'build_ring', 'params': ring}) + '\n'), writer)
+        Worker process terminated abruptly
+        Worker pool is broken, starting new workers
+        sage: first, second = map(json.loads, writer.getvalue().splitlines())
+        sage: first['error']['code'], second['result']['upper_bound_power']
+        (-32603, '1/2')
+        sage: server._logger.removeHandler(handler)
+        sage: del server._METHODS['exit']
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        cache_directory=None,
+        mp_context=None,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor_arguments = {
+            "max_workers": self.max_workers,
+            "mp_context": mp_context,
+            "initializer": _initialize_worker,
+            "initargs": (cache_directory,),
+        }
+        self._executor = ProcessPoolExecutor(**self._executor_arguments)
+        self._executor_lock = threading.Lock()
+        self._socket_server = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def submit(self, request: str):
+        r"""Submit a JSON-RPC request (a string) to the worker pool.
+
+        Returns a :class:`concurrent.futures.Future` of the response,
+        which is ``None`` for notifications.
+
+        If a worker process has terminated abruptly, the pending requests
+        fail with :class:`concurrent.futures.process.BrokenProcessPool`
+        and the worker pool is replaced by a new one.
+        """
+        executor = self._executor
+        try:
+            return executor.submit(_handle_request, request)
+        except BrokenProcessPool:
+            return self._replace_executor(executor).submit(_handle_request, request)
+
+    def _replace_executor(self, broken_executor):
+        """Replace the given broken worker pool by a new one (unless
+        this has already happened) and return the current pool.
+        """
+        with self._executor_lock:
+            if self._executor is broken_executor:
+                _logger.error("Worker pool is broken, starting new workers")
+                self._executor = ProcessPoolExecutor(**self._executor_arguments)
+                broken_executor.shutdown(wait=False)
+            return self._executor
+
+    def serve_stream(self, reader, writer):
+        r"""Answer the requests read line by line from ``reader`` until
+        it is exhausted.
+
+        Requests are processed concurrently, every response is written to
+        ``writer`` as a single line as soon as it is available.
+        """
+        lock = threading.Lock()
+
+        def respond(line):
+            try:
+                response = self.submit(line).result()
+            except BrokenProcessPool as error:
+                _logger.exception("Worker process terminated abruptly")
+                response = _broken_pool_response(line, error)
+            if response is not None:
+                with lock:
+                    writer.write(response + "\n")
+                    writer.flush()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as responders:
+            for line in reader:
+                if line.strip():
+                    responders.submit(respond, line)
+
+    def serve_unix_socket(self, path):
+        r"""Listen on the Unix socket ``path`` and answer the requests of
+        all connecting clients, until :meth:`shutdown` is called.
+
+        EXAMPLES::
+
+            sage: import json, os, socket, threading
+            sage: import dependent_bterms as dbt
+            sage: from dependent_bterms.server import ExpansionServer
+            sage: path = os.path.join(tmp_dir(), 'expansions.sock')
+            sage: server = ExpansionServer(max_workers=2)
+            sage: thread = threading.Thread(target=server.serve_unix_socket, args=(path,))
+            sage: thread.start()
+            sage: while not os.path.exists(path):
+            ....:     sleep(0.01r)
+            sage: def call(method, **params):
+            ....:     with socket.socket(socket.AF_UNIX) as client:
+            ....:         client.connect(path)
+            ....:         request = {'jsonrpc': '2.0', 'id': 0r, 'method': method,
+            ....:                    'params': params}
+            ....:         client.sendall((json.dumps(request) + '\n').encode())
+            ....:         return json.loads(client.makefile().readline())['result']
+            sage: ring = {'growth_group': 'n^QQ', 'dependent_variable': 'k',
+            ....:         'lower_bound_power': 0r, 'upper_bound_power': '1/2'}
+            sage: result = call('taylor_with_explicit_error', function='1/(1 - z)',
+            ....:               term={'ring': ring, 'expression': 'k/n'},
+            ....:               order=3r, valid_from=10r)
+            sage: dbt.deserialize_expansion(json.dumps(result))
+            1 + k*n^(-1) + k^2*n^(-2) + B(5*abs(k)^3*n^(-3), n >= 10)
+            sage: server.shutdown()
+            sage: thread.join()
+        """
+        with socketserver.ThreadingUnixStreamServer(
+            path, _StreamRequestHandler, bind_and_activate=False
+        ) as socket_server:
+            socket_server.expansion_server = self
+            self._socket_server = socket_server
+            socket_server.server_bind()
+            socket_server.server_activate()
+            try:
+                socket_server.serve_forever()
+            finally:
+                os.unlink(path)
+
+    def shutdown(self):
+        r"""Stop serving on the Unix socket (if any) and shut down
+        the worker pool.
+        """
+        if self._socket_server is not None:
+            self._socket_server.shutdown()
+            self._socket_server = None
+        self._executor.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m dependent_bterms.server",
+        description="Answer JSON-RPC requests for computations with "
+        "asymptotic expansions, one request per line.",
+    )
+    parser.add_argument(
+        "--socket",
+        help="listen on this Unix socket instead of the standard input",
+    )
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    parser.add_argument(
+        "--cache-dir", help="store results persistently in this directory"
+    )
+    arguments = parser.parse_args(argv)
+
+    with ExpansionServer(
+        max_workers=arguments.workers, cache_directory=arguments.cache_dir
+    ) as server:
+        if arguments.socket is None:
+            server.serve_stream(sys.stdin, sys.stdout)
+        else:
+            try:
+                server.serve_unix_socket(arguments.socket)
+            except KeyboardInterrupt:
+                pass
+
+
+if __name__ == "__main__":
+    main()
@@ -18,25 +18,34 @@ TESTS::
 
 from __future__ import annotations
 
+import operator
 
-from sage.functions.other import ceil
-from sage.rings.asymptotic.asymptotic_ring import AsymptoticRing
+from sage.functions.other import abs_symbolic, ceil
+from sage.rings.asymptotic.asymptotic_ring import (
+    AsymptoticExpansion,
+    AsymptoticRing,
+)
 from sage.rings.asymptotic.term_monoid import (
-    BTermMonoid,
     BTerm,
+    BTermMonoid,
+    ExactTerm,
     ExactTermMonoid,
-    OTermMonoid,
     OTerm,
+    OTermMonoid,
+    TermMonoidFactory,
     TermWithCoefficient,
-    ExactTerm,
 )
+from sage.rings.integer_ring import ZZ
+from sage.rings.rational_field import QQ
+from sage.rings.real_mpfi import RIF
 from sage.symbolic.assumptions import assuming
 from sage.symbolic.expression import Expression
-from sage.symbolic.operators import add_vararg
-
+from sage.symbolic.operators import add_vararg, mul_vararg
 from sage.symbolic.ring import SR
 
-from .utils import evaluate
+from .caching import LRUCache
+from .fast_evaluation import evaluate
+from .instrumentation import _instrumented
 
 
 def _verify_variable_and_bounds(dependent_variable, lower_bound, upper_bound):
@@ -45,7 +54,10 @@ def _verify_variable_and_bounds(dependent_variable, lower_bound, upper_bound):
 
     Internal helper function.
     """
-    if not dependent_variable.is_symbol():
+    if isinstance(dependent_variable, Expression):
+        if not dependent_variable.is_symbol():
+            raise ValueError("A suitable dependent variable must be passed.")
+    elif dependent_variable not in dependent_variable.parent().gens():
         raise ValueError("A suitable dependent variable must be passed.")
 
     if lower_bound is None or upper_bound is None:
@@ -54,6 +66,490 @@ def _verify_variable_and_bounds(dependent_variable, lower_bound, upper_bound):
         )
 
 
+class CoefficientGrowthCache(LRUCache):
+    """Bounded least-recently-used cache for the growth ranges of
+    term coefficients.
+
+    One instance is shared by all term monoids of a ring with a
+    dependent variable; it maps a (normalized) coefficient to the pair
+    of growths obtained by substituting the lower and the upper bound
+    of the dependent variable.
+
+    TESTS::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: cache = A.term_monoid('exact').coefficient_growth_cache
+        sage: cache is A.term_monoid('O').coefficient_growth_cache
+        True
+        sage: cache is A.term_monoid('B').coefficient_growth_cache
+        True
+        sage: cache.clear()
+        sage: O(k^3*n)
+        O(n^(5/2))
+        sage: O(k^3/n)
+        O(n^(1/2))
+        sage: cache.info()['hits'] >= 1
+        True
+    """
+
+    def __init__(self, maxsize=4096):
+        super().__init__(maxsize=maxsize, name="coefficient_growth")
+
+
+def _is_dependent_polynomial(coefficient, dependent_variable):
+    """Return whether the coefficient is an element of the (Laurent)
+    polynomial ring generated by the dependent variable.
+
+    Internal helper function.
+    """
+    return (
+        not isinstance(coefficient, Expression)
+        and coefficient.parent() is dependent_variable.parent()
+    )
+
+
+def _depends_on(coefficient, dependent_variable):
+    """Return whether the coefficient contains the dependent variable.
+
+    Internal helper function.
+    """
+    if isinstance(coefficient, Expression):
+        return dependent_variable in coefficient.variables()
+    if _is_dependent_polynomial(coefficient, dependent_variable):
+        return any(p != 0 for p in coefficient.dict())
+    return False
+
+
+def _constant_sign(constant):
+    """Return the sign of a symbolic constant, or ``None`` if
+    it cannot be determined numerically.
+
+    Internal helper function.
+    """
+    if constant.is_zero():
+        return 0
+    try:
+        enclosure = RIF(constant)
+    except (TypeError, ValueError):
+        return None
+    if enclosure.lower() > 0:
+        return 1
+    if enclosure.upper() < 0:
+        return -1
+    return None
+
+
+def _known_sign(expression, dependent_variable):
+    """Return the sign of a symbolic expression under the assumption
+    that the dependent variable is positive, or ``None`` if the sign
+    cannot be decided without further simplification.
+
+    The sign is known for constants and for polynomials in the dependent
+    variable whose coefficients all have the same sign.
+
+    Internal helper function.
+    """
+    variables = expression.variables()
+    if not variables:
+        return _constant_sign(expression)
+    if len(variables) != 1 or not variables[0].is_trivially_equal(dependent_variable):
+        return None
+
+    signs = set()
+    for c, _ in expression.expand().coefficients(dependent_variable):
+        if SR(c).variables():
+            return None
+        signs.add(_constant_sign(SR(c)))
+    signs.discard(0)
+    if len(signs) != 1 or None in signs:
+        return None
+    [sign] = signs
+    return sign
+
+
+def _simplify_positive_natively(expression, dependent_variable):
+    """Simplify an expression under the assumption that the dependent
+    variable is positive by resolving absolute values of subexpressions
+    with known sign.
+
+    Returns ``None`` if the expression contains constructions that
+    cannot be handled.
+
+    Internal helper function.
+    """
+    op = expression.operator()
+    if op is None:
+        return expression
+
+    operands = expression.operands()
+    if op is operator.pow:
+        base, exponent = operands
+        if base.is_trivially_equal(abs_symbolic(dependent_variable)):
+            # the dependent variable is nonnegative
+            base = dependent_variable
+            operands = [base, exponent]
+        if not (
+            exponent in ZZ
+            or base.is_trivially_equal(dependent_variable)
+            or (not base.variables() and _constant_sign(base) == 1)
+        ):
+            return None
+    elif op is not abs_symbolic and op is not add_vararg and op is not mul_vararg:
+        return None
+
+    simplified_operands = []
+    for operand in operands:
+        simplified = _simplify_positive_natively(operand, dependent_variable)
+        if simplified is None:
+            return None
+        simplified_operands.append(simplified)
+
+    if op is abs_symbolic:
+        [argument] = simplified_operands
+        sign = _known_sign(argument, dependent_variable)
+        if sign is None:
+            return None
+        return sign * argument
+    return op(*simplified_operands)
+
+
+def _simplify_assuming_positive(expression, dependent_variable):
+    """Simplify a symbolic expression under the assumption that the
+    dependent variable is positive.
+
+    Absolute values of monomials and of polynomials with coefficients
+    of known sign are resolved directly; only if this is not possible,
+    the expression is simplified by Maxima.
+
+    Internal helper function.
+
+    TESTS::
+
+        sage: from dependent_bterms.structures import _simplify_assuming_positive
+        sage: k = SR.var('k')
+        sage: _simplify_assuming_positive(abs(-3*k^2), k)
+        3*k^2
+        sage: expr = _simplify_assuming_positive(abs(k + 1)^2 + abs(pi - 4)*k, k)
+        sage: expr.has(abs(SR.wild())), bool(expr == (k + 1)^2 + (4 - pi)*k)
+        (False, True)
+        sage: _simplify_assuming_positive(abs(k - 1), k)
+        abs(k - 1)
+        sage: _simplify_assuming_positive(sqrt(k^2), k)
+        k
+        sage: _simplify_assuming_positive(abs(k + 1)*abs(k)^(-3/2), k)
+        (k + 1)/k^(3/2)
+    """
+    simplified = _simplify_positive_natively(expression, dependent_variable)
+    if simplified is not None:
+        return simplified
+
+    return _simplify_with_maxima(expression, dependent_variable)
+
+
+@_instrumented("assuming")
+def _simplify_with_maxima(expression, dependent_variable):
+    """Simplify a symbolic expression by Maxima under the assumption
+    that the dependent variable is positive.
+
+    Internal helper function.
+    """
+    with assuming(dependent_variable > 0):
+        return expression.simplify()
+
+
+def _canonical_expression(expression):
+    """Rebuild a symbolic expression from its operands.
+
+    Absolute values introduced by :class:`.BTerm` are kept in a held
+    form like ``abs(k^3)``, while the same expression is evaluated to
+    ``abs(k)^3`` whenever it is constructed from scratch (for example
+    when it is unpickled or parsed). Rebuilding the expression yields
+    the latter form, so that it does not change on such round trips.
+
+    Internal helper function.
+
+    TESTS::
+
+        sage: from dependent_bterms.structures import _canonical_expression
+        sage: k = SR.var('k')
+        sage: expr = abs(k^3/1000)
+        sage: expr, _canonical_expression(expr)
+        (1/1000*abs(k^3), 1/1000*abs(k)^3)
+        sage: bool(_canonical_expression(expr) == loads(dumps(expr)))
+        True
+        sage: str(_canonical_expression(expr)) == str(loads(dumps(expr)))
+        True
+    """
+    operator = expression.operator()
+    if operator is None:
+        return expression
+    return operator(
+        *(_canonical_expression(operand) for operand in expression.operands())
+    )
+
+
+def _coefficient_monomials(coefficient, dependent_variable):
+    """Return a list of pairs ``(c, p)`` such that the coefficient
+    is the sum of all ``c*k^p``, where ``k`` is the dependent variable.
+
+    Symbolic coefficients are simplified (assuming that the dependent
+    variable is positive) and expanded first.
+
+    Internal helper function.
+
+    TESTS::
+
+        sage: from dependent_bterms.structures import _coefficient_monomials
+        sage: k = SR.var('k')
+        sage: _coefficient_monomials((k + 1)^2, k)
+        [[1, 0], [2, 1], [1, 2]]
+        sage: L.<k> = LaurentPolynomialRing(QQ)
+        sage: sorted(_coefficient_monomials(2*k - 1/k, k), key=lambda m: m[1])
+        [(-1, -1), (2, 1)]
+    """
+    if _is_dependent_polynomial(coefficient, dependent_variable):
+        return [(c, p) for p, c in coefficient.dict().items()]
+    coefficient = _simplify_assuming_positive(SR(coefficient), dependent_variable)
+    return coefficient.expand().coefficients(dependent_variable)
+
+
+def _substitute_dependent_variable(coefficient, dependent_variable, value):
+    """Substitute the given value for the dependent variable in the
+    coefficient.
+
+    Internal helper function.
+    """
+    if _is_dependent_polynomial(coefficient, dependent_variable):
+        return sum(
+            (c * value**p for p, c in coefficient.dict().items()),
+            value.parent().zero(),
+        )
+    return evaluate(coefficient, **{str(dependent_variable): value})
+
+
+def _monomial_growth(expansion):
+    """Return the growth of the given expansion if it consists of
+    a single exact term, and ``None`` otherwise.
+
+    Internal helper function.
+    """
+    summands = list(expansion.summands)
+    if len(summands) != 1 or not summands[0].is_exact():
+        return None
+    return summands[0].growth
+
+
+def _laurent_degree_range(coefficient, dependent_variable):
+    """Return the minimal and maximal degree of the coefficient with
+    respect to the dependent variable if the coefficient is a Laurent
+    polynomial in this variable, and ``None`` otherwise.
+
+    Internal helper function.
+
+    TESTS::
+
+        sage: from dependent_bterms.structures import _laurent_degree_range
+        sage: k = SR.var('k')
+        sage: _laurent_degree_range((k + 1)^3, k)
+        (0, 3)
+        sage: _laurent_degree_range(pi*k^2 - 1/k, k)
+        (-1, 2)
+        sage: _laurent_degree_range(1/(1 + k^2), k) is None
+        True
+        sage: _laurent_degree_range(sqrt(k), k) is None
+        True
+    """
+    if _is_dependent_polynomial(coefficient, dependent_variable):
+        degrees = list(coefficient.dict())
+        if not degrees:
+            return None
+        return (min(degrees), max(degrees))
+
+    degrees = []
+    for c, p in coefficient.expand().coefficients(dependent_variable):
+        if p not in ZZ or dependent_variable in SR(c).variables():
+            return None
+        degrees.append(ZZ(p))
+    if not degrees:
+        return None
+    return (min(degrees), max(degrees))
+
+
+def _laurent_coefficient_growths(coefficient, dependent_variable, lower, upper):
+    """Determine the growths of the given coefficient when the dependent
+    variable is substituted by its lower and upper bound, respectively,
+    from the extremal degrees of the coefficient.
+
+    Returns ``None`` if the coefficient is not a Laurent polynomial in
+    the dependent variable or one of the bounds is not a monomial.
+
+    Internal helper function.
+    """
+    bound_growths = (_monomial_growth(lower), _monomial_growth(upper))
+    if any(growth is None for growth in bound_growths):
+        return None
+    degree_range = _laurent_degree_range(coefficient, dependent_variable)
+    if degree_range is None:
+        return None
+    low_degree, high_degree = degree_range
+    return tuple(
+        max(growth**low_degree, growth**high_degree) for growth in bound_growths
+    )
+
+
+def _compute_coefficient_growths(coefficient, dependent_variable, lower, upper):
+    """Determine the growths of the given coefficient when the dependent
+    variable is substituted by its lower and upper bound, respectively.
+
+    If the coefficient is a Laurent polynomial in the dependent variable
+    and both bounds are monomials, the growths are determined from the
+    extremal degrees directly. Otherwise, the bounds are substituted
+    into the coefficient.
+
+    Internal helper function.
+    """
+    growths = _laurent_coefficient_growths(
+        coefficient, dependent_variable, lower, upper
+    )
+    if growths is not None:
+        return growths
+    return _substituted_coefficient_growths(
+        coefficient, dependent_variable, lower, upper
+    )
+
+
+def _substituted_coefficient_growths(coefficient, dependent_variable, lower, upper):
+    """Determine the growths of the given coefficient by substituting
+    the lower and the upper bound of the dependent variable.
+
+    Internal helper function.
+    """
+    if _is_dependent_polynomial(coefficient, dependent_variable):
+        coef_simplified = coefficient
+    else:
+        coef_simplified = _simplify_assuming_positive(coefficient, dependent_variable)
+
+    growths = []
+    for bound in (lower, upper):
+        asy_bound = _substitute_dependent_variable(
+            coef_simplified, dependent_variable, bound
+        )
+        if asy_bound.is_zero():
+            asy_bound = bound.parent().one()
+        [bound_term] = list(asy_bound.O().summands)
+        growths.append(bound_term.growth)
+    return tuple(growths)
+
+
+def _growth_cache_key(coefficient, dependent_variable):
+    """Return a normalized key of the coefficient for the growth cache.
+
+    Polynomial coefficients are described by their exponents and
+    coefficients, symbolic ones by the representation of their
+    canonical (see :func:`_canonical_expression`), expanded form.
+
+    Internal helper function.
+    """
+    if _is_dependent_polynomial(coefficient, dependent_variable):
+        return tuple(sorted(coefficient.dict().items()))
+    return repr(_canonical_expression(coefficient).expand())
+
+
+def _growth_cache_scope(growth_group, lower, upper):
+    """Return the part of the growth cache keys that identifies the
+    growth group and the bounds of the dependent variable.
+
+    Internal helper function.
+    """
+    return (growth_group, repr(lower), repr(upper))
+
+
+def _coefficient_growth_range(parent, coefficient):
+    """Return the growths of ``coefficient`` at the lower and the upper
+    bound of the dependent variable, or ``None`` if the coefficient
+    does not depend on the dependent variable.
+
+    The results are stored in the growth cache shared by the term
+    monoids of the ring under the growth group of ``parent``, the
+    bounds of the dependent variable and the representation of the
+    coefficient.
+    Results which have to be determined by substituting the bounds
+    (rather than from the degrees of a Laurent polynomial) are also
+    stored under a normalized key (see :func:`_growth_cache_key`), so
+    that they are only computed once for equal coefficients.
+
+    Internal helper function.
+
+    TESTS:
+
+    The growths of equal coefficients are only computed by substitution
+    once, even if the coefficients are represented differently::
+
+        sage: import dependent_bterms as dbt
+        sage: from dependent_bterms.structures import _coefficient_growth_range
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: ET = A.term_monoid('exact')
+        sage: cache = ET.coefficient_growth_cache
+        sage: cache.clear()
+        sage: abs(k^3/1000)
+        1/1000*abs(k^3)
+        sage: _coefficient_growth_range(ET, abs(k^3/1000))
+        (1, n^(3/2))
+        sage: cache.info()['hits'], cache.info()['misses']
+        (0, 2)
+        sage: _coefficient_growth_range(ET, abs(k)^3/1000)
+        (1, n^(3/2))
+        sage: cache.info()['hits'], cache.info()['misses']
+        (1, 2)
+        sage: _coefficient_growth_range(ET, abs(k)*(k + 1)^2)
+        (1, n^(3/2))
+        sage: _coefficient_growth_range(ET, abs(k)*(k^2 + 2*k + 1))
+        (1, n^(3/2))
+        sage: cache.info()['hits'], cache.info()['misses']
+        (2, 5)
+
+    Monoids with different bounds of the dependent variable can share
+    a cache::
+
+        sage: from dependent_bterms.structures import (
+        ....:     CoefficientGrowthCache, MonBoundExactTermMonoidFactory)
+        sage: from sage.rings.asymptotic.term_monoid import DefaultTermMonoidFactory as TMF
+        sage: B.<m> = AsymptoticRing('m^QQ', SR)
+        sage: cache = CoefficientGrowthCache()
+        sage: ET1 = MonBoundExactTermMonoidFactory(k, B(1), m, growth_cache=cache)(
+        ....:     TMF, B.growth_group, SR)
+        sage: ET2 = MonBoundExactTermMonoidFactory(k, B(1), m^2, growth_cache=cache)(
+        ....:     TMF, B.growth_group, SR)
+        sage: _coefficient_growth_range(ET1, k^2), _coefficient_growth_range(ET2, k^2)
+        ((1, m^2), (1, m^4))
+    """
+    dependent_variable, lower, upper = parent.variable_bounds
+    if not _depends_on(coefficient, dependent_variable):
+        return None
+
+    cache = parent.coefficient_growth_cache
+    scope = parent.coefficient_growth_cache_scope
+
+    def compute():
+        growths = _laurent_coefficient_growths(
+            coefficient, dependent_variable, lower, upper
+        )
+        if growths is not None:
+            return growths
+        # substituting the bounds is expensive; equal coefficients
+        # represented differently share the result
+        return cache.lookup(
+            (scope, _growth_cache_key(coefficient, dependent_variable)),
+            lambda: _substituted_coefficient_growths(
+                coefficient, dependent_variable, lower, upper
+            ),
+        )
+
+    return cache.lookup((scope, repr(coefficient)), compute)
+
+
+@_instrumented("element_key")
 def _element_key(element):
     """Determine the key for sorting the given element into the poset
     underlying an asymptotic expansion.
@@ -65,61 +561,273 @@ def _element_key(element):
     The second component is the element growth (regardless of any coefficient).
     """
     growth_bound = None
-    if hasattr(element.parent(), "variable_bounds"):
-        bound_var, lower, upper = element.parent().variable_bounds
+    if hasattr(element.parent(), "variable_bounds") and isinstance(
+        element, TermWithCoefficient
+    ):
+        coef_growths = _coefficient_growth_range(element.parent(), element.coefficient)
+        if coef_growths is not None:
+            growth_bound = max(coef_growths) * element.growth
 
-        if isinstance(element, TermWithCoefficient):
-            coef = element.coefficient
+    if growth_bound is None:
+        growth_bound = element.growth
 
-            if isinstance(coef, Expression) and bound_var in coef.variables():
-                with assuming(bound_var > 0):
-                    coef_simplified = coef.simplify()
+    return (growth_bound, element.growth)
 
-                bounds = []
-                for bound in [lower, upper]:
-                    asy_bound = evaluate(coef_simplified, **{str(bound_var): bound})
-                    if asy_bound.is_zero():
-                        asy_bound = bound.parent().one()
-                    bounds.append(asy_bound.O())
 
-                coef_bound = max(bounds, key=lambda expr: list(expr.summands)[0].growth)
-                [coef_bound_term] = list(coef_bound.summands)
-                growth_bound = coef_bound_term.growth * element.growth
+def _convert_term(ring, term):
+    """Convert the given term to the corresponding term monoid
+    of the given asymptotic ring.
 
-    if growth_bound is None:
-        growth_bound = element.growth
+    Internal helper function.
+    """
+    from sage.rings.asymptotic.misc import combine_exceptions
+
+    try:
+        return ring.term_monoid(term.parent())(term)
+    except (ArithmeticError, TypeError, ValueError) as e:
+        raise combine_exceptions(
+            ValueError(f"Cannot include {term} with parent {term.parent()} in {ring}"),
+            e,
+        )
 
-    return (growth_bound, element.growth)
 
+class AsymptoticExpansionWithCustomPosetKey(AsymptoticExpansion):
+    """Asymptotic expansion whose summands are stored in a poset
+    ordered by :func:`_element_key`.
 
-class AsymptoticRingWithCustomPosetKey(AsymptoticRing):
-    """Asymptotic ring that constructs its expansions using a custom
-    poset key.
+    Summands are converted and inserted into a poset with the
+    custom key right away, so that every expansion is only
+    constructed once.
+
+    TESTS::
+
+        sage: import dependent_bterms as dbt
+        sage: from dependent_bterms.structures import _element_key
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: asy = A(k*n^2 + k^4*n)
+        sage: asy
+        k^4*n + k*n^2
+        sage: asy.summands._key_ is _element_key
+        True
+        sage: (asy * asy).summands._key_ is _element_key
+        True
+        sage: loads(dumps(asy))
+        k^4*n + k*n^2
     """
 
-    def _element_constructor_(self, data, simplify=True, convert=True):
-        from sage.data_structures.mutable_poset import MutablePoset
-        from sage.rings.asymptotic.term_monoid import can_absorb, absorption
+    def __init__(self, parent, summands, simplify=True, convert=True):
+        if convert or summands._key_ is not _element_key:
+            terms = summands.elements()
+            if convert:
+                terms = [_convert_term(parent, term) for term in terms]
+            summands = parent._create_empty_summands_()
+            summands.union_update(terms)
 
-        element = super()._element_constructor_(
-            data, simplify=simplify, convert=convert
-        )
+        super().__init__(parent, summands, simplify=simplify, convert=False)
+
+    def exact_part(self):
+        """Return the expansion consisting of all exact terms of
+        this expansion.
+
+        TESTS::
 
-        element._summands_ = MutablePoset(
-            list(element.summands),
-            key=_element_key,
-            can_merge=can_absorb,
-            merge=absorption,
+            sage: import dependent_bterms as dbt
+            sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+            sage: (k*n + A.B(k^2/n^2, valid_from=10) + 1/n).exact_part()
+            k*n + n^(-1)
+        """
+        parent = self.parent()
+        return _expansion_from_summands(
+            parent, [term for term in self.summands.elements() if term.is_exact()]
         )
-        return element
+
+    def _mul_(self, other):
+        """Multiply this expansion by ``other``, skipping the products of
+        summands which would be absorbed by an O-term of the result.
+
+        The products involving an O-term are formed first. Any other
+        product of two summands is only formed if the product of the
+        upper bounds of their growth ranges (see ``dependent_growth_range``)
+        is not dominated by the growth of one of these O-terms; the
+        coefficients of the skipped products are never computed.
+
+        If neither factor contains an O-term, nothing can be skipped and
+        the expansions are multiplied as usual. Otherwise, all products
+        are absorbed in a different order than by the usual
+        multiplication, so the constants of resulting B-terms may differ
+        (both bounds are valid; see :func:`_truncated_product`).
+
+        TESTS::
+
+            sage: import dependent_bterms as dbt
+            sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+            sage: (1 + k/n + k^2/n^2 + O(n^(-2))) * (1 + k/n + k^2/n^2)
+            1 + 2*k*n^(-1) + 3*k^2*n^(-2) + 2*k^3*n^(-3) + O(n^(-2))
+            sage: (1 + k/n + A.B(k^2/n^2, valid_from=10)) * (1 + k/n)
+            1 + 2*k*n^(-1) + B((1/10*(sqrt(10) + 20)*abs(k)^2)*n^(-2), n >= 10)
+            sage: x = sum(k^j/n^j for j in srange(12)) + O(n^(-4))
+            sage: x * x
+            1 + 2*k*n^(-1) + 3*k^2*n^(-2) + 4*k^3*n^(-3) + 5*k^4*n^(-4)
+            + 6*k^5*n^(-5) + 7*k^6*n^(-6) + 8*k^7*n^(-7) + O(n^(-4))
+            sage: (k/n + O(n^(-3)))^3
+            k^3*n^(-3) + O(n^(-4))
+
+        Products of B-terms without O-terms coincide with the usual
+        multiplication::
+
+            sage: from sage.rings.asymptotic.asymptotic_ring import AsymptoticExpansion
+            sage: x = 1 + k/n + A.B(k^2/n^2, valid_from=10)
+            sage: y = 1 + 2*k/n + A.B(k^3/n^2, valid_from=5)
+            sage: x * y
+            1 + 3*k*n^(-1) + B((abs(1/5*k^3*(sqrt(5) + 6) + 1/5*k^2*(sqrt(10) + 15)))*n^(-2), n >= 10)
+            sage: str(x * y) == str(AsymptoticExpansion._mul_(x, y))
+            True
+
+        With O-terms, the B-terms may be bounded differently::
+
+            sage: (x + O(n^(-3))) * y
+            1 + 3*k*n^(-1) + B(abs(k)^3*n^(-2), n >= 5) + O(n^(-1))
+            sage: AsymptoticExpansion._mul_(x + O(n^(-3)), y)
+            1 + 3*k*n^(-1) + B((1/5*(sqrt(5) + 5)*abs(k)^3)*n^(-2), n >= 5) + O(n^(-1))
+
+        Products in rings without dependent variables are not affected::
+
+            sage: from dependent_bterms.structures import AsymptoticRingWithCustomPosetKey
+            sage: P.<m> = AsymptoticRingWithCustomPosetKey('m^QQ', QQ)
+            sage: (1 + 1/m + O(m^(-2))) * (1 + 1/m)
+            1 + 2*m^(-1) + O(m^(-2))
+        """
+        summands = list(self.summands.elements())
+        other_summands = list(other.summands.elements())
+        if not all(
+            hasattr(term, "dependent_growth_range")
+            for term in summands + other_summands
+        ):
+            return super()._mul_(other)
+        if not any(isinstance(term, OTerm) for term in summands + other_summands):
+            return super()._mul_(other)
+
+        return _truncated_product(self.parent(), summands, other_summands)
+
+    def __reduce__(self):
+        summands = tuple(self.summands.elements())
+        return (_expansion_from_summands, (self.parent(), summands))
+
+
+def _truncated_product(
+    parent, summands, other_summands, error_growths=(), remaining_growth=None
+):
+    """Return the product of two expansions given by their summands,
+    skipping the products of summands which are absorbed by O-terms.
+
+    The products involving an O-term are formed first. Any other
+    product of two summands is skipped if the product of the upper
+    bounds of their growth ranges (multiplied by ``remaining_growth``,
+    if given) is dominated by the growth of one of these O-terms or by
+    one of the given ``error_growths``.
+
+    All products are inserted into a single poset and merged once. This
+    absorbs the products in a different order than the usual
+    multiplication (which adds up the products with one summand after
+    another), so the resulting B-terms may have different, equally
+    valid, constants.
+
+    Internal helper function.
+    """
+    error_products = {
+        (i, j): term * summand
+        for j, term in enumerate(other_summands)
+        for i, summand in enumerate(summands)
+        if isinstance(term, OTerm) or isinstance(summand, OTerm)
+    }
+    error_growths = list(error_growths) + [
+        product.growth for product in error_products.values()
+    ]
+    upper_growths = [summand.dependent_growth_range()[1] for summand in summands]
+    if remaining_growth is not None:
+        upper_growths = [growth * remaining_growth for growth in upper_growths]
+
+    poset = parent._create_empty_summands_()
+    for j, term in enumerate(other_summands):
+        term_upper_growth = term.dependent_growth_range()[1]
+        for i, summand in enumerate(summands):
+            product = error_products.get((i, j))
+            if product is None:
+                upper_growth = term_upper_growth * upper_growths[i]
+                if any(growth >= upper_growth for growth in error_growths):
+                    continue
+                product = term * summand
+            poset.add(product)
+    return parent.element_class(parent, poset, simplify=True, convert=False)
+
+
+def _expansion_from_summands(parent, summands):
+    """Reconstruct an expansion from its (already simplified) summands.
+
+    Internal helper function, used for unpickling.
+    """
+    poset = parent._create_empty_summands_()
+    poset.union_update(summands)
+    return parent.element_class(parent, poset, simplify=False, convert=False)
+
+
+class AsymptoticRingWithCustomPosetKey(AsymptoticRing):
+    """Asymptotic ring that constructs its expansions using a custom
+    poset key.
+    """
+
+    Element = AsymptoticExpansionWithCustomPosetKey
 
     @staticmethod
     def _create_empty_summands_():
         from sage.data_structures.mutable_poset import MutablePoset
-        from sage.rings.asymptotic.term_monoid import can_absorb, absorption
+        from sage.rings.asymptotic.term_monoid import absorption, can_absorb
 
         return MutablePoset(key=_element_key, can_merge=can_absorb, merge=absorption)
 
+    def construction(self):
+        """Return the construction of this ring, keeping its term
+        monoid factory (so that, for example, extending the coefficient
+        ring preserves the dependent variable).
+
+        TESTS::
+
+            sage: import dependent_bterms as dbt
+            sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2,
+            ....:     polynomial_coefficients=True)
+            sage: F, R = A.construction()
+            sage: F(R.fraction_field()).term_monoid_factory is A.term_monoid_factory
+            True
+        """
+        functor, coefficient_ring = super().construction()
+        functor._term_monoid_factory_ = self.term_monoid_factory
+        return functor, coefficient_ring
+
+    def _coerce_map_from_(self, R):
+        """Return whether there is a coercion from ``R`` to this ring.
+
+        Expansions involving a dependent variable only coerce into rings
+        aware of the same dependent variable.
+
+        TESTS::
+
+            sage: import dependent_bterms as dbt
+            sage: from dependent_bterms.structures import AsymptoticRingWithCustomPosetKey
+            sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+            sage: P = AsymptoticRingWithCustomPosetKey('n^QQ', SR)
+            sage: P.has_coerce_map_from(A), A.has_coerce_map_from(P)
+            (False, True)
+            sage: (P.gen() * A.B(k/n, valid_from=10)).parent() is A
+            True
+        """
+        if (
+            isinstance(R, AsymptoticRing)
+            and isinstance(R.term_monoid_factory, DependentTermMonoidFactory)
+            and R.term_monoid_factory is not self.term_monoid_factory
+        ):
+            return False
+        return super()._coerce_map_from_(R)
+
 
 class DependentGrowthAwareMixin:
     """Mixin class for implementing properties related to the
@@ -146,6 +854,31 @@ class DependentGrowthAwareMixin:
             self.dependent_variable_upper_bound,
         )
 
+    @property
+    def coefficient_growth_cache(self):
+        return self._growth_cache
+
+    @property
+    def coefficient_growth_cache_scope(self):
+        return self._growth_cache_scope
+
+    def _set_dependent_variable_data_(
+        self, term_monoid_factory, growth_group, coefficient_ring
+    ):
+        """Take the dependent variable, its bounds and the growth cache
+        from the given :class:`DependentTermMonoidFactory`.
+        """
+        (
+            self._dependent_variable,
+            self._lower_bound,
+            self._upper_bound,
+        ) = term_monoid_factory.variable_bounds(growth_group, coefficient_ring)
+        self._growth_cache = term_monoid_factory.growth_cache
+        self._growth_cache_scope = _growth_cache_scope(
+            growth_group, self._lower_bound, self._upper_bound
+        )
+        self._bterm_floating_point_digits = term_monoid_factory.bterm_round_to
+
 
 class MonBoundOTerm(OTerm):
     """OTerm that is coefficient-growth aware.
@@ -180,20 +913,12 @@ class MonBoundOTerm(OTerm):
         1 + k*n^(-1) + 1/2*k^2*n^(-2) + 1/6*k^3*n^(-3) + O(n^(-2))
     """
 
-    def __init__(self, parent, growth, coefficient):
+    def __init__(self, parent, growth, coefficient=None):
         self._growth = growth
-        if (
-            isinstance(coefficient, Expression)
-            and parent.dependent_variable in coefficient.variables()
-        ):
-            _, lower, upper = parent.variable_bounds
-            bounds = []
-            for value in (lower, upper):
-                eval_arg = {str(parent.dependent_variable): value}
-                bounds.append(evaluate(coefficient, **eval_arg).O())
-
-            [coefficient_bound] = list(sum(bounds).summands)
-            growth *= coefficient_bound.growth
+        if coefficient is not None:
+            coef_growths = _coefficient_growth_range(parent, coefficient)
+            if coef_growths is not None:
+                growth *= max(coef_growths)
 
         super().__init__(parent, growth)
 
@@ -209,34 +934,38 @@ class MonBoundOTerm(OTerm):
         return self.growth >= other.growth
 
 
-def MonBoundOTermMonoidFactory(dependent_variable, lower_bound, upper_bound):
-    _verify_variable_and_bounds(dependent_variable, lower_bound, upper_bound)
-
-    class MonBoundOTermMonoid(OTermMonoid, DependentGrowthAwareMixin):
-        Element = MonBoundOTerm
+class MonBoundOTermMonoid(OTermMonoid, DependentGrowthAwareMixin):
+    Element = MonBoundOTerm
 
-        def __init__(
-            self,
-            term_monoid_factory,
-            growth_group,
-            coefficient_ring,
-            category,
-        ):
-            self._dependent_variable = dependent_variable
-            self._lower_bound = lower_bound
-            self._upper_bound = upper_bound
+    def __init__(
+        self,
+        term_monoid_factory,
+        growth_group,
+        coefficient_ring,
+        category,
+    ):
+        self._set_dependent_variable_data_(
+            term_monoid_factory, growth_group, coefficient_ring
+        )
+        super().__init__(term_monoid_factory, growth_group, coefficient_ring, category)
 
-            super().__init__(
-                term_monoid_factory, growth_group, coefficient_ring, category
-            )
+    def _convert_construction_(self, kwds_construction):
+        try:
+            del kwds_construction["valid_from"]
+        except KeyError:
+            pass
 
-        def _convert_construction_(self, kwds_construction):
-            try:
-                del kwds_construction["valid_from"]
-            except KeyError:
-                pass
 
-    return MonBoundOTermMonoid
+def MonBoundOTermMonoidFactory(
+    dependent_variable, lower_bound, upper_bound, growth_cache=None
+):
+    return _monoid_class_with_fixed_bounds(
+        MonBoundOTermMonoid,
+        dependent_variable,
+        lower_bound,
+        upper_bound,
+        growth_cache=growth_cache,
+    )
 
 
 class MonBoundBTerm(BTerm):
@@ -260,53 +989,59 @@ class MonBoundBTerm(BTerm):
         B((abs(k + 1))*n^(-1), n >= 10)
     """
 
+    @_instrumented("bterm_init")
     def __init__(self, parent, growth, valid_from, **kwds):
         coef = kwds["coefficient"]
+        k = parent.dependent_variable
 
         def round_coef(c):
             prec = parent._bterm_floating_point_digits
             if prec is not None:
-                return SR(ceil(c * 10**prec) / 10**prec)
+                return parent.coefficient_ring(ceil(c * 10**prec) / 10**prec)
             return c
 
-        if (
-            isinstance(coef, Expression)
-            and parent.dependent_variable in coef.variables()
-        ):
-            with assuming(parent.dependent_variable > 0):
-                coef_expanded = coef.simplify().expand()
-                coef_expanded_bound = sum(
-                    round_coef(abs(c)) * parent.dependent_variable**p
-                    for (c, p) in coef_expanded.coefficients(parent.dependent_variable)
-                )
-            kwds["coefficient"] = coef_expanded_bound
+        if _depends_on(coef, k) or _is_dependent_polynomial(coef, k):
+            kwds["coefficient"] = sum(
+                (
+                    round_coef(abs(c)) * k**p
+                    for (c, p) in _coefficient_monomials(coef, k)
+                ),
+                parent.coefficient_ring.zero(),
+            )
         else:
             kwds["coefficient"] = round_coef(coef)
-        super().__init__(parent, growth, valid_from, **kwds)
+
+        if isinstance(kwds["coefficient"], Expression):
+            super().__init__(parent, growth, valid_from, **kwds)
+            self.coefficient = _canonical_expression(self.coefficient)
+            return
+
+        # BTerm passes the coefficient to abs, which polynomial
+        # coefficients do not support; their coefficients are
+        # nonnegative at this point anyway.
+        self._set_data_(parent, growth, kwds["coefficient"], valid_from)
+
+    def _set_data_(self, parent, growth, coefficient, valid_from):
+        """Set the data of this term without modifying the coefficient.
+
+        Internal helper function.
+        """
+        TermWithCoefficient.__init__(self, parent, growth, coefficient)
+        if not isinstance(valid_from, dict):
+            valid_from = dict.fromkeys(parent.growth_group.variable_names(), valid_from)
+        self.valid_from = {
+            str(variable): value for variable, value in valid_from.items()
+        }
 
     def dependent_growth_range(self):
         if hasattr(self, "_cached_growth_range"):
             return self._cached_growth_range
 
-        dependent_variable, lower, upper = self.parent().variable_bounds
-        if not (
-            isinstance(self.coefficient, Expression)
-            and dependent_variable in self.coefficient.variables()
-        ):
+        coef_growths = _coefficient_growth_range(self.parent(), self.coefficient)
+        if coef_growths is None:
             return (self.growth, self.growth)
 
-        boundary_growths = []
-        with assuming(dependent_variable > 0):
-            coef_simplified = self.coefficient.simplify()
-        for value in (lower, upper):
-            eval_arg = {str(dependent_variable): value}
-            term = evaluate(coef_simplified, **eval_arg)
-            if term.is_zero():
-                term = value.parent().one()
-            term = term.O()
-            [term] = list(term.summands)
-            boundary_growths.append(term.growth * self.growth)
-
+        boundary_growths = [growth * self.growth for growth in coef_growths]
         self._cached_growth_range = (min(boundary_growths), max(boundary_growths))
         return self._cached_growth_range
 
@@ -319,6 +1054,7 @@ class MonBoundBTerm(BTerm):
             and (self_growth_upper >= other_growth_upper)
         )
 
+    @_instrumented("absorb")
     def _absorb_(self, other):
         r"""Custom absorption mechanism for B-terms with dependent variables
         in its coefficients.
@@ -334,61 +1070,112 @@ class MonBoundBTerm(BTerm):
             sage: A.B(1/n, valid_from=10) + 1/n^10
             B(101/100*n^(-1), n >= 10)
         """
-        k, lower, upper = self.parent().variable_bounds
-        with assuming(k > 0):
-            self_coef = self.coefficient.simplify().expand()
-            other_coef = other.coefficient.simplify().expand()
+        k, _, upper = self.parent().variable_bounds
+        self_degree = max(
+            (p for _, p in _coefficient_monomials(self.coefficient, k)), default=0
+        )
+        other_monomials = _coefficient_monomials(other.coefficient, k)
+        other_degree = max((p for _, p in other_monomials), default=0)
 
-        if self_coef.degree(k) >= other_coef.degree(k):
-            return super()._absorb_(other)
+        if self_degree >= other_degree:
+            return self._absorb_bterm_(other)
 
         # Degree of other coefficient in k is higher,
         # needs to be reduced first.
 
-        with assuming(k > 0):
-            other_coef_abs = other_coef.parent().zero()
-            if other_coef.operator() is add_vararg:
-                for op in other_coef.operands():
-                    other_coef_abs += abs(op).simplify()
-            else:
-                other_coef_abs = abs(other_coef).simplify()
-
-        other_coef_bound = other_coef_abs(k=1)
-        deg_difference = other_coef.degree(k) - self_coef.degree(k)
+        other_coef_bound = sum(abs(c) for c, _ in other_monomials)
+        if isinstance(other_coef_bound, Expression):
+            other_coef_bound = other_coef_bound.subs({k: 1})
+        deg_difference = other_degree - self_degree
         [difference_term] = list((upper**deg_difference).summands)
 
         other_bound = other.parent()(
             other.growth * difference_term.growth,
-            coefficient=other_coef_bound * k ** self_coef.degree(k),
+            coefficient=other_coef_bound * k**self_degree,
         )
-        return super()._absorb_(other_bound)
+        return self._absorb_bterm_(other_bound)
 
+    def _absorb_bterm_(self, other):
+        """Absorb a B-term whose coefficient degree does not exceed
+        the one of this B-term.
+
+        Symbolic coefficients are handled by :meth:`.BTerm._absorb_`,
+        (Laurent) polynomial coefficients are combined directly.
+        """
+        if isinstance(self.coefficient, Expression):
+            return super()._absorb_(other)
+
+        valid_from = dict(other.valid_from)
+        for variable, value in self.valid_from.items():
+            valid_from[variable] = max(value, valid_from.get(variable, value))
+
+        diff = (self.growth / other.growth)._find_minimum_(valid_from)
+        if diff not in QQ:
+            diff = RIF(diff).lower().exact_rational()
+        return self.parent()(
+            self.growth,
+            coefficient=self.coefficient + other.coefficient / QQ(diff),
+            valid_from=valid_from,
+        )
 
-def MonBoundBTermMonoidFactory(
-    dependent_variable, lower_bound, upper_bound, bterm_round_to
-):
-    _verify_variable_and_bounds(dependent_variable, lower_bound, upper_bound)
 
-    class MonBoundBTermMonoid(BTermMonoid, DependentGrowthAwareMixin):
-        Element = MonBoundBTerm
+class MonBoundBTermMonoid(BTermMonoid, DependentGrowthAwareMixin):
+    Element = MonBoundBTerm
 
-        def __init__(
+    def __init__(
+        self,
+        term_monoid_factory,
+        growth_group,
+        coefficient_ring,
+        category,
+    ):
+        self._set_dependent_variable_data_(
+            term_monoid_factory, growth_group, coefficient_ring
+        )
+        super().__init__(term_monoid_factory, growth_group, coefficient_ring, category)
+
+    def _element_without_simplification_(self, growth, coefficient, valid_from):
+        """Return the B-term with the given growth, coefficient and
+        ``valid_from``, taking the coefficient as it is.
+
+        In contrast to constructing the term via the monoid, the
+        coefficient is neither bounded monomialwise nor rounded.
+
+        Internal helper function.
+
+        TESTS::
+
+            sage: import dependent_bterms as dbt
+            sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2,
+            ....:     bterm_round_to=1)
+            sage: BT = A.term_monoid('B')
+            sage: g = A.growth_group.gen()
+            sage: BT(g^-1, coefficient=k/3 - 1, valid_from=10)
+            B((abs(2/5*k + 1))*n^(-1), n >= 10)
+            sage: BT._element_without_simplification_(g^-1, k/3 - 1, 10)
+            B((1/3*k - 1)*n^(-1), n >= 10)
+        """
+        term = self.element_class.__new__(self.element_class)
+        term._set_data_(
             self,
-            term_monoid_factory,
-            growth_group,
-            coefficient_ring,
-            category,
-        ):
-            self._dependent_variable = dependent_variable
-            self._lower_bound = lower_bound
-            self._upper_bound = upper_bound
-            self._bterm_floating_point_digits = bterm_round_to
+            self.growth_group(growth),
+            self.coefficient_ring(coefficient),
+            valid_from,
+        )
+        return term
 
-            super().__init__(
-                term_monoid_factory, growth_group, coefficient_ring, category
-            )
 
-    return MonBoundBTermMonoid
+def MonBoundBTermMonoidFactory(
+    dependent_variable, lower_bound, upper_bound, bterm_round_to, growth_cache=None
+):
+    return _monoid_class_with_fixed_bounds(
+        MonBoundBTermMonoid,
+        dependent_variable,
+        lower_bound,
+        upper_bound,
+        bterm_round_to=bterm_round_to,
+        growth_cache=growth_cache,
+    )
 
 
 class MonBoundExactTerm(ExactTerm):
@@ -396,45 +1183,176 @@ class MonBoundExactTerm(ExactTerm):
         if hasattr(self, "_cached_growth_range"):
             return self._cached_growth_range
 
-        dependent_variable, lower, upper = self.parent().variable_bounds
-        if dependent_variable not in self.coefficient.variables():
+        coef_growths = _coefficient_growth_range(self.parent(), self.coefficient)
+        if coef_growths is None:
             return (self.growth, self.growth)
 
-        boundary_growths = []
-        with assuming(dependent_variable > 0):
-            coef_simplified = self.coefficient.simplify()
-        for value in (lower, upper):
-            eval_arg = {str(dependent_variable): value}
-            term = evaluate(coef_simplified, **eval_arg)
-            if term.is_zero():
-                term = value.parent().one()
-            term = term.O()
-            [term] = list(term.summands)
-            boundary_growths.append(term.growth * self.growth)
-
+        boundary_growths = [growth * self.growth for growth in coef_growths]
         self._cached_growth_range = (min(boundary_growths), max(boundary_growths))
         return self._cached_growth_range
 
 
-def MonBoundExactTermMonoidFactory(dependent_variable, lower_bound, upper_bound):
-    _verify_variable_and_bounds(dependent_variable, lower_bound, upper_bound)
+class MonBoundExactTermMonoid(ExactTermMonoid, DependentGrowthAwareMixin):
+    Element = MonBoundExactTerm
 
-    class MonBoundExactTermMonoid(ExactTermMonoid, DependentGrowthAwareMixin):
-        Element = MonBoundExactTerm
+    def __init__(
+        self,
+        term_monoid_factory,
+        growth_group,
+        coefficient_ring,
+        category,
+    ):
+        self._set_dependent_variable_data_(
+            term_monoid_factory, growth_group, coefficient_ring
+        )
+        super().__init__(term_monoid_factory, growth_group, coefficient_ring, category)
 
-        def __init__(
-            self,
-            term_monoid_factory,
-            growth_group,
-            coefficient_ring,
-            category,
+
+def MonBoundExactTermMonoidFactory(
+    dependent_variable, lower_bound, upper_bound, growth_cache=None
+):
+    return _monoid_class_with_fixed_bounds(
+        MonBoundExactTermMonoid,
+        dependent_variable,
+        lower_bound,
+        upper_bound,
+        growth_cache=growth_cache,
+    )
+
+
+def _monoid_class_with_fixed_bounds(
+    monoid_class,
+    dependent_variable,
+    lower_bound,
+    upper_bound,
+    bterm_round_to=None,
+    growth_cache=None,
+):
+    """Derive a term monoid class with a fixed dependent variable and
+    fixed bounds, to be used with term monoid factories other than
+    :class:`DependentTermMonoidFactory`.
+
+    In contrast to the monoids provided by :class:`DependentTermMonoidFactory`,
+    monoids constructed from the returned class cannot be pickled.
+
+    Internal helper function.
+    """
+    _verify_variable_and_bounds(dependent_variable, lower_bound, upper_bound)
+    if growth_cache is None:
+        growth_cache = CoefficientGrowthCache()
+
+    class MonoidWithFixedBounds(monoid_class):
+        def _set_dependent_variable_data_(
+            self, term_monoid_factory, growth_group, coefficient_ring
         ):
             self._dependent_variable = dependent_variable
             self._lower_bound = lower_bound
             self._upper_bound = upper_bound
-
-            super().__init__(
-                term_monoid_factory, growth_group, coefficient_ring, category
+            self._growth_cache = growth_cache
+            self._growth_cache_scope = _growth_cache_scope(
+                growth_group, lower_bound, upper_bound
             )
+            self._bterm_floating_point_digits = bterm_round_to
+
+    MonoidWithFixedBounds.__name__ = monoid_class.__name__
+    return MonoidWithFixedBounds
+
+
+class DependentTermMonoidFactory(TermMonoidFactory):
+    """Factory for term monoids that are aware of a monomially bounded
+    dependent variable.
 
-    return MonBoundExactTermMonoid
+    The dependent variable is bounded by ``lower_bound_factor*n^lower_bound_power``
+    and ``upper_bound_factor*n^upper_bound_power``, where ``n`` is the
+    variable of the asymptotic ring. All parameters are plain data, so
+    that identical factories (and thus the asymptotic rings constructed
+    from them) are unique and can be pickled.
+
+    INPUT:
+
+    - ``name`` -- a string, the name of the factory.
+
+    - ``dependent_variable`` -- a symbolic variable or the generator
+      of a (Laurent) polynomial ring.
+
+    - ``lower_bound_power``, ``upper_bound_power``, ``lower_bound_factor``,
+      ``upper_bound_factor`` -- the parameters of the monomial bounds.
+
+    - ``bterm_round_to`` -- a positive integer or ``None`` (the default):
+      the number of floating point digits to which the coefficients
+      of B-terms are rounded.
+
+    - ``growth_cache_size`` -- a positive integer (default: ``4096``),
+      the size of the coefficient growth cache shared by the term monoids.
+
+    - ``default_prec`` -- the default precision of the asymptotic ring
+      in which the bounds are constructed.
+
+    TESTS::
+
+        sage: from dependent_bterms.structures import DependentTermMonoidFactory
+        sage: k = SR.var('k')
+        sage: F = DependentTermMonoidFactory('F', k, 0, 1/2)
+        sage: F is DependentTermMonoidFactory('F', k, 0, 1/2)
+        True
+        sage: loads(dumps(F)) is F
+        True
+        sage: F.ExactTermMonoid
+        <class 'dependent_bterms.structures.MonBoundExactTermMonoid'>
+    """
+
+    def __init__(
+        self,
+        name,
+        dependent_variable,
+        lower_bound_power,
+        upper_bound_power,
+        lower_bound_factor=1,
+        upper_bound_factor=1,
+        bterm_round_to=None,
+        growth_cache_size=4096,
+        default_prec=None,
+    ):
+        _verify_variable_and_bounds(
+            dependent_variable, lower_bound_power, upper_bound_power
+        )
+        super().__init__(
+            name,
+            exact_term_monoid_class=MonBoundExactTermMonoid,
+            O_term_monoid_class=MonBoundOTermMonoid,
+            B_term_monoid_class=MonBoundBTermMonoid,
+        )
+        self.dependent_variable = dependent_variable
+        self.lower_bound_power = lower_bound_power
+        self.upper_bound_power = upper_bound_power
+        self.lower_bound_factor = lower_bound_factor
+        self.upper_bound_factor = upper_bound_factor
+        self.bterm_round_to = bterm_round_to
+        self.default_prec = default_prec
+        self.growth_cache = CoefficientGrowthCache(maxsize=growth_cache_size)
+        self._bounds = {}
+
+    def variable_bounds(self, growth_group, coefficient_ring):
+        """Return the dependent variable together with its lower and
+        upper bound as expansions with the given growth group and
+        coefficient ring.
+        """
+        key = (growth_group, coefficient_ring)
+        if key not in self._bounds:
+            # the bounds do not depend on the dependent variable; polynomial
+            # coefficients cannot be raised to rational powers
+            AR = AsymptoticRingWithCustomPosetKey(
+                growth_group=growth_group,
+                coefficient_ring=(
+                    coefficient_ring
+                    if coefficient_ring is SR
+                    else coefficient_ring.base_ring()
+                ),
+                default_prec=self.default_prec,
+            )
+            n = AR.gen()
+            self._bounds[key] = (
+                AR(self.lower_bound_factor) * n**self.lower_bound_power,
+                AR(self.upper_bound_factor) * n**self.upper_bound_power,
+            )
+        return (self.dependent_variable,) + self._bounds[key]
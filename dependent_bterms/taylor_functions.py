@@ -0,0 +1,255 @@
+"""Closed-form Taylor coefficients and remainder bounds for standard functions.
+
+:func:`.taylor_with_explicit_error` determines Taylor coefficients and
+the bound for the remainder by repeated symbolic differentiation. For
+the functions recognized here, coefficients and the range of the
+derivatives are known in closed form, which keeps expansions of high
+order cheap.
+
+Functions are recognized from their symbolic expression in ``z``:
+
+- ``exp(z)``, ``log(1 + z)``, ``sin(z)``, ``cos(z)``, ``arctan(z)``;
+
+- ``c*(b + d*z)^a`` with constants ``a``, ``b``, ``c``, ``d``, where ``b``
+  is positive or ``a`` is an integer; this covers ``1/(1 - z)``,
+  ``sqrt(1 + z)`` and the like.
+
+TESTS::
+
+    sage: from dependent_bterms.taylor_functions import known_taylor_function
+    sage: known_taylor_function(lambda t: sin(t)*cos(t)) is None
+    True
+
+Coefficients agree with symbolic Taylor polynomials, and the
+enclosures of the derivatives meet the enclosures of their values
+at the endpoints::
+
+    sage: z = SR.var('z')
+    sage: functions = [exp, lambda t: log(1 + t), sin, cos, arctan,
+    ....:              lambda t: 1/(1 - t), lambda t: 3*(2 - t)^(-3/2)]
+    sage: for f in functions:
+    ....:     T = known_taylor_function(f)
+    ....:     polynomial = f(z).taylor(z, 0, 7)
+    ....:     derivatives = [f(z).diff(z, m) / factorial(m) for m in range(8)]
+    ....:     print(
+    ....:         all(T.coefficient(j) == polynomial.coefficient(z, j) for j in range(8))
+    ....:         and all(
+    ....:             T.remainder(m, RIF(0, 1/4)).overlaps(RIF(derivatives[m](z=x)))
+    ....:             for m in range(8) for x in [0, 1/8, 1/4]))
+    True
+    True
+    True
+    True
+    True
+    True
+    True
+
+"""
+
+from __future__ import annotations
+
+import operator
+from typing import Callable, NamedTuple
+
+from sage.arith.misc import binomial, factorial
+from sage.rings.integer_ring import ZZ
+from sage.rings.rational_field import QQ
+from sage.rings.real_mpfi import RIF
+from sage.symbolic.operators import mul_vararg
+from sage.symbolic.ring import SR
+
+
+class TaylorFunction(NamedTuple):
+    """Closed-form Taylor data of a function at `0`.
+
+    - ``coefficient`` -- a callable mapping `j` to the `j`-th Taylor
+      coefficient.
+
+    - ``remainder`` -- a callable mapping an order `m` and a real interval
+      `I` to an enclosure of `f^{(m)}(I)/m!`.
+    """
+
+    coefficient: Callable
+    remainder: Callable
+
+
+def _exp():
+    return TaylorFunction(
+        coefficient=lambda j: 1 / factorial(j),
+        remainder=lambda m, interval: interval.exp() / factorial(m),
+    )
+
+
+def _log_one_plus():
+    def coefficient(j):
+        if j == 0:
+            return ZZ.zero()
+        return (-1) ** (j + 1) / ZZ(j)
+
+    def remainder(m, interval):
+        if m == 0:
+            return (1 + interval).log()
+        return (-1) ** (m + 1) / (m * (1 + interval) ** m)
+
+    return TaylorFunction(coefficient, remainder)
+
+
+def _sin():
+    def coefficient(j):
+        if j % 2 == 0:
+            return ZZ.zero()
+        return (-1) ** ((j - 1) // 2) / factorial(j)
+
+    def remainder(m, interval):
+        derivative = [interval.sin(), interval.cos(), -interval.sin(), -interval.cos()]
+        return derivative[m % 4] / factorial(m)
+
+    return TaylorFunction(coefficient, remainder)
+
+
+def _cos():
+    def coefficient(j):
+        if j % 2 == 1:
+            return ZZ.zero()
+        return (-1) ** (j // 2) / factorial(j)
+
+    def remainder(m, interval):
+        derivative = [interval.cos(), -interval.sin(), -interval.cos(), interval.sin()]
+        return derivative[m % 4] / factorial(m)
+
+    return TaylorFunction(coefficient, remainder)
+
+
+def _arctan():
+    def coefficient(j):
+        if j % 2 == 0:
+            return ZZ.zero()
+        return (-1) ** ((j - 1) // 2) / ZZ(j)
+
+    def remainder(m, interval):
+        if m == 0:
+            return interval.arctan()
+        # arctan^(m)(x) = (m - 1)! cos(t)^m sin(m*(t + pi/2)) with t = arctan(x)
+        angle = interval.arctan()
+        return angle.cos() ** m * (m * (angle + RIF.pi() / 2)).sin() / m
+
+    return TaylorFunction(coefficient, remainder)
+
+
+def _binomial_series(factor, base, slope, exponent):
+    """Taylor data of ``factor*(base + slope*z)^exponent``."""
+    scale = factor * base**exponent
+    ratio = slope / base
+
+    def coefficient(j):
+        return scale * binomial(exponent, j) * ratio**j
+
+    def remainder(m, interval):
+        power = exponent - m
+        power = ZZ(power) if power in ZZ else RIF(power)
+        derivative_factor = RIF(factor * binomial(exponent, m) * slope**m)
+        return derivative_factor * (RIF(base) + RIF(slope) * interval) ** power
+
+    return TaylorFunction(coefficient, remainder)
+
+
+_ELEMENTARY_FUNCTIONS = {
+    "exp": (lambda z: z, _exp),
+    "log": (lambda z: z + 1, _log_one_plus),
+    "sin": (lambda z: z, _sin),
+    "cos": (lambda z: z, _cos),
+    "arctan": (lambda z: z, _arctan),
+}
+
+
+def _is_constant(expression):
+    return not SR(expression).variables()
+
+
+def _recognize_binomial(f_sym, z):
+    """Return ``(factor, base, slope, exponent)`` if ``f_sym`` is of the
+    form ``factor*(base + slope*z)^exponent``, and ``None`` otherwise.
+    """
+    factor = SR.one()
+    power = f_sym
+    if f_sym.operator() in (operator.mul, mul_vararg):
+        constants = [op for op in f_sym.operands() if _is_constant(op)]
+        others = [op for op in f_sym.operands() if not _is_constant(op)]
+        if len(others) != 1:
+            return None
+        factor = SR.one()
+        for constant in constants:
+            factor *= constant
+        [power] = others
+
+    if power.operator() is operator.pow:
+        power_base, exponent = power.operands()
+    else:
+        power_base, exponent = power, SR.one()
+
+    if not _is_constant(exponent) or power_base.variables() != (z,):
+        return None
+    if not power_base.is_polynomial(z) or power_base.degree(z) != 1:
+        return None
+
+    base = power_base.coefficient(z, 0)
+    slope = power_base.coefficient(z, 1)
+    if base.is_zero():
+        return None
+    if exponent not in ZZ and not RIF(base) > 0:
+        return None
+    if exponent in QQ:
+        # binomial coefficients of rationals are much cheaper than symbolic ones
+        exponent = QQ(exponent)
+    return factor, base, slope, exponent
+
+
+def known_taylor_function(f) -> TaylorFunction | None:
+    """Return the closed-form Taylor data of the given function, or
+    ``None`` if the function is not recognized.
+
+    INPUT:
+
+    - ``f`` -- a callable function.
+
+    EXAMPLES::
+
+        sage: from dependent_bterms.taylor_functions import known_taylor_function
+        sage: T = known_taylor_function(lambda t: 1/(1 - t))
+        sage: [T.coefficient(j) for j in range(5)]
+        [1, 1, 1, 1, 1]
+        sage: T.remainder(3, RIF(0, 1/2)).upper()
+        16.0000000000000
+        sage: T = known_taylor_function(lambda t: sqrt(1 + t))
+        sage: [T.coefficient(j) for j in range(4)]
+        [1, 1/2, -1/8, 1/16]
+        sage: T = known_taylor_function(log)
+        sage: T is None
+        True
+        sage: T = known_taylor_function(lambda t: log(1 + t))
+        sage: [T.coefficient(j) for j in range(5)]
+        [0, 1, -1/2, 1/3, -1/4]
+        sage: T = known_taylor_function(arctan)
+        sage: [T.coefficient(j) for j in range(6)]
+        [0, 1, 0, -1/3, 0, 1/5]
+    """
+    z = SR.var("z")
+    try:
+        f_sym = SR(f(z))
+    except (TypeError, ValueError):
+        return None
+
+    op = f_sym.operator()
+    name = getattr(op, "name", None)
+    if callable(name) and name() in _ELEMENTARY_FUNCTIONS:
+        argument, taylor_function = _ELEMENTARY_FUNCTIONS[name()]
+        if f_sym.number_of_operands() == 1 and f_sym.operands()[0].is_trivially_equal(
+            argument(z)
+        ):
+            return taylor_function()
+        return None
+
+    binomial_data = _recognize_binomial(f_sym, z)
+    if binomial_data is not None:
+        return _binomial_series(*binomial_data)
+    return None
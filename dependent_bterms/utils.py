@@ -16,77 +16,288 @@ TESTS::
 
 from __future__ import annotations
 
+import time
 
 from sage.arith.srange import srange
-from sage.ext.fast_callable import fast_callable
 from sage.functions.other import ceil
-from sage.symbolic.assumptions import assuming
-from sage.symbolic.expression import Expression
-from sage.symbolic.operators import add_vararg
+from sage.misc.misc_c import prod
 from sage.rings.asymptotic.asymptotic_ring import AsymptoticExpansion, AsymptoticRing
 from sage.rings.asymptotic.term_monoid import (
     BTerm,
     ExactTerm,
     OTerm,
     TermWithCoefficient,
+    absorption,
+    can_absorb,
 )
-
 from sage.rings.infinity import Infinity as oo
-from sage.symbolic.ring import SR
-from sage.rings.real_mpfi import RIF
 from sage.rings.integer_ring import Z as ZZ
+from sage.rings.real_mpfi import RIF
+from sage.symbolic.expression import Expression
+from sage.symbolic.operators import add_vararg
+from sage.symbolic.ring import SR
 
-import dependent_bterms as dbt
+from .disk_cache import _cached
+from .fast_evaluation import evaluate
+from .structures import (
+    AsymptoticRingWithCustomPosetKey,
+    _coefficient_monomials,
+    _convert_term,
+    _depends_on,
+    _is_dependent_polynomial,
+    _simplify_assuming_positive,
+    _substitute_dependent_variable,
+    _truncated_product,
+)
+from .taylor_functions import known_taylor_function
 
 __all__ = [
-    "evaluate",
-    "simplify_expansion",
+    "expansion_from_terms",
+    "expansion_product",
+    "expansion_upper_bound",
     "round_bterm_coefficients",
     "set_bterm_valid_from",
-    "expansion_upper_bound",
+    "simplify_expansion",
+    "taylor_expansions_with_explicit_error",
     "taylor_with_explicit_error",
+    "taylor_with_explicit_error_for_functions",
 ]
 
 
-def evaluate(expression: Expression, expand=True, **eval_args):
-    """Evaluate a symbolic expression without necessarily
-    returning a result in the symbolic ring.
+def expansion_from_terms(
+    ring: AsymptoticRing,
+    terms,
+    simplify: bool = True,
+    convert: bool = True,
+) -> AsymptoticExpansion:
+    """Construct an asymptotic expansion from the given terms in a
+    single pass.
+
+    All terms are inserted into one poset (ordered with respect to the
+    key used by the ring), which avoids constructing an intermediate
+    expansion for every summand. As when adding up the terms one after
+    another, every new summand is merged with the summands it can absorb
+    or be absorbed by right after its insertion; the other summands are
+    not visited again. (Inserting a summand into the poset still compares
+    it with the summands of lower or higher growth, so the running time
+    remains quadratic in the number of summands, but with a much smaller
+    constant than merging the whole poset after every insertion.)
 
     INPUT:
 
-    - ``expression`` -- a symbolic expression.
+    - ``ring`` -- an asymptotic ring.
+
+    - ``terms`` -- an iterable of asymptotic terms or expansions; the
+      summands of the latter are inserted individually.
 
-    - ``expand`` -- if ``True`` (the default), the expression is
-      expanded before evaluation. Useful to improve performance
-      when the expression is a sum of terms.
+    - ``simplify`` -- if ``True`` (the default), terms that can absorb
+      each other are merged.
 
-    - ``eval_args`` -- the values to be input for the variables
-      in keyword argument form.
+    - ``convert`` -- if ``True`` (the default), the terms are converted
+      to the term monoids of ``ring``.
 
     EXAMPLES::
 
-        sage: from dependent_bterms import evaluate
-        sage: var('a b c')
-        (a, b, c)
-        sage: res = evaluate(a*b*c, a=1, b=2, c=3)
-        sage: res, res.parent()
-        (6, Integer Ring)
-        sage: evaluate(a + b, b=42)
-        a + 42
-
-        sage: A.<n> = AsymptoticRing('n^QQ', SR, default_prec=3)
-        sage: evaluate(a/(b + c), a=n, b=1)
-        (1/(c + 1))*n
-        sage: evaluate(a/(b + c), a=pi, b=-1/n, c=1)
-        pi + pi*n^(-1) + pi*n^(-2) + O(n^(-3))
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: ET = A.term_monoid('exact')
+        sage: g = A.growth_group.gen()
+        sage: dbt.expansion_from_terms(A, [ET(g^2, coefficient=k), ET(g^2, coefficient=1), 1/n])
+        (k + 1)*n^2 + n^(-1)
+        sage: dbt.expansion_from_terms(A, [n^2 + O(n), k*n, A(42)])
+        n^2 + k*n + O(n)
+        sage: dbt.expansion_from_terms(A, [])
+        0
+    """
+    summands = ring._create_empty_summands_()
+    for term in terms:
+        if isinstance(term, AsymptoticExpansion):
+            parts = term.summands.elements()
+        else:
+            parts = (term,)
+        for part in parts:
+            if convert:
+                part = _convert_term(ring, part)
+            summands.add(part)
+            if simplify:
+                _merge_summand(summands, summands.get_key(part))
+
+    return ring.element_class(ring, summands, simplify=False, convert=False)
+
+
+def _merge_summand(summands, key):
+    """Merge the summand with the given key with the summands it can
+    absorb or be absorbed by.
+
+    Like :meth:`MutablePoset.merge`, the neighbors of the summand are
+    searched depth first, not passing summands with which it cannot be
+    merged. The merged summand is inserted again under its (possibly
+    changed) key before searching for the next neighbor.
+
+    Internal helper function.
+    """
+    while summands.contains(key):
+        shell = summands.shell(key)
+
+        def can_merge(other, shell=shell):
+            return can_absorb(shell.element, other.element)
+
+        for reverse in (True, False):
+            neighbors = shell.iter_depth_first(reverse=reverse, condition=can_merge)
+            next(neighbors)
+            other = next(
+                (neighbor for neighbor in neighbors if not neighbor.is_special()),
+                None,
+            )
+            if other is not None:
+                break
+        else:
+            return
+
+        merged = absorption(shell.element, other.element)
+        summands.remove(key)
+        summands.remove(other.key)
+        if merged is None:
+            return
+        key = summands.get_key(merged)
+        summands.add(merged)
+
+
+def expansion_product(factors) -> AsymptoticExpansion:
+    r"""Return the product of the given asymptotic expansions.
+
+    If factors in a ring with a dependent variable contain O-terms,
+    they are multiplied in a balanced tree (instead of from left to
+    right like :func:`prod`), and the intermediate products are
+    truncated: products of summands whose contributions to the final
+    product are absorbed by its error term are not formed at all.
+    Otherwise, the factors are multiplied by :func:`prod`.
+
+    The error term of the product is determined by multiplying the
+    O-terms of every factor with the leading summands of all other
+    factors.
+
+    INPUT:
+
+    - ``factors`` -- a nonempty iterable of asymptotic expansions.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: factors = [1 + k^j/n^j for j in srange(1, 4)] + [1 + O(n^(-2))]
+        sage: dbt.expansion_product(factors)
+        1 + k*n^(-1) + k^2*n^(-2) + 2*k^3*n^(-3) + O(n^(-2))
+        sage: prod(factors)
+        1 + k*n^(-1) + k^2*n^(-2) + 2*k^3*n^(-3) + O(n^(-2))
+
+    ::
+
+        sage: factors = [1 + k^j/n^j for j in srange(1, 21)] + [1 + O(n^(-3))]
+        sage: str(dbt.expansion_product(factors)) == str(prod(factors))
+        True
+
+    TESTS::
 
+        sage: dbt.expansion_product([n, 1 + A.B(k/n, valid_from=10), k])
+        k*n + B(abs(k)^2, n >= 10)
+        sage: dbt.expansion_product([2, n + O(n^0)])
+        2*n + O(1)
+        sage: dbt.expansion_product([k/n + O(n^(-2)), A.zero()])
+        0
+        sage: dbt.expansion_product([])
+        Traceback (most recent call last):
+        ...
+        ValueError: At least one factor has to be given.
     """
-    if expand:
-        expression = expression.expand()
-    expression_vars = expression.variables()
-    function_args = [eval_args.get(str(var), var) for var in expression_vars]
+    from sage.structure.element import get_coercion_model, parent
+
+    factors = list(factors)
+    if not factors:
+        raise ValueError("At least one factor has to be given.")
+    ring = get_coercion_model().common_parent(*(parent(factor) for factor in factors))
+    factors = [ring(factor) for factor in factors]
+    if any(factor.is_zero() for factor in factors):
+        return ring.zero()
+
+    if not (
+        hasattr(ring.term_monoid("O"), "variable_bounds")
+        and len(ring.growth_group.variable_names()) == 1
+        and any(
+            isinstance(summand, OTerm)
+            for factor in factors
+            for summand in factor.summands.elements()
+        )
+    ):
+        return prod(factors)
+
+    # products of the leading terms of all factors before and after
+    # the respective factor
+    leading_terms = [next(factor.summands.maximal_elements()) for factor in factors]
+    one = ring.term_monoid("exact")(ring.growth_group.one(), coefficient=1)
+    leading_before = [one]
+    for leading_term in leading_terms[:-1]:
+        leading_before.append(leading_before[-1] * leading_term)
+    leading_after = [one]
+    for leading_term in reversed(leading_terms[1:]):
+        leading_after.append(leading_term * leading_after[-1])
+    leading_after.reverse()
+
+    error_growths = [
+        (leading_before[i] * summand * leading_after[i]).growth
+        for i, factor in enumerate(factors)
+        for summand in factor.summands.elements()
+        if isinstance(summand, OTerm)
+    ]
+
+    # every node of the product tree is a pair of an intermediate
+    # product and an upper bound for the growths of its summands
+    upper_growths = [
+        max(
+            summand.dependent_growth_range()[1]
+            for summand in factor.summands.elements()
+        )
+        for factor in factors
+    ]
+    total_upper_growth = prod(upper_growths)
+
+    def multiply(left, right):
+        (left, left_growth), (right, right_growth) = left, right
+        growth = left_growth * right_growth
+        product = _truncated_product(
+            ring,
+            list(left.summands.elements()),
+            list(right.summands.elements()),
+            error_growths,
+            total_upper_growth / growth,
+        )
+        return product, growth
+
+    product, _ = _balanced_product(
+        list(zip(factors, upper_growths)),
+        multiply,
+    )
+    OT = ring.term_monoid("O")
+    return expansion_from_terms(
+        ring, [product] + [OT(growth) for growth in error_growths], convert=False
+    )
+
 
-    return fast_callable(expression, vars=expression_vars)(*function_args)
+def _balanced_product(factors, multiply):
+    """Multiply the given factors in a balanced tree, using the
+    function ``multiply`` for multiplying two of them.
+
+    Internal helper function.
+    """
+    while len(factors) > 1:
+        products = [
+            multiply(left, right) for left, right in zip(factors[::2], factors[1::2])
+        ]
+        if len(factors) % 2:
+            products.append(factors[-1])
+        factors = products
+    [product] = factors
+    return product
 
 
 def _distribute_coefficient(
@@ -98,8 +309,16 @@ def _distribute_coefficient(
     extra_args = {} if term_type == "exact" else {"valid_from": summand.valid_from}
     result_summands = []
     k, _, upper = summand.parent().variable_bounds
-    with assuming(k > 0):
-        coef_expanded = summand.coefficient.simplify().expand()
+    if _is_dependent_polynomial(summand.coefficient, k):
+        coef_expanded = summand.coefficient
+        part_coefs = [c * k**p for (p, c) in coef_expanded.dict().items()]
+    else:
+        coef_expanded = _simplify_assuming_positive(summand.coefficient, k).expand()
+        part_coefs = (
+            coef_expanded.operands()
+            if coef_expanded.operator() is add_vararg
+            else [coef_expanded]
+        )
     if term_type == "B" and simplify_bterm_growth:
         rest = ring.create_summand(
             term_type,
@@ -107,19 +326,16 @@ def _distribute_coefficient(
             growth=summand.growth,
             valid_from=summand.valid_from,
         )
-        return [evaluate(coef_expanded, **{str(k): upper}) * rest]
-    if coef_expanded.operator() is add_vararg:
-        for part_coef in coef_expanded.operands():
+        bound = _substitute_dependent_variable(coef_expanded, k, upper)
+        return list((bound * rest).summands)
+    if len(part_coefs) > 1:
+        term_monoid = ring.term_monoid(term_type)
+        for part_coef in part_coefs:
             result_summands.append(
-                ring.create_summand(
-                    term_type,
-                    coefficient=part_coef,
-                    growth=summand.growth,
-                    **extra_args,
-                )
+                term_monoid(summand.growth, coefficient=part_coef, **extra_args)
             )
     else:
-        result_summands.append(ring(summand))
+        result_summands.append(summand)
 
     return result_summands
 
@@ -154,34 +370,53 @@ def simplify_expansion(
         sage: dbt.simplify_expansion(A.B((k + 1)/n, valid_from=10), simplify_bterm_growth=True)
         B(7/5*n^(-1/2), n >= 10)
 
+    TESTS:
+
+    Polynomial coefficients are distributed just like symbolic ones::
+
+        sage: P, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2,
+        ....:     polynomial_coefficients=True)
+        sage: dbt.simplify_expansion((2*k^3 + 5)*n + P.B(n^2, valid_from=1))
+        2*k^3*n + B(6*n^2, n >= 1)
+
+    """
+    return _cached(
+        "simplify_expansion",
+        expr,
+        lambda: _simplify_expansion(expr, simplify_bterm_growth),
+        simplify_bterm_growth=simplify_bterm_growth,
+    )
+
+
+def _simplify_expansion(expr, simplify_bterm_growth):
+    """Simplify the expansion as described in :func:`simplify_expansion`.
+
+    Internal helper function.
     """
     A = expr.parent()
-    new_expr = A.zero()
+    error_terms = []
+    exact_terms = []
     for summand in expr.summands:
         if isinstance(summand, OTerm):
-            new_expr += A(summand)
+            error_terms.append(summand)
         elif isinstance(summand, BTerm):
             k, _, _ = summand.parent().variable_bounds
-            if k in summand.coefficient.variables():
-                distributed_summands = _distribute_coefficient(
-                    summand, A, simplify_bterm_growth=simplify_bterm_growth
+            if _depends_on(summand.coefficient, k):
+                error_terms.extend(
+                    _distribute_coefficient(
+                        summand, A, simplify_bterm_growth=simplify_bterm_growth
+                    )
                 )
-                for part_summand in distributed_summands:
-                    new_expr += part_summand
             else:
-                new_expr += A(summand)
-
-    for summand in expr.summands:
-        if summand.is_exact():
+                error_terms.append(summand)
+        elif summand.is_exact():
             k, _, _ = summand.parent().variable_bounds
-            if k in summand.coefficient.variables():
-                distributed_summands = _distribute_coefficient(summand, A)
-                for part_summand in distributed_summands:
-                    new_expr += part_summand
+            if _depends_on(summand.coefficient, k):
+                exact_terms.extend(_distribute_coefficient(summand, A))
             else:
-                new_expr += A(summand)
+                exact_terms.append(summand)
 
-    return new_expr
+    return expansion_from_terms(A, error_terms + exact_terms)
 
 
 def round_bterm_coefficients(
@@ -212,18 +447,17 @@ def round_bterm_coefficients(
 
     def bterm_map(t):
         if isinstance(t, BTerm):
-            if isinstance(t.coefficient, Expression) and hasattr(
-                t.parent(), "dependent_variable"
-            ):
+            if hasattr(t.parent(), "dependent_variable"):
                 k = t.parent().dependent_variable
-                with assuming(k > 0):
-                    coef_expanded = t.coefficient.simplify().expand()
-                    coef_bound = sum(
+                coef_bound = sum(
+                    (
                         ceil(c * 10**floating_point_digits)
                         / 10**floating_point_digits
                         * k**p
-                        for (c, p) in coef_expanded.coefficients(k)
-                    )
+                        for (c, p) in _coefficient_monomials(t.coefficient, k)
+                    ),
+                    t.parent().coefficient_ring.zero(),
+                )
                 t.coefficient = coef_bound
             else:
                 t.coefficient = (
@@ -237,9 +471,10 @@ def round_bterm_coefficients(
     import copy
 
     P = expansion.parent()
-    expansion_copy = sum(
-        (P(copy.deepcopy(summand), convert=False) for summand in expansion.summands),
-        P.zero(),
+    expansion_copy = expansion_from_terms(
+        P,
+        (copy.deepcopy(summand) for summand in expansion.summands),
+        convert=False,
     )
     expansion_copy.summands.map(bterm_map)
     return expansion_copy
@@ -287,7 +522,7 @@ def set_bterm_valid_from(asy: AsymptoticExpansion, valid_from: dict[str, int] |
     default_value = ZZ.one()
     if valid_from in ZZ:
         default_value = valid_from
-        valid_from = dict()
+        valid_from = {}
     else:
         valid_from = {str(v): bound for (v, bound) in valid_from.items()}
     for term in asy.summands:
@@ -355,32 +590,35 @@ def expansion_upper_bound(
 
     """
     A = asy.parent()
-    bound = A.zero()
+    ETM = A.term_monoid("exact")
+    bound_terms = []
     valid_from = {
         v: valid_from or A.coefficient_ring.one() for v in asy.variable_names()
     }
     for summand in asy.summands:
         if isinstance(summand, TermWithCoefficient):
             coef = summand.coefficient
-            if isinstance(coef, Expression) and hasattr(
-                summand.parent(), "dependent_variable"
+            if hasattr(summand.parent(), "dependent_variable") and (
+                isinstance(coef, Expression)
+                or _is_dependent_polynomial(coef, summand.parent().dependent_variable)
             ):
                 k = summand.parent().dependent_variable
-                with assuming(k > 0):
-                    coef = coef.simplify().expand()
-                    coef = sum(abs(c) * k**p for (c, p) in coef.coefficients(k))
+                coef = sum(
+                    (abs(c) * k**p for (c, p) in _coefficient_monomials(coef, k)),
+                    A.coefficient_ring.zero(),
+                )
             else:
                 coef = abs(coef)
-            bound += A.create_summand(
-                "exact",
-                coefficient=coef,
-                data=summand.growth,
-            )
+            if not coef.is_zero():
+                bound_terms.append(ETM(summand.growth, coefficient=coef))
             if isinstance(summand, BTerm):
                 for v, bd in summand.valid_from.items():
                     valid_from[v] = max(valid_from[v], bd)
         else:
-            raise ValueError(f"No same-order bound can be constructed for {summand}")
+            # expansions with O-terms have the right type but cannot be bounded
+            raise ValueError(f"No same-order bound can be constructed for {summand}")  # noqa: TRY004
+
+    bound = expansion_from_terms(A, bound_terms)
 
     if numeric:
         # check that expansion is bounded, in O(1)
@@ -391,11 +629,16 @@ def expansion_upper_bound(
                 f"{bound} does not seem to be bounded."
             )
 
-        if isinstance(A, dbt.structures.AsymptoticRingWithCustomPosetKey):
-            ETM = A.term_monoid("exact")
+        if isinstance(A, AsymptoticRingWithCustomPosetKey):
             dependent_variable, _, upper = ETM.variable_bounds
+            upper_value = upper.subs(valid_from)
             bound = bound.map_coefficients(
-                lambda t: t.subs({dependent_variable: upper.subs(valid_from)})
+                lambda t: SR(
+                    _substitute_dependent_variable(t, dependent_variable, upper_value)
+                    if _is_dependent_polynomial(t, dependent_variable)
+                    else t.subs({dependent_variable: upper_value})
+                ),
+                new_coefficient_ring=SR,
             )
 
         return bound.subs(valid_from)
@@ -409,12 +652,19 @@ def taylor_with_explicit_error(
     order=None,
     valid_from=None,
     round_constant=True,
+    trace=None,
 ):
     r"""Determines the Taylor series expansion with explicit error bounds
     of a given function `f` at a specified asymptotic term.
 
     The term is assumed to be in o(1).
 
+    For the functions recognized by
+    :func:`~dependent_bterms.taylor_functions.known_taylor_function`
+    (like ``exp``, ``log(1 + t)``, ``sin``, ``cos``, ``arctan`` and
+    ``(1 - t)^a``), closed forms of the coefficients and of the
+    derivatives are used instead of symbolic differentiation.
+
     INPUT:
 
     - ``f`` -- a callable function to be expanded.
@@ -431,6 +681,26 @@ def taylor_with_explicit_error(
       derivative used to construct the error term is rounded to the closest
       integer.
 
+    - ``trace`` -- a callable or ``None`` (the default). If given, it is
+      called as ``trace(phase, elapsed, summands)`` after every phase of
+      the computation, where ``elapsed`` is the wall time of the phase in
+      seconds and ``summands`` the number of summands of the expansion
+      constructed in the phase (or ``None`` if the phase does not
+      construct an expansion). The phases are, in this order:
+
+      - ``'power_chain'`` -- computing the powers of the term,
+      - ``'upper_bound'`` -- determining a numeric upper bound of the term,
+      - ``'differentiation'`` -- differentiating ``f`` symbolically (only
+        for functions without known closed forms),
+      - ``'accumulation'`` -- accumulating the Taylor polynomial,
+      - ``'remainder_bound'`` -- bounding the derivative by interval
+        arithmetic,
+      - ``'error_term'`` -- constructing the B-term and absorbing
+        the Taylor polynomial into it.
+
+      Results taken from the disk cache (see :func:`.enable_disk_cache`)
+      are not traced.
+
     EXAMPLES::
 
         sage: import dependent_bterms as dbt
@@ -444,7 +714,7 @@ def taylor_with_explicit_error(
         1 + 2*n^(-1) + 7*n^(-2) + B(58*n^(-3), n >= 10)
 
         sage: dbt.taylor_with_explicit_error(lambda t: 1/(1 - t), k/n, order=3, valid_from=10)
-        1 + k*n^(-1) + k^2*n^(-2) + B(5*abs(k^3)*n^(-3), n >= 10)
+        1 + k*n^(-1) + k^2*n^(-2) + B(5*abs(k)^3*n^(-3), n >= 10)
 
         sage: asy = dbt.taylor_with_explicit_error(lambda t: exp(t), (1 + k)/n, order=3, valid_from=10)
         sage: asy
@@ -455,10 +725,23 @@ def taylor_with_explicit_error(
         1 + (k + 1)*n^(-1) + 1/2*k^2*n^(-2) + B((9/25*sqrt(10) + 23/10)*n^(-3/2), n >= 10)
 
         sage: dbt.taylor_with_explicit_error(exp, k/(10*n), order=3, valid_from=1000)
-        1 + 1/10*k*n^(-1) + 1/200*k^2*n^(-2) + B(1/1000*abs(k^3)*n^(-3), n >= 1000)
+        1 + 1/10*k*n^(-1) + 1/200*k^2*n^(-2) + B(1/1000*abs(k)^3*n^(-3), n >= 1000)
         sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2, bterm_round_to=1)
         sage: dbt.taylor_with_explicit_error(exp, k/(10*n), order=3, valid_from=1000)
-        1 + 1/10*k*n^(-1) + 1/200*k^2*n^(-2) + B(1/10*abs(k^3)*n^(-3), n >= 1000)
+        1 + 1/10*k*n^(-1) + 1/200*k^2*n^(-2) + B(1/10*abs(k)^3*n^(-3), n >= 1000)
+
+    The wall time and the size of the intermediate expansions of the
+    phases of the computation can be traced::
+
+        sage: phases = []
+        sage: def trace(phase, elapsed, summands):
+        ....:     phases.append((phase, summands))
+        sage: dbt.taylor_with_explicit_error(lambda t: sin(t)*cos(t), 1/n + 1/n^2,
+        ....:     order=3, valid_from=10, trace=trace)
+        n^(-1) + n^(-2) + B(...*n^(-3), n >= 10)
+        sage: phases
+        [('power_chain', 4), ('upper_bound', None), ('differentiation', None),
+         ('accumulation', 2), ('remainder_bound', None), ('error_term', 3)]
 
     TESTS:
 
@@ -480,25 +763,197 @@ def taylor_with_explicit_error(
     if order is None:
         order = AR.default_prec
 
-    zero = AR.coefficient_ring.zero()
-    taylor_expansion = AR.zero()
-    term_power = AR.one()
-    sym = SR.var("z")
-    f_sym = f(sym)
+    def compute():
+        start = time.perf_counter()
+        term_powers = _term_powers(term, order)
+        _trace_phase(trace, "power_chain", start, term_powers[-1])
 
-    for j in srange(order):
-        taylor_expansion += f_sym(z=zero) * term_power
+        start = time.perf_counter()
+        term_bound = expansion_upper_bound(term, valid_from=valid_from, numeric=True)
+        _trace_phase(trace, "upper_bound", start)
 
-        f_sym = f_sym.diff(sym, 1) / (j + 1)
-        term_power *= term
+        return _taylor_from_term_powers(
+            f, term_powers, term_bound, valid_from, round_constant, trace=trace
+        )
+
+    return _cached(
+        "taylor_with_explicit_error",
+        term,
+        compute,
+        function=f,
+        order=order,
+        valid_from=valid_from,
+        round_constant=round_constant,
+    )
 
+
+def taylor_with_explicit_error_for_functions(
+    functions,
+    term: AsymptoticExpansion,
+    order=None,
+    valid_from=None,
+    round_constant=True,
+):
+    r"""Determines the Taylor series expansions with explicit error bounds
+    of several functions at the same asymptotic term.
+
+    The powers of the term and the numeric bound of the term are
+    only computed once and shared by all functions.
+
+    INPUT:
+
+    - ``functions`` -- an iterable of callable functions to be expanded.
+
+    - ``term``, ``order``, ``valid_from``, ``round_constant`` -- as in
+      :func:`taylor_with_explicit_error`.
+
+    OUTPUT:
+
+    A list of expansions, in the order of the given functions.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: functions = [exp, lambda t: 1/(1 - t)]
+        sage: for asy in dbt.taylor_with_explicit_error_for_functions(
+        ....:         functions, k/n, order=3, valid_from=10):
+        ....:     print(asy)
+        1 + k*n^(-1) + 1/2*k^2*n^(-2) + B(abs(k)^3*n^(-3), n >= 10)
+        1 + k*n^(-1) + k^2*n^(-2) + B(5*abs(k)^3*n^(-3), n >= 10)
+    """
+    if not term.is_little_o_of_one():
+        raise ValueError("The asymptotic term needs to tend to 0.")
+
+    AR = term.parent()
+
+    if valid_from is not None:
+        set_bterm_valid_from(term, valid_from=valid_from)
+
+    if order is None:
+        order = AR.default_prec
+
+    term_powers = _term_powers(term, order)
     term_bound = expansion_upper_bound(term, valid_from=valid_from, numeric=True)
-    bound_const = abs(evaluate(f_sym, expand=False, z=RIF([0, term_bound]))).upper()
+    return [
+        _taylor_from_term_powers(f, term_powers, term_bound, valid_from, round_constant)
+        for f in functions
+    ]
+
+
+def _term_powers(term, order):
+    """Return the list of powers of the term with exponents
+    from ``0`` up to (and including) ``order``.
+
+    Internal helper function.
+    """
+    term_powers = [term.parent().one()]
+    for _ in srange(order):
+        term_powers.append(term_powers[-1] * term)
+    return term_powers
+
+
+def _trace_phase(trace, phase, start, expansion=None):
+    """Pass the wall time since ``start`` and the number of summands
+    of ``expansion`` (if given) of the phase ``phase`` to ``trace``,
+    see :func:`taylor_with_explicit_error`.
+
+    Internal helper function.
+    """
+    if trace is not None:
+        summands = None if expansion is None else len(expansion.summands)
+        trace(phase, time.perf_counter() - start, summands)
+
+
+def _taylor_from_term_powers(
+    f, term_powers, term_bound, valid_from, round_constant, trace=None
+):
+    """Construct the Taylor expansion with explicit error bound of `f`
+    from precomputed powers of the expansion term.
+
+    Internal helper function.
+    """
+    AR = term_powers[0].parent()
+    order = len(term_powers) - 1
+
+    taylor_expansion = AR.zero()
+    known = known_taylor_function(f)
+    if known is not None:
+        start = time.perf_counter()
+        for j in srange(order):
+            coefficient = AR.coefficient_ring(known.coefficient(j))
+            taylor_expansion += coefficient * term_powers[j]
+        _trace_phase(trace, "accumulation", start, taylor_expansion)
+        f_sym = None
+    else:
+        zero = SR.zero()
+        sym = SR.var("z")
+        differentiation_time = accumulation_time = 0.0
+
+        start = time.perf_counter()
+        f_sym = f(sym)
+        for j in srange(order):
+            middle = time.perf_counter()
+            taylor_expansion += AR.coefficient_ring(f_sym(z=zero)) * term_powers[j]
+            end = time.perf_counter()
+            f_sym = f_sym.diff(sym, 1) / (j + 1)
+            differentiation_time += middle - start
+            accumulation_time += end - middle
+            start = end
+        differentiation_time += time.perf_counter() - start
+
+        if trace is not None:
+            trace("differentiation", differentiation_time, None)
+            trace("accumulation", accumulation_time, len(taylor_expansion.summands))
+
+    start = time.perf_counter()
+    bound_const = _remainder_bound(f_sym, known, order, term_bound)
+    _trace_phase(trace, "remainder_bound", start)
+
+    start = time.perf_counter()
+    result = taylor_expansion + _taylor_error_term(
+        bound_const, term_powers[order], valid_from, round_constant
+    )
+    _trace_phase(trace, "error_term", start, result)
+    return result
+
+
+def _remainder_bound(f_derivative, known, order, term_bound):
+    """Return an upper bound for the absolute value of the derivative of
+    order ``order`` (divided by its factorial) on ``[0, term_bound]``.
+
+    Either ``f_derivative``, the symbolic derivative in ``z``, or
+    ``known``, the closed-form data of the function, has to be given.
+
+    Internal helper function.
+    """
+    interval = RIF([0, term_bound])
+    if known is not None:
+        enclosure = known.remainder(order, interval)
+        description = f"the derivative of order {order}"
+    else:
+        enclosure = evaluate(f_derivative, expand=False, z=interval)
+        description = f"the derivative {f_derivative}"
+    bound_const = abs(enclosure).upper()
 
     if not bound_const < oo:
         raise ValueError(
-            f"Could not find a finite bound for the derivative {f_sym} on the interval [0, {term_bound}]."
+            f"Could not find a finite bound for {description} on the interval [0, {term_bound}]."
         )
+    return bound_const
+
+
+def _taylor_error_term(bound_const, term_power, valid_from, round_constant):
+    """Construct the B-term bounding the remainder of a Taylor expansion.
+
+    ``bound_const`` is the bound for the derivative of the function
+    (divided by the factorial of the order) as determined by
+    :func:`_remainder_bound`, ``term_power`` the power of the expansion
+    term corresponding to the order.
+
+    Internal helper function.
+    """
+    AR = term_power.parent()
 
     if round_constant:
         bound_const = ceil(bound_const)
@@ -513,5 +968,85 @@ def taylor_with_explicit_error(
                     for v, bd in valid_from.items()
                 }
 
-    taylor_bound = AR.B(taylor_bound, valid_from=valid_from)
-    return taylor_expansion + taylor_bound
+    return AR.B(taylor_bound, valid_from=valid_from)
+
+
+def taylor_expansions_with_explicit_error(
+    f,
+    term: AsymptoticExpansion,
+    valid_from=None,
+    round_constant=True,
+    max_order=None,
+):
+    r"""Yield the Taylor series expansions with explicit error bounds
+    of a given function `f` at a specified asymptotic term for the
+    orders `1, 2, 3, \ldots`.
+
+    Every step extends the Taylor polynomial, the power of the term
+    and the derivative of the previous step, so that computing all
+    expansions up to some order is as expensive as computing the one
+    of the highest order via :func:`taylor_with_explicit_error`.
+
+    INPUT:
+
+    - ``f``, ``term``, ``valid_from``, ``round_constant`` -- as in
+      :func:`taylor_with_explicit_error`.
+
+    - ``max_order`` -- the order of the last expansion, or ``None``
+      (the default) to continue indefinitely.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: expansions = dbt.taylor_expansions_with_explicit_error(
+        ....:     lambda t: 1/(1 - t), k/n, valid_from=10, max_order=3)
+        sage: list(expansions)[-1]
+        1 + k*n^(-1) + k^2*n^(-2) + B(5*abs(k)^3*n^(-3), n >= 10)
+
+    TESTS::
+
+        sage: expansions = dbt.taylor_expansions_with_explicit_error(exp, (1 + k)/n, valid_from=10)
+        sage: all(
+        ....:     str(next(expansions))
+        ....:     == str(dbt.taylor_with_explicit_error(exp, (1 + k)/n, order=order, valid_from=10))
+        ....:     for order in srange(1, 6))
+        True
+    """
+    if not term.is_little_o_of_one():
+        raise ValueError("The asymptotic term needs to tend to 0.")
+
+    AR = term.parent()
+
+    if valid_from is not None:
+        set_bterm_valid_from(term, valid_from=valid_from)
+
+    term_bound = expansion_upper_bound(term, valid_from=valid_from, numeric=True)
+
+    zero = SR.zero()
+    taylor_expansion = AR.zero()
+    term_power = AR.one()
+    known = known_taylor_function(f)
+    if known is None:
+        sym = SR.var("z")
+        f_sym = f(sym)
+
+    order = ZZ.zero()
+    while max_order is None or order < max_order:
+        if known is not None:
+            coefficient = known.coefficient(order)
+        else:
+            coefficient = f_sym(z=zero)
+            f_sym = f_sym.diff(sym, 1) / (order + 1)
+        taylor_expansion += AR.coefficient_ring(coefficient) * term_power
+
+        term_power *= term
+        order += 1
+
+        if known is not None:
+            bound_const = _remainder_bound(None, known, order, term_bound)
+        else:
+            bound_const = _remainder_bound(f_sym, None, order, term_bound)
+        yield taylor_expansion + _taylor_error_term(
+            bound_const, term_power, valid_from, round_constant
+        )
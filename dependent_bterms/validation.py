@@ -0,0 +1,302 @@
+"""Numerical validation of explicit error bounds.
+
+The functions in this module check B-terms against the values of the
+functions they are supposed to bound, on a grid of sample points.
+All involved expressions are translated to NumPy once and evaluated
+on the whole grid in a single pass, so that many expansions can be
+checked quickly. Alternatively, the expressions are evaluated with
+mpmath at a given precision, which is slower but also detects
+violations hidden by the rounding errors of floating point arithmetic.
+Such checks cannot prove a bound, but they reliably detect wrong ones.
+
+TESTS::
+
+    sage: import dependent_bterms as dbt
+    sage: AR, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+    sage: AR.B(k*n)
+    doctest:warning
+    ...
+    FutureWarning: ...
+    ...
+    B(abs(k)*n, n >= 0)
+
+"""
+
+from __future__ import annotations
+
+import mpmath
+import numpy as np
+from sage.rings.asymptotic.asymptotic_ring import AsymptoticExpansion
+from sage.symbolic.ring import SR
+
+from .evaluation import (
+    _exact_and_error_parts,
+    _lowest_valid_point,
+    _numpy_function,
+    _python_source,
+    _symbolic_expression,
+)
+
+__all__ = [
+    "validate_taylor_bound",
+]
+
+
+_MPMATH_FUNCTIONS = {
+    "exp": "mpmath.exp",
+    "log": "mpmath.log",
+    "sqrt": "mpmath.sqrt",
+    "sin": "mpmath.sin",
+    "cos": "mpmath.cos",
+    "tan": "mpmath.tan",
+    "arcsin": "mpmath.asin",
+    "arccos": "mpmath.acos",
+    "arctan": "mpmath.atan",
+    "sinh": "mpmath.sinh",
+    "cosh": "mpmath.cosh",
+    "tanh": "mpmath.tanh",
+    "abs": "mpmath.fabs",
+}
+
+
+def _mpmath_function(expression, variables, precision):
+    """Return a function evaluating the given symbolic expression with
+    mpmath elementwise on NumPy arrays (of dtype ``object``), the
+    arguments are the values of the given variables.
+
+    Constants are rounded to ``precision`` bits; the function has to be
+    called within :func:`mpmath.workprec` with the same precision.
+
+    Internal helper function.
+
+    TESTS::
+
+        sage: import mpmath, numpy as np
+        sage: from dependent_bterms.validation import _mpmath_function
+        sage: z = SR.var('z')
+        sage: F = _mpmath_function(exp(z) - 1 - z, [z], 200)
+        sage: with mpmath.workprec(200r):
+        ....:     value = F(np.array([mpmath.mpf('1e-20')], dtype=object))[0]
+        ....:     print(mpmath.nstr(value, 15r))
+        5.0e-41
+    """
+    names = {str(variable): f"x{index}" for index, variable in enumerate(variables)}
+    source = _python_source(
+        expression,
+        names,
+        constant=lambda constant: f"mpmath.mpf({str(constant.n(precision))!r})",
+        functions=_MPMATH_FUNCTIONS,
+    )
+    function = eval(f"lambda {', '.join(names.values())}: {source}", {"mpmath": mpmath})
+    return np.frompyfunc(function, len(names), 1)
+
+
+def validate_taylor_bound(
+    f,
+    term: AsymptoticExpansion,
+    expansion: AsymptoticExpansion,
+    n_values=None,
+    dependent_samples: int = 9,
+    tolerance: float = 1e-12,
+    precision: int | None = None,
+):
+    r"""Check numerically that the given expansion (like the result of
+    :func:`.taylor_with_explicit_error`) bounds ``f(term)``.
+
+    At every sample point, ``f`` is evaluated at the exact part of
+    ``term`` as well as at the exact part plus and minus the bound of
+    the B-terms of ``term``. The deviation of these values from the exact
+    part of ``expansion`` has to be bounded by the B-terms of ``expansion``.
+
+    INPUT:
+
+    - ``f`` -- a callable function that can be applied to a symbolic
+      variable; the resulting expression is evaluated with NumPy.
+
+    - ``term`` -- the asymptotic expansion at which ``f`` is expanded.
+
+    - ``expansion`` -- an asymptotic expansion without O-terms.
+
+    - ``n_values`` -- an array of values of the variable of the asymptotic
+      ring. By default, 64 logarithmically spaced values between the point
+      from which all B-terms are valid and `10^4` times this point are used.
+
+    - ``dependent_samples`` -- the number of equidistant values of the
+      dependent variable between its lower and upper bound (default: ``9``)
+      that are sampled for every value of ``n``.
+
+    - ``tolerance`` -- a float (default: ``1e-12``), deviations up to this
+      multiple of the absolute values involved are attributed to rounding
+      errors of floating point arithmetic.
+
+    - ``precision`` -- a positive integer or ``None`` (the default). If
+      given, all values are computed with mpmath using this many bits
+      instead of with NumPy's floating point numbers; then ``tolerance``
+      should be chosen accordingly smaller.
+
+    OUTPUT:
+
+    A list of dictionaries describing the sample points at which the bound
+    is violated, with keys ``'n'``, ``'k'`` (the values of the variables),
+    ``'term'`` (the value of the term), ``'error'`` (the deviation from the
+    exact part) and ``'bound'``. The list is empty if no violations are found.
+
+    EXAMPLES::
+
+        sage: import dependent_bterms as dbt
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)
+        sage: asy = dbt.taylor_with_explicit_error(exp, k/n, order=3, valid_from=10)
+        sage: dbt.validate_taylor_bound(exp, k/n, asy)
+        []
+        sage: wrong = 1 + k/n + A.B(k^2/(100*n^2), valid_from=10)
+        sage: violations = dbt.validate_taylor_bound(exp, k/n, wrong)
+        sage: len(violations) > 0, sorted(violations[0])
+        (True, ['bound', 'error', 'k', 'n', 'term'])
+
+    ::
+
+        sage: term = 2/n + A.B(1/n^2, valid_from=10)
+        sage: asy = dbt.taylor_with_explicit_error(lambda t: 1/(1 - t), term, order=3)
+        sage: dbt.validate_taylor_bound(lambda t: 1/(1 - t), term, asy, n_values=srange(10, 1000))
+        []
+
+    Errors below the resolution of floating point numbers are only
+    detected when computing with higher precision::
+
+        sage: asy = dbt.taylor_with_explicit_error(exp, k/n, order=3, valid_from=10)
+        sage: wrong = asy.exact_part() + A.B(k^3/(100*n^3), valid_from=10)
+        sage: n_values = [10^12, 10^13]
+        sage: dbt.validate_taylor_bound(exp, k/n, wrong, n_values=n_values)
+        []
+        sage: violations = dbt.validate_taylor_bound(exp, k/n, wrong, n_values=n_values,
+        ....:     tolerance=1e-50, precision=200)
+        sage: len(violations) > 0
+        True
+        sage: dbt.validate_taylor_bound(exp, k/n, asy, n_values=n_values,
+        ....:     tolerance=1e-50, precision=200)
+        []
+
+    TESTS::
+
+        sage: dbt.validate_taylor_bound(exp, k/n, 1 + O(1/n))
+        Traceback (most recent call last):
+        ...
+        ValueError: Cannot bound 1 + O(n^(-1)) explicitly, it contains O-terms.
+        sage: dbt.validate_taylor_bound(exp, k/n, asy, n_values=[1, 10])
+        Traceback (most recent call last):
+        ...
+        ValueError: The bound is only valid for n >= 10.
+    """
+    A = expansion.parent()
+    (variable,) = A.variable_names()
+    lowest_n = max(
+        _lowest_valid_point(expansion, variable, None),
+        _lowest_valid_point(term, variable, None),
+    )
+    if n_values is None:
+        n_values = np.geomspace(float(lowest_n), 10**4 * float(lowest_n), 64)
+    if np.any(np.asarray(n_values, dtype=float) < float(lowest_n)):
+        raise ValueError(f"The bound is only valid for {variable} >= {lowest_n}.")
+    if precision is None:
+        with np.errstate(all="ignore"):
+            return _validate_on_grid(
+                f,
+                term,
+                expansion,
+                np.asarray(n_values, dtype=float),
+                dependent_samples,
+                tolerance,
+                _numpy_function,
+                float,
+            )
+
+    with mpmath.workprec(precision):
+        return _validate_on_grid(
+            f,
+            term,
+            expansion,
+            np.array([mpmath.mpf(str(value)) for value in n_values], dtype=object),
+            dependent_samples,
+            tolerance,
+            lambda expression, variables: _mpmath_function(
+                expression, variables, precision
+            ),
+            mpmath.mpf,
+        )
+
+
+def _validate_on_grid(
+    f, term, expansion, n_values, dependent_samples, tolerance, compile, number
+):
+    """Evaluate the bounds as described in :func:`validate_taylor_bound`,
+    where ``compile`` turns a symbolic expression and a list of variables
+    into a function on NumPy arrays of numbers of type ``number`` (either
+    ``float`` or :class:`mpmath.mpf`).
+
+    Internal helper function.
+    """
+    dtype = float if number is float else object
+    A = expansion.parent()
+    (variable,) = A.variable_names()
+    n = SR.var(variable)
+    ETM = A.term_monoid("exact")
+    if hasattr(ETM, "variable_bounds"):
+        dependent_variable, lower, upper = ETM.variable_bounds
+        k = SR.var(str(dependent_variable))
+        arguments = [n, k]
+        lower_values, upper_values = (
+            np.broadcast_to(
+                compile(_symbolic_expression(bound, n, None, None), [n])(n_values),
+                n_values.shape,
+            )
+            for bound in (lower, upper)
+        )
+        fractions = np.array(
+            [
+                number(index) / max(dependent_samples - 1, 1)
+                for index in range(dependent_samples)
+            ],
+            dtype=dtype,
+        )
+        n_grid = np.repeat(n_values, dependent_samples)
+        k_grid = (
+            lower_values.reshape(-1, 1)
+            + (upper_values - lower_values).reshape(-1, 1) * fractions
+        ).ravel()
+        grid = [n_grid, k_grid]
+    else:
+        dependent_variable, k = None, None
+        arguments = [n]
+        n_grid = n_values
+        k_grid = np.full(n_values.shape, np.nan)
+        grid = [n_grid]
+
+    def evaluate_on_grid(part):
+        expression = _symbolic_expression(part, n, dependent_variable, k)
+        values = compile(expression, arguments)(*grid)
+        return np.broadcast_to(np.asarray(values, dtype=dtype), n_grid.shape)
+
+    term_exact, term_error = map(evaluate_on_grid, _exact_and_error_parts(term))
+    exact, bound = map(evaluate_on_grid, _exact_and_error_parts(expansion))
+
+    z = SR.var("z")
+    f_compiled = compile(SR(f(z)), [z])
+
+    violations = []
+    for sign in (-1, 0, 1):
+        term_values = term_exact + sign * term_error
+        values = np.broadcast_to(f_compiled(term_values), n_grid.shape)
+        error = np.abs(values - exact)
+        allowed = bound + tolerance * (np.abs(values) + np.abs(exact))
+        valid = np.asarray(error <= allowed, dtype=bool)
+        for index in np.flatnonzero(~valid):
+            violations.append(
+                {
+                    "n": float(n_grid[index]),
+                    "k": float(k_grid[index]),
+                    "term": float(term_values[index]),
+                    "error": float(error[index]),
+                    "bound": float(bound[index]),
+                }
+            )
+    return violations